@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+One-pass precomputation of all Task Challenge queues.
+
+TaskChallengeView.tasksToReview re-filters remindersManager.tasks on every
+body evaluation (four times per render: isEmpty, count, subscript and the
+"Task n of m" label). This builds the Clarity, Delegation, SMART and
+Relevance queues in a single scan of a task snapshot, then keeps them up
+to date from task deltas instead of refiltering.
+
+Rules are pluggable: a rule is a name, a `matches(task, now)` predicate
+and, for time-based rules, `due_at(task)`, the moment a task that does
+not match yet will start matching. Every rule is evaluated in the same
+scan, and time-based membership is advanced from a heap, so adding a
+challenge type never adds another full pass.
+
+Usage:
+    python3 challenge_queues.py reminders.jsonl
+    python3 challenge_queues.py --benchmark [--sizes 10000,100000,1000000]
+"""
+import argparse
+import heapq
+import random
+import sys
+import time
+from bisect import bisect_left
+from dataclasses import replace
+
+from reminders_model import load_tasks, read_snapshot, start_of_day, synthetic_reminder
+
+DAY = 86400
+
+
+class ChallengeRule:
+    """Base class for a challenge queue"""
+    name = None
+
+    def matches(self, task, now):
+        raise NotImplementedError
+
+    def due_at(self, task):
+        """When a task that does not match yet starts matching (None = never by itself)"""
+        return None
+
+
+class ClarityRule(ChallengeRule):
+    name = 'Clarity'
+
+    def matches(self, task, now):
+        title = task.title.lower()
+        return len(task.title) < 10 or 'thing' in title or 'stuff' in title
+
+
+class DelegationRule(ChallengeRule):
+    name = 'Delegation'
+
+    def matches(self, task, now):
+        return task.quadrant != 'Delegate'
+
+
+class SmartRule(ChallengeRule):
+    name = 'SMART Goals'
+
+    def matches(self, task, now):
+        return not task.is_completed
+
+
+class RelevanceRule(ChallengeRule):
+    """getOldTasks(daysOld:): incomplete and untouched for `days_old` days"""
+    name = 'Relevance'
+
+    def __init__(self, days_old=7):
+        self.days_old = days_old
+
+    def matches(self, task, now):
+        return not task.is_completed and task.last_modified < now - self.days_old * DAY
+
+    def due_at(self, task):
+        if task.is_completed:
+            return None
+        return task.last_modified + self.days_old * DAY
+
+
+def default_rules():
+    """The four ChallengeType cases, in the order of the picker"""
+    return [ClarityRule(), DelegationRule(), SmartRule(), RelevanceRule(7)]
+
+
+class Queue:
+    """One challenge queue, kept in task-list order
+
+    Tasks are stored by their position in the source task list, so the
+    queue indexes the same way tasksToReview does with currentTaskIndex.
+    Reads (len, subscript, iteration) never rebuild anything.
+    """
+
+    def __init__(self):
+        self.positions = []
+        self.tasks = []
+
+    def add(self, position, task):
+        index = bisect_left(self.positions, position)
+        if index < len(self.positions) and self.positions[index] == position:
+            self.tasks[index] = task
+            return
+        self.positions.insert(index, position)
+        self.tasks.insert(index, task)
+
+    def discard(self, position):
+        index = bisect_left(self.positions, position)
+        if index < len(self.positions) and self.positions[index] == position:
+            del self.positions[index]
+            del self.tasks[index]
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __getitem__(self, index):
+        return self.tasks[index]
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+
+class ChallengeQueues:
+    """All challenge queues over one task list"""
+
+    def __init__(self, rules=None):
+        self.rules = default_rules() if rules is None else list(rules)
+        self.queues = {rule.name: Queue() for rule in self.rules}
+        self.tasks = {}
+        self.positions = {}  # task id -> index in the source task list
+        self.next_position = 0
+        self.pending = []    # (due_at, sequence, rule index, task id, version)
+        self.versions = {}
+        self.sequence = 0
+        self.now = None
+
+    def build(self, tasks, now=None):
+        """Fill every queue in a single scan"""
+        self.now = time.time() if now is None else now
+        self.queues = {rule.name: Queue() for rule in self.rules}
+        self.tasks = {}
+        self.positions = {}
+        self.next_position = 0
+        self.pending = []
+        self.versions = {}
+        for task in tasks:
+            self._insert(task)
+        return self
+
+    def _insert(self, task):
+        # An updated task keeps its place; a new one goes to the end of the list
+        position = self.positions.get(task.id)
+        if position is None:
+            position = self.positions[task.id] = self.next_position
+            self.next_position += 1
+        self.tasks[task.id] = task
+        version = self.versions.get(task.id, 0) + 1
+        self.versions[task.id] = version
+        for index, rule in enumerate(self.rules):
+            if rule.matches(task, self.now):
+                self.queues[rule.name].add(position, task)
+                continue
+            due = rule.due_at(task)
+            if due is not None:
+                self.sequence += 1
+                heapq.heappush(self.pending, (due, self.sequence, index, task.id, version))
+
+    def _remove(self, task_id, keep_position=False):
+        if self.tasks.pop(task_id, None) is None:
+            return
+        self.versions[task_id] = self.versions.get(task_id, 0) + 1
+        position = self.positions[task_id] if keep_position else self.positions.pop(task_id)
+        for queue in self.queues.values():
+            queue.discard(position)
+
+    def apply(self, upserts=(), deletes=(), now=None):
+        """Apply a delta: changed or new TaskItems, and ids of removed tasks"""
+        if now is not None:
+            self.advance(now)
+        for task_id in deletes:
+            self._remove(task_id)
+        for task in upserts:
+            self._remove(task.id, keep_position=True)
+            self._insert(task)
+
+    def apply_changeset(self, changes, tasks, now=None):
+        """Apply a reminders_diff.Changeset; `tasks` maps id -> current TaskItem"""
+        upserts = [tasks[rid] for rid in changes.inserted + changes.updated]
+        self.apply(upserts, changes.deleted, now)
+
+    def advance(self, now):
+        """Move the clock forward, admitting tasks whose time-based rules became true"""
+        self.now = now
+        while self.pending and self.pending[0][0] < now:
+            _, _, index, task_id, version = heapq.heappop(self.pending)
+            if self.versions.get(task_id) != version or task_id not in self.tasks:
+                continue
+            rule = self.rules[index]
+            task = self.tasks[task_id]
+            if rule.matches(task, now):
+                self.queues[rule.name].add(self.positions[task_id], task)
+
+    def queue(self, name):
+        """The live Queue for a rule, in task-list order (no copy is made)"""
+        return self.queues[name]
+
+    def counts(self):
+        return {name: len(queue) for name, queue in self.queues.items()}
+
+
+def refilter(tasks, rule, now):
+    """What tasksToReview does on each access"""
+    return [t for t in tasks if rule.matches(t, now)]
+
+
+def _synthetic_tasks(count, now, seed=0):
+    rng = random.Random(seed)
+    reminders = (synthetic_reminder(rng, f"R{i:08d}", now) for i in range(count))
+    return load_tasks(reminders, now)
+
+
+def _render(queue, index=0):
+    """The four tasksToReview reads of one TaskChallengeView body evaluation"""
+    if not len(queue):
+        return None
+    return queue[min(index, len(queue) - 1)], len(queue), len(queue)
+
+
+def benchmark(sizes, renders=10, churn=0.01, accesses=4):
+    """Refilter-per-render against incremental queue maintenance, for every rule
+
+    Per refresh and rule: a delta touching `churn` of the tasks, then
+    `renders` body evaluations, each reading tasksToReview `accesses`
+    times. The cost of applying the delta is split across the rules.
+    """
+    now = start_of_day(time.time()) + 12 * 3600
+    rows = []
+    for size in sizes:
+        tasks = _synthetic_tasks(size, now)
+        start = time.perf_counter()
+        queues = ChallengeQueues().build(tasks, now - 60)
+        built = time.perf_counter() - start
+
+        rng = random.Random(1)
+        picked = rng.sample(range(len(tasks)), max(1, int(len(tasks) * churn)))
+        changed = []
+        for i in picked:
+            tasks[i] = replace(tasks[i], last_modified=now)
+            changed.append(tasks[i])
+
+        start = time.perf_counter()
+        queues.apply(changed, (), now)
+        applied = time.perf_counter() - start
+
+        for rule in queues.rules:
+            start = time.perf_counter()
+            for _ in range(renders * accesses):
+                refilter(tasks, rule, now)
+            baseline = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(renders):
+                _render(queues.queue(rule.name))
+            incremental = time.perf_counter() - start + applied / len(queues.rules)
+            rows.append({
+                'tasks': len(tasks),
+                'rule': rule.name,
+                'queued': len(queues.queue(rule.name)),
+                'refilter_s': baseline,
+                'build_s': built,
+                'incremental_s': incremental,
+                'speedup': baseline / incremental if incremental else float('inf'),
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('snapshot', nargs='?', help='reminders (.json / .jsonl)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare refilter-per-render with incremental queues')
+    parser.add_argument('--sizes', default='10000,100000,1000000',
+                        help='comma-separated benchmark task counts')
+    parser.add_argument('--renders', type=int, default=10, help='body evaluations per refresh')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        sizes = [int(s) for s in args.sizes.split(',') if s]
+        print(f"📊 All challenge queues, {args.renders} renders per refresh, 1% churn")
+        print(f"{'tasks':>9} {'rule':<12} {'queued':>8} {'refilter ms':>12} {'build ms':>10} "
+              f"{'incr ms':>9} {'speedup':>9}")
+        for row in benchmark(sizes, args.renders):
+            print(f"{row['tasks']:>9} {row['rule']:<12} {row['queued']:>8} {row['refilter_s'] * 1000:>12.1f} "
+                  f"{row['build_s'] * 1000:>10.1f} {row['incremental_s'] * 1000:>9.2f} {row['speedup']:>8.0f}x")
+        return 0
+    if not args.snapshot:
+        parser.error('a snapshot is required (or use --benchmark)')
+
+    start = time.perf_counter()
+    queues = ChallengeQueues().build(load_tasks(read_snapshot(args.snapshot)))
+    elapsed = time.perf_counter() - start
+    print(f"🎯 Challenge queues built in {elapsed * 1000:.0f} ms:")
+    for name, count in queues.counts().items():
+        print(f"   - {name}: {count}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
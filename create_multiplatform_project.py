@@ -1,68 +1,77 @@
 #!/usr/bin/env python3
 """
 Script to create a multiplatform Xcode project for GetSh1tDone (iOS + macOS)
+
+Importing this module has no side effects: render_project(), generate(),
+collect_inputs(), write_manifest() and check_manifest() are what the
+command line below and generator_server.py are built on.
 """
+import argparse
+import hashlib
+import json
 import os
+import sys
 import uuid
-import json
 
 def generate_uuid():
     """Generate a 24-character hex string for Xcode UUIDs"""
     return ''.join(uuid.uuid4().hex[:12].upper())
 
-# Generate all UUIDs
-project_uuid = generate_uuid()
-ios_target = generate_uuid()
-macos_target = generate_uuid()
-ios_sources_phase = generate_uuid()
-ios_resources_phase = generate_uuid()
-ios_frameworks_phase = generate_uuid()
-macos_sources_phase = generate_uuid()
-macos_resources_phase = generate_uuid()
-macos_frameworks_phase = generate_uuid()
-main_group = generate_uuid()
-products_group = generate_uuid()
-app_group = generate_uuid()
-root_group = generate_uuid()
-
-# File references
-ios_app_ref = generate_uuid()
-macos_app_ref = generate_uuid()
-app_swift = generate_uuid()
-content_view = generate_uuid()
-reminders_manager = generate_uuid()
-eisenhower_view = generate_uuid()
-task_quadrant = generate_uuid()
-planning_view = generate_uuid()
-task_challenge = generate_uuid()
-priorities_view = generate_uuid()
-assets = generate_uuid()
-info_plist = generate_uuid()
-entitlements = generate_uuid()
-
-# Build files
-bf_app = generate_uuid()
-bf_content = generate_uuid()
-bf_reminders = generate_uuid()
-bf_eisenhower = generate_uuid()
-bf_task = generate_uuid()
-bf_planning = generate_uuid()
-bf_challenge = generate_uuid()
-bf_priorities = generate_uuid()
-bf_assets = generate_uuid()
-
-# Config lists
-project_config = generate_uuid()
-ios_target_config = generate_uuid()
-macos_target_config = generate_uuid()
-debug_config = generate_uuid()
-release_config = generate_uuid()
-ios_debug_target = generate_uuid()
-ios_release_target = generate_uuid()
-macos_debug_target = generate_uuid()
-macos_release_target = generate_uuid()
-
-project_content = f'''// !$*UTF8*$!
+def render_project():
+    """project.pbxproj text for both targets, with fresh object ids"""
+    # Generate all UUIDs
+    project_uuid = generate_uuid()
+    ios_target = generate_uuid()
+    macos_target = generate_uuid()
+    ios_sources_phase = generate_uuid()
+    ios_resources_phase = generate_uuid()
+    ios_frameworks_phase = generate_uuid()
+    macos_sources_phase = generate_uuid()
+    macos_resources_phase = generate_uuid()
+    macos_frameworks_phase = generate_uuid()
+    main_group = generate_uuid()
+    products_group = generate_uuid()
+    app_group = generate_uuid()
+    root_group = generate_uuid()
+
+    # File references
+    ios_app_ref = generate_uuid()
+    macos_app_ref = generate_uuid()
+    app_swift = generate_uuid()
+    content_view = generate_uuid()
+    reminders_manager = generate_uuid()
+    eisenhower_view = generate_uuid()
+    task_quadrant = generate_uuid()
+    planning_view = generate_uuid()
+    task_challenge = generate_uuid()
+    priorities_view = generate_uuid()
+    assets = generate_uuid()
+    info_plist = generate_uuid()
+    entitlements = generate_uuid()
+
+    # Build files
+    bf_app = generate_uuid()
+    bf_content = generate_uuid()
+    bf_reminders = generate_uuid()
+    bf_eisenhower = generate_uuid()
+    bf_task = generate_uuid()
+    bf_planning = generate_uuid()
+    bf_challenge = generate_uuid()
+    bf_priorities = generate_uuid()
+    bf_assets = generate_uuid()
+
+    # Config lists
+    project_config = generate_uuid()
+    ios_target_config = generate_uuid()
+    macos_target_config = generate_uuid()
+    debug_config = generate_uuid()
+    release_config = generate_uuid()
+    ios_debug_target = generate_uuid()
+    ios_release_target = generate_uuid()
+    macos_debug_target = generate_uuid()
+    macos_release_target = generate_uuid()
+
+    return f'''// !$*UTF8*$!
 {{
 	archiveVersion = 1;
 	classes = {{
@@ -556,20 +565,187 @@ project_content = f'''// !$*UTF8*$!
 }}
 '''
 
-# Write the project file
+# Paths of the generated project
 project_dir = os.path.dirname(os.path.abspath(__file__))
 project_file = os.path.join(project_dir, 'GetSh1tDone.xcodeproj', 'project.pbxproj')
+manifest_file = os.path.join(project_dir, 'GetSh1tDone.xcodeproj', '.generator-manifest.json')
+
+# Bump whenever the template above changes what gets generated
+GENERATOR_VERSION = '1'
+
+# What each target is built from (mirrors the template above)
+TARGET_DESCRIPTORS = [
+    {
+        'name': 'GetSh1tDone iOS',
+        'sdk': 'iphoneos',
+        'deployment_target': 'IPHONEOS_DEPLOYMENT_TARGET = 17.0',
+        'bundle_id': 'com.getsh1tdone.app.ios',
+        'phases': ['Sources', 'Frameworks', 'Resources'],
+    },
+    {
+        'name': 'GetSh1tDone macOS',
+        'sdk': 'macosx',
+        'deployment_target': 'MACOSX_DEPLOYMENT_TARGET = 14.0',
+        'bundle_id': 'com.getsh1tdone.app.macos',
+        'phases': ['Sources', 'Frameworks', 'Resources'],
+    },
+]
+
+SOURCE_DIR = 'GetSh1tDone'
+ASSET_CATALOG = 'GetSh1tDone/Assets.xcassets'
+HASHED_INPUTS = ['GetSh1tDone/GetSh1tDone.entitlements', 'GetSh1tDone/Info.plist']
+
+
+def sha256_file(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# rel path -> (size, mtime_ns, sha256) of the last hash taken in this process.
+# Stat data differs between checkouts, so it never goes into the manifest.
+_digests = {}
+
+
+def file_record(rel_path):
+    """Hash record for a file; the hash is reused while size and mtime match"""
+    path = os.path.join(project_dir, rel_path)
+    st = os.stat(path)
+    cached = _digests.get(rel_path)
+    if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+        digest = cached[2]
+    else:
+        digest = sha256_file(path)
+        _digests[rel_path] = (st.st_size, st.st_mtime_ns, digest)
+    return {'sha256': digest}
+
+
+def source_paths():
+    """Swift sources under GetSh1tDone/ (only their paths end up in the project)"""
+    paths = []
+    for root, dirs, files in os.walk(os.path.join(project_dir, SOURCE_DIR)):
+        dirs[:] = sorted(d for d in dirs if not d.endswith(('.xcassets', '.xcodeproj')))
+        for name in sorted(files):
+            if name.endswith('.swift'):
+                paths.append(os.path.relpath(os.path.join(root, name), project_dir))
+    return sorted(paths)
+
+
+def asset_catalog_files():
+    paths = []
+    for root, dirs, files in os.walk(os.path.join(project_dir, ASSET_CATALOG)):
+        dirs.sort()
+        for name in sorted(files):
+            paths.append(os.path.relpath(os.path.join(root, name), project_dir))
+    return paths
+
+
+def collect_inputs(sources=None, assets=None):
+    """Manifest of everything the generated project depends on
+
+    `sources` and `assets` are the source_paths() and asset_catalog_files()
+    listings when the caller already has them (generator_server.py keeps
+    them in a directory index); otherwise the tree is walked.
+    """
+    if assets is None:
+        assets = asset_catalog_files()
+    files = {}
+    for rel_path in [os.path.basename(__file__)] + HASHED_INPUTS + list(assets):
+        files[rel_path] = file_record(rel_path)
+    targets = json.dumps(TARGET_DESCRIPTORS, sort_keys=True).encode('utf-8')
+    project_rel = os.path.relpath(project_file, project_dir)
+    return {
+        'generator_version': GENERATOR_VERSION,
+        'targets_sha256': hashlib.sha256(targets).hexdigest(),
+        'sources': source_paths() if sources is None else sorted(sources),
+        'files': files,
+        'project': {project_rel: file_record(project_rel)},
+    }
+
+
+def write_manifest(sources=None, assets=None):
+    """Record the input manifest (committed next to project.pbxproj)"""
+    manifest = collect_inputs(sources, assets)
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return manifest
+
+
+def generate():
+    """Write project.pbxproj from the template and record its manifest"""
+    os.makedirs(os.path.dirname(project_file), exist_ok=True)
+    with open(project_file, 'w') as f:
+        f.write(render_project())
+    return write_manifest()
+
+
+def check_manifest(recorded=None, sources=None, assets=None):
+    """Differences between the recorded manifest and the tree (empty list = up to date)"""
+    if recorded is None:
+        with open(manifest_file) as f:
+            recorded = json.load(f)
+    current = collect_inputs(sources, assets)
+    drift = []
+    if recorded.get('generator_version') != current['generator_version']:
+        drift.append(f"generator version {recorded.get('generator_version')} -> {current['generator_version']}")
+    if recorded.get('targets_sha256') != current['targets_sha256']:
+        drift.append('target descriptors changed')
+    old_sources, new_sources = set(recorded.get('sources', [])), set(current['sources'])
+    drift.extend(f"source added: {p}" for p in sorted(new_sources - old_sources))
+    drift.extend(f"source removed: {p}" for p in sorted(old_sources - new_sources))
+    for section in ('files', 'project'):
+        old, new = recorded.get(section, {}), current[section]
+        for rel_path in sorted(old.keys() | new.keys()):
+            if rel_path not in new:
+                drift.append(f"removed: {rel_path}")
+            elif rel_path not in old:
+                drift.append(f"added: {rel_path}")
+            elif old[rel_path]['sha256'] != new[rel_path]['sha256']:
+                drift.append(f"changed: {rel_path}")
+    return drift
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create the multiplatform GetSh1tDone Xcode project')
+    parser.add_argument('--check', action='store_true',
+                        help='exit non-zero if the project is out of date with its inputs (no generation)')
+    parser.add_argument('--update-manifest', action='store_true',
+                        help='record the input manifest for the existing project without regenerating it')
+    args = parser.parse_args()
+
+    if args.check:
+        if not os.path.exists(manifest_file):
+            print(f"❌ No manifest at {manifest_file}; run the generator or --update-manifest first")
+            return 2
+        drift = check_manifest()
+        if drift:
+            print("❌ project.pbxproj is out of date:")
+            for line in drift:
+                print(f"   - {line}")
+            return 1
+        print("✅ project.pbxproj is up to date")
+        return 0
+
+    if args.update_manifest:
+        write_manifest()
+        print(f"✅ Recorded input manifest at: {manifest_file}")
+        return 0
 
-os.makedirs(os.path.dirname(project_file), exist_ok=True)
+    generate()
 
-with open(project_file, 'w') as f:
-    f.write(project_content)
+    print(f"✅ Created multiplatform Xcode project file at: {project_file}")
+    print("📱 iOS Target: GetSh1tDone iOS")
+    print("💻 macOS Target: GetSh1tDone macOS")
+    print("\nYou can now:")
+    print("1. Open GetSh1tDone.xcodeproj in Xcode")
+    print("2. Select either 'GetSh1tDone iOS' or 'GetSh1tDone macOS' from the scheme menu")
+    print("3. Build and run for your chosen platform!")
+    return 0
 
-print(f"✅ Created multiplatform Xcode project file at: {project_file}")
-print("📱 iOS Target: GetSh1tDone iOS")
-print("💻 macOS Target: GetSh1tDone macOS")
-print("\nYou can now:")
-print("1. Open GetSh1tDone.xcodeproj in Xcode")
-print("2. Select either 'GetSh1tDone iOS' or 'GetSh1tDone macOS' from the scheme menu")
-print("3. Build and run for your chosen platform!")
 
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Warm server for the project generator.
+
+Every create_multiplatform_project.py run pays interpreter startup,
+re-walks the source tree and rebuilds its view of the project. This keeps
+one process alive on a local Unix socket with the parsed project.pbxproj,
+the input manifest and a directory index in memory. A request only
+re-reads what changed since the last one: the project is reparsed when
+its size or mtime changes, and a directory is relisted only when its own
+mtime changes.
+
+Requests and responses are single JSON lines:
+
+    {"op": "check"}                                 manifest drift (--check)
+    {"op": "validate"}                              sources vs. project references
+    {"op": "add", "path": "GetSh1tDone/New.swift"}  reference + compile a new file
+    {"op": "generate"}                              rewrite from the template
+    {"op": "ping"} / {"op": "shutdown"}
+
+Usage:
+    python3 generator_server.py --serve [--socket PATH]
+    python3 generator_server.py validate
+    python3 generator_server.py add GetSh1tDone/NewView.swift
+    python3 generator_server.py --latency 200
+"""
+import argparse
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+import create_multiplatform_project as generator
+import pbxproj
+
+DEFAULT_SOCKET = os.path.join(
+    tempfile.gettempdir(),
+    f"getsh1tdone-generator-{hashlib.sha1(generator.project_dir.encode()).hexdigest()[:8]}.sock")
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class DirectoryIndex:
+    """Files under a directory, relisting only directories whose mtime changed"""
+
+    def __init__(self, root, skip=('.xcassets', '.xcodeproj')):
+        self.root = root
+        self.skip = skip
+        self.listings = {}  # rel dir -> (mtime_ns, files, subdirs)
+
+    def _listing(self, rel_dir):
+        path = os.path.join(self.root, rel_dir)
+        mtime = os.stat(path).st_mtime_ns
+        cached = self.listings.get(rel_dir)
+        if cached and cached[0] == mtime:
+            return cached
+        files, subdirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.name.endswith(self.skip):
+                        subdirs.append(os.path.join(rel_dir, entry.name))
+                else:
+                    files.append(os.path.join(rel_dir, entry.name))
+        cached = (mtime, sorted(files), sorted(subdirs))
+        self.listings[rel_dir] = cached
+        return cached
+
+    def files(self, rel_dir, suffix=''):
+        found = []
+        pending = [rel_dir]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            seen.add(current)
+            _, files, subdirs = self._listing(current)
+            found.extend(f for f in files if f.endswith(suffix))
+            pending.extend(subdirs)
+        for stale in set(self.listings) - seen:
+            if stale.startswith(rel_dir):
+                del self.listings[stale]
+        return sorted(found)
+
+
+class ProjectState:
+    """The generator's inputs and outputs, kept warm between requests"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index = DirectoryIndex(generator.project_dir)
+        self.assets = DirectoryIndex(generator.project_dir, skip=())
+        self.project = None
+        self.project_key = None
+        self.paths = {}      # file reference id -> path relative to the project dir
+        self.groups = {}     # group path -> group id
+        self.manifest = None
+        self.manifest_key = None
+
+    # Cached inputs -----------------------------------------------------------
+
+    def graph(self):
+        key = _stat_key(generator.project_file)
+        if key is None:
+            raise FileNotFoundError(generator.project_file)
+        if key != self.project_key:
+            self.project = pbxproj.read(generator.project_file)
+            self.project_key = key
+            self._index_references()
+        return self.project
+
+    def _index_references(self):
+        self.paths, self.groups = pbxproj.reference_paths(self.project)
+
+    def targets(self):
+        """(name, Sources phase body) for each native target"""
+        objects = self.graph()['objects']
+        result = []
+        for target_id in objects[self.project['rootObject']].get('targets', []):
+            target = objects.get(target_id, {})
+            for phase_id in target.get('buildPhases', []):
+                phase = objects.get(phase_id, {})
+                if phase.get('isa') == 'PBXSourcesBuildPhase':
+                    result.append((target.get('name'), phase))
+        return result
+
+    def compiled(self, phase):
+        objects = self.project['objects']
+        return {objects.get(bf, {}).get('fileRef') for bf in phase.get('files', [])}
+
+    def recorded_manifest(self):
+        key = _stat_key(generator.manifest_file)
+        if key is None:
+            return None
+        if key != self.manifest_key:
+            with open(generator.manifest_file) as f:
+                self.manifest = json.load(f)
+            self.manifest_key = key
+        return self.manifest
+
+    def listings(self):
+        """(Swift sources, asset catalog files) from the directory index"""
+        return (self.index.files(generator.SOURCE_DIR, '.swift'),
+                self.assets.files(generator.ASSET_CATALOG))
+
+    def _record_manifest(self):
+        self.manifest = generator.write_manifest(*self.listings())
+        self.manifest_key = _stat_key(generator.manifest_file)
+
+    # Requests ----------------------------------------------------------------
+
+    def op_ping(self):
+        return {'ok': True, 'pid': os.getpid()}
+
+    def op_check(self):
+        recorded = self.recorded_manifest()
+        if recorded is None:
+            return {'ok': False, 'error': f"no manifest at {generator.manifest_file}"}
+        drift = generator.check_manifest(recorded, *self.listings())
+        return {'ok': not drift, 'drift': drift}
+
+    def op_validate(self):
+        self.graph()
+        sources = set(self.index.files(generator.SOURCE_DIR, '.swift'))
+        referenced = {path: ref for ref, path in self.paths.items() if path.endswith('.swift')}
+        not_compiled = {}
+        for name, phase in self.targets():
+            compiled = self.compiled(phase)
+            missing = sorted(p for p in sources & referenced.keys() if referenced[p] not in compiled)
+            if missing:
+                not_compiled[name] = missing
+        result = {
+            'missing_from_project': sorted(sources - referenced.keys()),
+            'missing_on_disk': sorted(referenced.keys() - sources),
+            'not_compiled': not_compiled,
+        }
+        result['ok'] = not any(result.values())
+        return result
+
+    def op_add(self, path):
+        path = os.path.normpath(path)
+        if not path.endswith('.swift'):
+            return {'ok': False, 'error': 'only .swift sources can be added'}
+        if not os.path.isfile(os.path.join(generator.project_dir, path)):
+            return {'ok': False, 'error': f"{path} does not exist"}
+        objects = self.graph()['objects']
+        group_id = self.groups.get(os.path.dirname(path))
+        if group_id is None:
+            return {'ok': False, 'error': f"no group for {os.path.dirname(path) or '.'}"}
+
+        def new_id():
+            object_id = generator.generate_uuid()
+            while object_id in objects:
+                object_id = generator.generate_uuid()
+            return object_id
+
+        ref = next((r for r, p in self.paths.items() if p == path), None)
+        if ref is None:
+            ref = new_id()
+            objects[ref] = {'isa': 'PBXFileReference', 'lastKnownFileType': 'sourcecode.swift',
+                            'path': os.path.basename(path), 'sourceTree': '<group>'}
+            objects[group_id]['children'].append(ref)
+            self.paths[ref] = path
+        added = []
+        for name, phase in self.targets():
+            if ref in self.compiled(phase):
+                continue
+            build_file = new_id()
+            objects[build_file] = {'isa': 'PBXBuildFile', 'fileRef': ref}
+            phase['files'].append(build_file)
+            added.append(name)
+        if added:
+            pbxproj.write_atomic(generator.project_file, self.project,
+                                 pbxproj.project_name_for(generator.project_file, self.project))
+            self.project_key = _stat_key(generator.project_file)
+            if self.recorded_manifest() is not None:
+                self._record_manifest()
+        return {'ok': True, 'file_ref': ref, 'targets': added}
+
+    def op_generate(self):
+        self.manifest = generator.generate()
+        self.manifest_key = _stat_key(generator.manifest_file)
+        return {'ok': True, 'project': generator.project_file}
+
+    def handle(self, request):
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': 'bad request: expected a JSON object'}
+        op = getattr(self, f"op_{request.get('op')}", None)
+        if op is None:
+            return {'ok': False, 'error': f"unknown op {request.get('op')!r}"}
+        params = {k: v for k, v in request.items() if k != 'op'}
+        with self.lock:
+            try:
+                return op(**params)
+            except (OSError, ValueError, TypeError, KeyError) as error:
+                return {'ok': False, 'error': str(error)}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                response = {'ok': False, 'error': f"bad request: {error}"}
+            else:
+                if isinstance(request, dict) and request.get('op') == 'shutdown':
+                    response = {'ok': True}
+                else:
+                    response = self.server.state.handle(request)
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+            if response.get('ok') and request.get('op') == 'shutdown':
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+class GeneratorServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, state=None):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, _Handler)
+        self.state = state or ProjectState()
+
+
+def serve(path=DEFAULT_SOCKET):
+    server = GeneratorServer(path)
+    # Warm the caches before the first request
+    server.state.handle({'op': 'validate'})
+    print(f"🚀 Generator server listening on {path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+    return 0
+
+
+class Client:
+    """A persistent connection to a running server"""
+
+    def __init__(self, path=DEFAULT_SOCKET):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.stream = self.sock.makefile('rwb')
+
+    def request(self, op, **params):
+        self.stream.write(json.dumps(dict(op=op, **params)).encode('utf-8') + b'\n')
+        self.stream.flush()
+        return json.loads(self.stream.readline())
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('op', nargs='?', help='check, validate, add, generate, ping or shutdown')
+    parser.add_argument('path', nargs='?', help='source file for add')
+    parser.add_argument('--serve', action='store_true', help='run the server in the foreground')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='Unix socket path')
+    parser.add_argument('--latency', type=int, metavar='N',
+                        help='time N ping/check/validate round trips against a running server')
+    args = parser.parse_args()
+
+    if args.serve:
+        return serve(args.socket)
+    try:
+        client = Client(args.socket)
+    except OSError:
+        print(f"❌ No generator server on {args.socket}; start one with --serve")
+        return 2
+
+    if args.latency:
+        print(f"⏱️  {args.latency} round trips per op")
+        for op in ('ping', 'check', 'validate'):
+            samples = []
+            for _ in range(args.latency):
+                start = time.perf_counter()
+                client.request(op)
+                samples.append((time.perf_counter() - start) * 1000)
+            samples.sort()
+            print(f"   - {op}: p50 {samples[len(samples) // 2]:.2f} ms, "
+                  f"max {samples[-1]:.2f} ms")
+        return 0
+    if not args.op:
+        parser.error('an op is required (or use --serve / --latency)')
+    params = {'path': args.path} if args.path else {}
+    response = client.request(args.op, **params)
+    client.close()
+    print(json.dumps(response, indent=2))
+    return 0 if response.get('ok') else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
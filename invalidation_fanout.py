@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+SwiftUI invalidation fan-out analyzer for ObservableObject publishers.
+
+Any @Published change on RemindersManager fires objectWillChange, and
+every view holding the manager as an @EnvironmentObject, @ObservedObject
+or @StateObject re-evaluates its body, whichever property it reads. This
+reads the Swift sources and maps each published property to the views
+that observe it, which body-reachable computed properties and functions
+read it, and how many passes over the published collections one body
+evaluation makes (computed properties are not cached, so each mention
+in `body` is another pass). From that it estimates, for each publish:
+
+    fan-out  = observing view instances + the views they re-create
+    work     = instances x passes x collection size (element visits)
+
+and ranks writer -> view invalidation paths by work, flagging "wasted"
+invalidations of views that read none of the properties the writer
+changed. Those are the places to split state.
+
+Usage:
+    python3 invalidation_fanout.py [GetSh1tDone] [--tasks 1000] [--delegates 5] [--json]
+
+The numbers are static estimates and upper bounds: every branch,
+sheet and tab counts as if it were visible, ForEach over a collection
+counts every element, and a pass is a filter/map/sorted/... call or a
+for-in loop on a published collection or on a local derived from one.
+"""
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+
+DEFAULT_SOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'GetSh1tDone')
+
+_TYPE_RE = re.compile(r'\b(struct|class|enum|extension)\s+(\w+)\s*(?::\s*([^{]+))?\{')
+_FUNC_RE = re.compile(r'\bfunc\s+(\w+)\s*(?:<[^>{]*>)?\s*\(')
+_COMPUTED_RE = re.compile(r'\bvar\s+(\w+)\s*:\s*[^={\n]+\{')
+_OBSERVED_RE = re.compile(
+    r'@(EnvironmentObject|ObservedObject|StateObject)\s+(?:(?:private|public|fileprivate)\s+)?'
+    r'var\s+(\w+)\s*(?::\s*(\w+)|=\s*(\w+)\s*\()')
+_PUBLISHED_RE = re.compile(
+    r'@Published\s+(?:(?:private|public)(?:\(set\))?\s+)*var\s+(\w+)\s*(?::\s*([^=\n]+))?(?:=\s*([^\n]+))?')
+_PASS = (r'(?:filter|map|compactMap|flatMap|sorted|sort|reduce|forEach|allSatisfy|'
+         r'first\s*(?:\(\s*where|\{)|last\s*(?:\(\s*where|\{)|contains\s*(?:\(\s*where|\{)|'
+         r'min\s*(?:\(\s*by|\{)|max\s*(?:\(\s*by|\{)|firstIndex|lastIndex|removeAll\s*(?:\(\s*where|\{))')
+_PASS_RE = re.compile(r'(?:\b(\w+)\s*)?\.\s*' + _PASS + r'(?!\w)')
+_FOR_RE = re.compile(r'\bfor\s+[^{]+?\s+in\s+(?:self\.)?(\w+)(?:\s*\.\s*(\w+))?')
+_FOREACH_RE = re.compile(r'\bForEach\s*\(')
+_IDENT_RE = re.compile(r'(?<![\w.])(?:self\s*\.\s*)?(\w+)\b')
+# what follows a property name when it is written rather than read
+_WRITE = r'(?:\s*\[[^\]\n]*\])?\s*(?:[-+]?=(?!=)|\.\s*(?:append|insert|remove\w*|sort)\b)'
+_WRITE_RE = re.compile(_WRITE)
+
+
+# Swift scanning --------------------------------------------------------------
+
+class _Cleaner:
+    """Blank out comments and string literals, keeping \\( interpolations ) and newlines"""
+
+    def __init__(self, source):
+        self.s = source
+        self.out = list(source)
+
+    def blank(self, start, end):
+        for k in range(start, end):
+            if self.out[k] != '\n':
+                self.out[k] = ' '
+
+    def code(self, i, interpolation=False):
+        s = self.s
+        depth = 0
+        while i < len(s):
+            c = s[i]
+            if s.startswith('//', i):
+                end = s.find('\n', i)
+                end = len(s) if end < 0 else end
+                self.blank(i, end)
+                i = end
+            elif s.startswith('/*', i):
+                end = s.find('*/', i + 2)
+                end = len(s) if end < 0 else end + 2
+                self.blank(i, end)
+                i = end
+            elif c == '"':
+                i = self.string(i)
+            elif interpolation and c == '(':
+                depth += 1
+                i += 1
+            elif interpolation and c == ')':
+                if depth == 0:
+                    return i + 1
+                depth -= 1
+                i += 1
+            else:
+                i += 1
+        return i
+
+    def string(self, i):
+        s = self.s
+        quote = '"""' if s.startswith('"""', i) else '"'
+        i += len(quote)
+        start = i
+        while i < len(s):
+            if s[i] == '\\' and i + 1 < len(s):
+                if s[i + 1] == '(':
+                    self.blank(start, i + 1)
+                    i = self.code(i + 2, interpolation=True)
+                    start = i
+                    continue
+                i += 2
+                continue
+            if s.startswith(quote, i) or (quote == '"' and s[i] == '\n'):
+                self.blank(start, i)
+                return i + len(quote) if s[i] != '\n' else i
+            i += 1
+        self.blank(start, i)
+        return i
+
+    def clean(self):
+        self.code(0)
+        return ''.join(self.out)
+
+
+def clean_swift(source):
+    return _Cleaner(source).clean()
+
+
+def block_end(text, open_brace):
+    """Index just past the brace matching text[open_brace]"""
+    depth = 0
+    for i in range(open_brace, len(text)):
+        if text[i] == '{':
+            depth += 1
+        elif text[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(text)
+
+
+def paren_end(text, open_paren):
+    depth = 0
+    for i in range(open_paren, len(text)):
+        if text[i] == '(':
+            depth += 1
+        elif text[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(text)
+
+
+class SwiftFile:
+    def __init__(self, path):
+        self.path = path
+        with open(path, encoding='utf-8') as f:
+            self.text = clean_swift(f.read())
+        self.depth = list(itertools.accumulate(
+            (1 if c == '{' else -1 if c == '}' else 0) for c in self.text))
+
+    def depth_at(self, pos):
+        return self.depth[pos - 1] if pos else 0
+
+    def line(self, pos):
+        return self.text.count('\n', 0, pos) + 1
+
+
+class Member:
+    def __init__(self, owner, name, source, start, end):
+        self.owner = owner
+        self.name = name
+        self.source = source
+        self.start = start
+        self.end = end
+
+    @property
+    def text(self):
+        return self.source.text[self.start:self.end]
+
+
+class SwiftType:
+    def __init__(self, kind, name, conformances, source, start, end):
+        self.kind = kind
+        self.name = name
+        self.conformances = {c.strip() for c in conformances.split(',')} if conformances else set()
+        self.source = source
+        self.start = start      # opening brace
+        self.end = end
+        self.members = {}
+        self.observed = {}      # property name -> observable type
+        self.published = {}     # property name -> is a collection
+        self.cases = 0
+
+    @property
+    def is_view(self):
+        return self.kind == 'struct' and bool(self.conformances & {'View', 'App'})
+
+
+def parse_sources(directory):
+    """All struct/class/enum declarations (extensions merged) in a source tree"""
+    types = {}
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith('.swift'):
+                continue
+            source = SwiftFile(os.path.join(root, name))
+            found = []
+            for match in _TYPE_RE.finditer(source.text):
+                open_brace = match.end() - 1
+                found.append(SwiftType(match.group(1), match.group(2), match.group(3),
+                                       source, open_brace, block_end(source.text, open_brace)))
+
+            def owner_of(pos):
+                inner = None
+                for t in found:
+                    if t.start < pos < t.end and (inner is None or t.start > inner.start):
+                        inner = t
+                return inner
+
+            for t in found:
+                target = types.get(t.name) if t.kind == 'extension' else None
+                if target is None:
+                    target = types.setdefault(t.name, t)
+                t.target = target
+            for pattern in (_FUNC_RE, _COMPUTED_RE):
+                for match in pattern.finditer(source.text):
+                    owner = owner_of(match.start())
+                    if owner is None or source.depth_at(match.start()) != source.depth_at(owner.start) + 1:
+                        continue
+                    open_brace = source.text.find('{', match.end() - 1)
+                    if pattern is _FUNC_RE:
+                        # skip the parameter list and return type
+                        open_brace = source.text.find('{', paren_end(source.text, match.end() - 1))
+                    owner.target.members[match.group(1)] = Member(
+                        owner.target, match.group(1), source, open_brace, block_end(source.text, open_brace))
+            for match in _OBSERVED_RE.finditer(source.text):
+                owner = owner_of(match.start())
+                if owner is not None:
+                    owner.target.observed[match.group(2)] = match.group(3) or match.group(4)
+            for match in _PUBLISHED_RE.finditer(source.text):
+                owner = owner_of(match.start())
+                if owner is not None:
+                    declared = (match.group(2) or '').strip()
+                    initial = (match.group(3) or '').strip()
+                    owner.target.published[match.group(1)] = declared.startswith('[') or initial.startswith('[')
+            for t in found:
+                if t.kind == 'enum':
+                    body = source.text[t.start:t.end]
+                    t.cases = sum(len(m.group(1).split(','))
+                                  for m in re.finditer(r'\bcase\s+([^\n:=(]+?)(?:=[^\n]*)?\n', body))
+    return types
+
+
+# Analysis --------------------------------------------------------------------
+
+class Analysis:
+    def __init__(self, types, sizes):
+        self.types = types
+        self.sizes = sizes
+        self.observables = {n: t for n, t in types.items() if t.published}
+        self._member_costs = {}
+        self._member_reads = {}
+        self._publishes = {}
+
+    # Per-member work and reads
+
+    def _observed_prefixes(self, owner):
+        """{accessor variable -> observable} for a view, {'self' -> itself} for an observable"""
+        if owner.name in self.observables:
+            return {None: owner}
+        return {var: self.observables[kind] for var, kind in owner.observed.items() if kind in self.observables}
+
+    def _accesses(self, member):
+        """(observable, name, position) for every published property or method it touches"""
+        found = []
+        for var, observable in self._observed_prefixes(member.owner).items():
+            if var is None:
+                for match in _IDENT_RE.finditer(member.text):
+                    name = match.group(1)
+                    if name in observable.published and _WRITE_RE.match(member.text, match.end()):
+                        continue
+                    if name in observable.published or (name in observable.members and name != member.name):
+                        found.append((observable, name, match.start(1)))
+                continue
+            for match in re.finditer(r'\b' + re.escape(var) + r'\s*\.\s*(\w+)', member.text):
+                found.append((observable, match.group(1), match.start(1)))
+        return found
+
+    def member_cost(self, member, stack=()):
+        """{collection: passes} for one evaluation of a member, including what it calls"""
+        key = (member.owner.name, member.name)
+        if key in self._member_costs:
+            return self._member_costs[key]
+        if key in stack:
+            return {}
+        stack = stack + (key,)
+        cost = {}
+        reads = set()
+        text = member.text
+        collections = {}     # receiver names that stand for a published collection
+        for observable, name, _ in self._accesses(member):
+            if name in observable.published:
+                reads.add(name)
+                if observable.published[name]:
+                    collections[name] = name
+            elif name in observable.members:
+                if self.publishes(observable).get(name):
+                    # actions (button taps, .task) publish; they are not render-time reads
+                    continue
+                callee = observable.members[name]
+                for coll, passes in self.member_cost(callee, stack).items():
+                    cost[coll] = cost.get(coll, 0) + passes
+                reads |= self._member_reads[(observable.name, name)]
+        # locals assigned from a published collection inherit it
+        for match in re.finditer(r'\b(?:let|var)\s+(\w+)\s*(?::[^=\n]+)?=\s*([^\n]+)', text):
+            for coll in set(collections.values()):
+                if re.search(r'\b' + coll + r'\b', match.group(2)):
+                    collections[match.group(1)] = coll
+        for match in _PASS_RE.finditer(text):
+            coll = collections.get(match.group(1))
+            if coll is not None:
+                cost[coll] = cost.get(coll, 0) + 1
+        for match in _FOR_RE.finditer(text):
+            coll = collections.get(match.group(1))
+            if coll is not None and match.group(2) is None:
+                cost[coll] = cost.get(coll, 0) + 1
+        # computed properties / helpers of the same type, once per mention
+        for other in member.owner.members.values():
+            if other is member:
+                continue
+            mentions = len(re.findall(r'(?<![\w.])(?:self\s*\.\s*)?' + re.escape(other.name) + r'\b', text))
+            if not mentions:
+                continue
+            for coll, passes in self.member_cost(other, stack).items():
+                cost[coll] = cost.get(coll, 0) + mentions * passes
+            reads |= self._member_reads.get((other.owner.name, other.name), set())
+        self._member_costs[key] = cost
+        self._member_reads[key] = reads
+        return cost
+
+    def member_reads(self, member):
+        self.member_cost(member)
+        return self._member_reads[(member.owner.name, member.name)]
+
+    def reachable_members(self, view):
+        """Members reachable from `body`, in the order they are found"""
+        body = view.members.get('body')
+        if body is None:
+            return []
+        seen = {'body': body}
+        pending = [body]
+        while pending:
+            member = pending.pop()
+            for other in view.members.values():
+                if other.name not in seen and re.search(r'(?<![\w.])(?:self\s*\.\s*)?' + re.escape(other.name) + r'\b', member.text):
+                    seen[other.name] = other
+                    pending.append(other)
+        return list(seen.values())
+
+    # View tree
+
+    def foreach_multiplier(self, view, arg, resolve=True):
+        if resolve:
+            # ForEach(filtered) over a local: look at what the local was assigned
+            body = view.source.text[view.start:view.end]
+            for name in re.findall(r'\b([a-z_]\w*)\b', arg):
+                local = re.search(r'\b(?:let|var)\s+' + name + r'\s*(?::[^=\n]+)?=\s*([^\n]+)', body)
+                if local:
+                    multiplier, label = self.foreach_multiplier(view, local.group(1), resolve=False)
+                    if label:
+                        return multiplier, label
+        for observable in self.observables.values():
+            for name, is_collection in observable.published.items():
+                if is_collection and re.search(r'\b' + name + r'\b', arg):
+                    return self.sizes.get(name, self.sizes['default']), name
+        for member in view.members.values():
+            if re.search(r'\b' + re.escape(member.name) + r'\b', arg):
+                for coll in self.member_cost(member):
+                    return self.sizes.get(coll, self.sizes['default']), coll
+        match = re.search(r'\b(\w+)\.allCases', arg)
+        if match and match.group(1) in self.types and self.types[match.group(1)].cases:
+            return self.types[match.group(1)].cases, f"{match.group(1)}.allCases"
+        return 1, None
+
+    def children(self, view):
+        """[(child view name, multiplier)] for every view created from body-reachable code"""
+        views = {n for n, t in self.types.items() if t.is_view}
+        text = view.source.text
+        loops = []
+        for match in _FOREACH_RE.finditer(text):
+            if not view.start < match.start() < view.end:
+                continue
+            args_end = paren_end(text, match.end() - 1)
+            open_brace = text.find('{', args_end - 1)
+            if open_brace < 0:
+                continue
+            multiplier, _ = self.foreach_multiplier(view, text[match.end():args_end - 1])
+            loops.append((open_brace, block_end(text, open_brace), multiplier))
+        result = []
+        for member in self.reachable_members(view):
+            for match in re.finditer(r'\b([A-Z]\w*)\s*\(', member.text):
+                name = match.group(1)
+                if name not in views or name == view.name:
+                    continue
+                pos = member.start + match.start()
+                multiplier = 1
+                for start, end, loop_multiplier in loops:
+                    if start < pos < end:
+                        multiplier *= loop_multiplier
+                result.append((name, multiplier))
+        return result
+
+    def instances(self):
+        """Estimated live instances per view, from the App (or parentless views) down"""
+        views = {n: t for n, t in self.types.items() if t.is_view}
+        edges = {n: self.children(t) for n, t in views.items()}
+        apps = [n for n, t in views.items() if 'App' in t.conformances]
+        if not apps:
+            created = {child for kids in edges.values() for child, _ in kids}
+            apps = [n for n in views if n not in created]
+        counts = {n: 0 for n in views}
+
+        # accumulate multiplicities along every path from a root (trees are shallow)
+        def walk(name, multiplier, path):
+            if name in path:
+                return
+            counts[name] += multiplier
+            for child, child_multiplier in edges[name]:
+                walk(child, multiplier * child_multiplier, path + (name,))
+
+        for root in apps:
+            walk(root, 1, ())
+        return counts, edges
+
+    # Publishers
+
+    def publishes(self, observable):
+        """{method: {property: write sites}} including writes of manager methods it calls"""
+        if observable.name not in self._publishes:
+            self._publishes[observable.name] = self._find_publishes(observable)
+        return self._publishes[observable.name]
+
+    def _find_publishes(self, observable):
+        direct = {}
+        for member in observable.members.values():
+            writes = {}
+            for name in observable.published:
+                pattern = r'(?<![\w.])(?:self\s*\.\s*)?' + name + _WRITE
+                sites = len(re.findall(pattern, member.text))
+                if sites:
+                    writes[name] = sites
+            direct[member.name] = writes
+
+        def total(name, stack):
+            result = dict(direct.get(name, {}))
+            member = observable.members[name]
+            for other in observable.members:
+                if other == name or other in stack:
+                    continue
+                if re.search(r'(?<![\w.])(?:self\s*\.\s*)?' + re.escape(other) + r'\s*\(', member.text):
+                    for prop, sites in total(other, stack | {name}).items():
+                        result[prop] = result.get(prop, 0) + sites
+            return result
+
+        return {name: writes for name in observable.members if (writes := total(name, frozenset()))}
+
+    # Report
+
+    def report(self):
+        counts, edges = self.instances()
+        views = {n: t for n, t in self.types.items() if t.is_view}
+        result = {}
+        for observable in self.observables.values():
+            observers = [n for n, t in views.items()
+                         if any(kind == observable.name for kind in t.observed.values())]
+            invalidated = {name: 'observes' for name in observers}
+            pending = list(observers)
+            while pending:
+                for child, _ in edges[pending.pop()]:
+                    if child not in invalidated:
+                        invalidated[child] = 'recreated'
+                        pending.append(child)
+            rows = []
+            for name, reason in invalidated.items():
+                view = views[name]
+                body = view.members.get('body')
+                passes = self.member_cost(body) if body else {}
+                reads = self.member_reads(body) if body else set()
+                per_instance = sum(p * self.sizes.get(c, self.sizes['default']) for c, p in passes.items())
+                rows.append({
+                    'view': name,
+                    'file': os.path.basename(view.source.path),
+                    'line': view.source.line(view.start),
+                    'reason': reason,
+                    'instances': counts.get(name, 0),
+                    'passes': passes,
+                    'reads': sorted(reads),
+                    'visits_per_render': per_instance,
+                    'visits_per_publish': per_instance * counts.get(name, 0),
+                    'readers': {m.name: sorted(self.member_reads(m))
+                                for m in self.reachable_members(view) if self.member_reads(m)},
+                })
+            rows.sort(key=lambda r: (-r['visits_per_publish'], -r['instances'], r['view']))
+            live = [r for r in rows if r['instances']]
+            properties = {}
+            for prop in observable.published:
+                readers = [r for r in live if prop in r['reads']]
+                properties[prop] = {
+                    'readers': [r['view'] for r in readers],
+                    'invalidated_instances': sum(r['instances'] for r in live),
+                    'wasted_instances': sum(r['instances'] for r in live if prop not in r['reads']),
+                    'visits_per_publish': sum(r['visits_per_publish'] for r in live),
+                }
+            paths = []
+            for method, writes in self.publishes(observable).items():
+                sites = sum(writes.values())
+                for r in live:
+                    paths.append({
+                        'writer': method,
+                        'writes': writes,
+                        'view': r['view'],
+                        'visits': sites * r['visits_per_publish'],
+                        'wasted': not set(writes) & set(r['reads']),
+                    })
+            paths.sort(key=lambda p: (-p['visits'], p['writer'], p['view']))
+            result[observable.name] = {'views': rows, 'properties': properties, 'paths': paths}
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('sources', nargs='?', default=DEFAULT_SOURCES, help='directory of Swift sources')
+    parser.add_argument('--tasks', type=int, default=1000, help='assumed size of tasks')
+    parser.add_argument('--delegates', type=int, default=5, help='assumed size of delegates')
+    parser.add_argument('--top', type=int, default=15, help='invalidation paths to list')
+    parser.add_argument('--json', action='store_true', help='print the full analysis as JSON')
+    args = parser.parse_args()
+
+    sizes = {'tasks': args.tasks, 'delegates': args.delegates, 'default': args.tasks}
+    report = Analysis(parse_sources(args.sources), sizes).report()
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+
+    for observable, data in report.items():
+        live = [r for r in data['views'] if r['instances']]
+        print(f"📣 {observable}: every publish invalidates {len(live)} views "
+              f"({sum(r['instances'] for r in live)} instances) with {args.tasks} tasks")
+        print(f"   {'view':<26} {'why':<10} {'inst':>5} {'passes':<22} {'visits/publish':>14}")
+        for r in live:
+            passes = ', '.join(f"{c}x{p}" for c, p in sorted(r['passes'].items())) or '-'
+            print(f"   {r['view']:<26} {r['reason']:<10} {r['instances']:>5} {passes:<22} "
+                  f"{r['visits_per_publish']:>14}")
+        unused = sorted(r['view'] for r in data['views'] if not r['instances'] and r['reason'] == 'observes')
+        if unused:
+            print(f"   Observing views never created from the App: {', '.join(unused)}")
+        print("   Published properties:")
+        for prop, info in data['properties'].items():
+            print(f"   - {prop}: read by {len(info['readers'])} views; "
+                  f"{info['wasted_instances']}/{info['invalidated_instances']} invalidated instances don't read it")
+        print("🔥 Most expensive invalidation paths:")
+        for p in data['paths'][:args.top]:
+            writes = ', '.join(f"{k}x{v}" for k, v in sorted(p['writes'].items()))
+            flag = '  (wasted)' if p['wasted'] else ''
+            print(f"   - {p['writer']} [{writes}] -> {p['view']}: {p['visits']} visits{flag}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Structured traces from RemindersManager DEBUG console output.
+
+loadReminders, extractQuadrant and normalizeTaskTagsAndNotes print a
+running commentary (🔐 authorization, 📥 Fetched N reminders, per-reminder
+"Found … hashtag" lines, the 📊 SUMMARY counts and the commit result).
+This reads that output as a stream and turns every loadReminders call
+into one record: reminders fetched and filtered, how each was classified,
+notes rewritten, the commit result and, when the lines carry timestamps
+(`log stream`, Console.app or Xcode with timestamps enabled), the time
+spent in each phase.
+
+Usage:
+    python3 load_trace.py device.log [more.log ...] [--json] [--timeline]
+    xcrun simctl spawn booted log stream --process GetSh1tDone | python3 load_trace.py -
+
+Lines without a recognised timestamp are still counted; the timeline is
+empty for them. Concurrent loads interleave their output and cannot be
+told apart; a load cut short by the next 🔐 line is marked incomplete.
+"""
+import argparse
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+from reminders_model import QUADRANTS
+
+# Marks in the order loadReminders prints them, and the phase each one ends
+MARKS = ['start', 'calendars', 'fetched', 'filtered', 'classified', 'committed']
+PHASES = [
+    ('calendars', 'start', 'calendars'),
+    ('fetch', 'calendars', 'fetched'),
+    ('filter', 'fetched', 'filtered'),
+    ('classify', 'filtered', 'classified'),
+    ('commit', 'classified', 'committed'),
+]
+DAY = 86400
+
+# Summary labels ("   - Bin: 3") -> Quadrant raw values
+_SUMMARY_QUADRANTS = {'Do Now': 'Do Now', 'Delegate': 'Delegate',
+                      'Schedule': 'Schedule', 'Bin': 'Bin / Challenge'}
+
+_TIMESTAMP_RE = re.compile(
+    r'^\[?(?P<date>\d{4}-\d{2}-\d{2}[ T])?(?P<time>\d{2}:\d{2}:\d{2}(?:[.,]\d+)?)'
+    r'(?P<tz>Z|[+-]\d{2}:?\d{2})?\]?')
+
+_LINES = [(name, re.compile(pattern)) for name, pattern in [
+    ('auth', r'🔐 Authorization status: (-?\d+), Authorized: (true|false)'),
+    ('unauthorized', r'❌ Not authorized to load reminders'),
+    ('calendars', r'📅 Found (\d+) reminder calendars'),
+    ('fetched', r'📥 Fetched (\d+) reminders from EventKit'),
+    ('loading', r'📋 Loading (\d+) reminders\.\.\.'),
+    ('found', r'📋 Found (\d+) reminders to load:'),
+    ('incomplete', r'\s- Incomplete: (\d+)'),
+    ('completed_today', r'\s- Completed today: (\d+)'),
+    ('filtered_out', r'\s- Filtered out: (-?\d+)'),
+    ('hashtag', r'✅ Found (\w+) hashtag( \(regex\))? in reminder:'),
+    ('assigned', r'→ Assigned to quadrant: (.+?)\s*$'),
+    ('challenge', r"🎯 Task '.*' has #challenge tag"),
+    ('time_period', r"📅 Task '.*' has time period tag but no quadrant tag"),
+    ('skipped', r"⚠️ No quadrant hashtag found in reminder:"),
+    ('normalized', r'🔧 Normalization details:'),
+    ('rewritten', r"🔄 Updated reminder notes for '"),
+    ('rewrite_failed', r'⚠️ Failed to update reminder notes: (.*)$'),
+    ('other_tags', r"📌 Other tags found for '"),
+    ('summary', r'📊 SUMMARY:'),
+    ('loaded', r'✅ Loaded (\d+) tasks'),
+    ('quadrant', r'\s- (Do Now|Delegate|Schedule|Bin): (\d+)\s*$'),
+    ('committed', r'✅ Committed all reminder updates'),
+    ('commit_failed', r'⚠️ Failed to commit reminder updates: (.*)$'),
+]]
+
+
+@dataclass
+class LoadTrace:
+    """One loadReminders call"""
+    started: float = None
+    authorized: bool = None
+    auth_status: int = None
+    calendars: int = None
+    fetched: int = None
+    to_load: int = None
+    incomplete: int = None
+    completed_today: int = None
+    filtered_out: int = None
+    matched_tags: dict = field(default_factory=dict)    # extractQuadrant tag text -> count
+    regex_matches: int = 0
+    assigned: dict = field(default_factory=dict)        # quadrant from a quadrant hashtag
+    challenge_fallback: int = 0
+    time_period_fallback: int = 0
+    skipped_logged: int = 0     # extractQuadrant only logs some untagged reminders
+    normalized: int = 0
+    notes_rewritten: int = 0
+    rewrite_failures: int = 0
+    with_other_tags: int = 0
+    loaded: int = None
+    quadrants: dict = field(default_factory=dict)       # 📊 SUMMARY counts
+    committed: bool = None
+    commit_error: str = None
+    complete: bool = False
+    marks: dict = field(default_factory=dict)           # mark -> timestamp
+
+    def timeline(self):
+        """[(phase, seconds)] for every phase whose start and end were both timestamped"""
+        phases = []
+        for phase, begin, end in PHASES:
+            if self.marks.get(begin) is not None and self.marks.get(end) is not None:
+                phases.append((phase, self.marks[end] - self.marks[begin]))
+        return phases
+
+    def duration(self):
+        stamps = [self.marks[m] for m in MARKS if self.marks.get(m) is not None]
+        return stamps[-1] - stamps[0] if len(stamps) > 1 else None
+
+    def to_dict(self):
+        result = asdict(self)
+        result['timeline'] = {phase: round(seconds * 1000, 3) for phase, seconds in self.timeline()}
+        duration = self.duration()
+        result['duration_ms'] = None if duration is None else round(duration * 1000, 3)
+        return result
+
+
+def line_timestamp(line):
+    """(epoch seconds or None, rest of line) for an optional leading timestamp
+
+    Time-only stamps (Xcode's console) become seconds since midnight;
+    parse_log carries them over midnight.
+    """
+    match = _TIMESTAMP_RE.match(line)
+    if not match:
+        return None, line
+    clock = match.group('time').replace(',', '.')
+    rest = line[match.end():]
+    if not match.group('date'):
+        h, m, s = clock.split(':')
+        return int(h) * 3600 + int(m) * 60 + float(s), rest
+    tz = match.group('tz') or ''
+    if tz and tz != 'Z' and ':' not in tz:
+        tz = f"{tz[:3]}:{tz[3:]}"
+    elif tz == 'Z':
+        tz = '+00:00'
+    return datetime.fromisoformat(f"{match.group('date')[:10]}T{clock}{tz}").timestamp(), rest
+
+
+def parse_log(lines):
+    """Yield a LoadTrace for every loadReminders call found in `lines`"""
+    trace = None
+    clock = None    # last time-only stamp, days added
+    days = 0
+    for line in lines:
+        ts, text = line_timestamp(line.rstrip('\n'))
+        if ts is not None and ts < DAY:
+            # A time-only stamp more than half a day behind the last one is
+            # the next day; smaller steps back are interleaved threads
+            ts += days * DAY
+            if clock is not None and ts < clock - DAY / 2:
+                days += 1
+                ts += DAY
+            clock = ts
+        for name, pattern in _LINES:
+            match = pattern.search(text)
+            if match:
+                break
+        else:
+            continue
+
+        if name == 'auth':
+            if trace is not None:
+                yield trace
+            trace = LoadTrace(started=ts, auth_status=int(match.group(1)),
+                              authorized=match.group(2) == 'true')
+            trace.marks['start'] = ts
+            continue
+        if trace is None:
+            # normalizeTaskTagsAndNotes also runs from createTask
+            continue
+
+        if name == 'unauthorized':
+            trace.authorized = False
+            trace.complete = True
+            yield trace
+            trace = None
+        elif name == 'calendars':
+            trace.calendars = int(match.group(1))
+            trace.marks['calendars'] = ts
+        elif name == 'fetched':
+            trace.fetched = int(match.group(1))
+            trace.marks['fetched'] = ts
+        elif name == 'loading':
+            trace.fetched = int(match.group(1)) if trace.fetched is None else trace.fetched
+        elif name == 'found':
+            trace.to_load = int(match.group(1))
+            trace.marks['filtered'] = ts
+        elif name in ('incomplete', 'completed_today', 'filtered_out'):
+            setattr(trace, name, int(match.group(1)))
+        elif name == 'hashtag':
+            tag = match.group(1)
+            trace.matched_tags[tag] = trace.matched_tags.get(tag, 0) + 1
+            trace.regex_matches += bool(match.group(2))
+        elif name == 'assigned':
+            quadrant = match.group(1)
+            trace.assigned[quadrant] = trace.assigned.get(quadrant, 0) + 1
+        elif name == 'challenge':
+            trace.challenge_fallback += 1
+        elif name == 'time_period':
+            trace.time_period_fallback += 1
+        elif name == 'skipped':
+            trace.skipped_logged += 1
+        elif name == 'normalized':
+            trace.normalized += 1
+        elif name == 'rewritten':
+            trace.notes_rewritten += 1
+        elif name == 'rewrite_failed':
+            trace.rewrite_failures += 1
+        elif name == 'other_tags':
+            trace.with_other_tags += 1
+        elif name == 'summary':
+            trace.marks['classified'] = ts
+        elif name == 'loaded':
+            trace.loaded = int(match.group(1))
+        elif name == 'quadrant' and 'classified' in trace.marks:
+            trace.quadrants[_SUMMARY_QUADRANTS[match.group(1)]] = int(match.group(2))
+        elif name in ('committed', 'commit_failed'):
+            trace.committed = name == 'committed'
+            trace.commit_error = match.group(1) if name == 'commit_failed' else None
+            trace.marks['committed'] = ts
+            trace.complete = True
+            yield trace
+            trace = None
+    if trace is not None:
+        yield trace
+
+
+def read_lines(paths):
+    for path in paths:
+        if path == '-':
+            yield from sys.stdin
+            continue
+        with open(path, encoding='utf-8', errors='replace') as f:
+            yield from f
+
+
+def scaling(traces):
+    """Least-squares fit of load duration against reminders fetched: (ms per 1000, intercept ms)"""
+    points = [(t.fetched, t.duration() * 1000) for t in traces
+              if t.complete and t.fetched is not None and t.duration() is not None]
+    if len(points) < 2:
+        return None
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+    return slope * 1000, mean_y - slope * mean_x
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('logs', nargs='*', default=['-'], help="console logs ('-' for stdin)")
+    parser.add_argument('--json', action='store_true', help='print one JSON record per load')
+    parser.add_argument('--timeline', action='store_true', help='print per-phase timings for every load')
+    args = parser.parse_args()
+
+    if args.json:
+        for trace in parse_log(read_lines(args.logs)):
+            print(json.dumps(trace.to_dict(), ensure_ascii=False))
+        return 0
+
+    traces = []
+    for trace in parse_log(read_lines(args.logs)):
+        traces.append(trace)
+        if args.timeline:
+            started = '--' if trace.started is None else f"{trace.started:.3f}"
+            phases = ' '.join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in trace.timeline())
+            print(f"⏱️  {started} fetched={trace.fetched} loaded={trace.loaded} {phases or '(no timestamps)'}")
+
+    complete = [t for t in traces if t.complete]
+    print(f"📊 {len(traces)} loads ({len(traces) - len(complete)} incomplete)")
+    if not complete:
+        return 0
+    totals = {q: sum(t.quadrants.get(q, 0) for t in complete) for q in QUADRANTS}
+    print(f"   - Reminders fetched: {sum(t.fetched or 0 for t in complete)}, "
+          f"loaded: {sum(t.loaded or 0 for t in complete)}")
+    for quadrant, count in totals.items():
+        print(f"   - {quadrant}: {count}")
+    print(f"   - Notes rewritten: {sum(t.notes_rewritten for t in complete)}, "
+          f"failed commits: {sum(1 for t in complete if t.committed is False)}")
+    phases = {}
+    for trace in complete:
+        for phase, seconds in trace.timeline():
+            phases.setdefault(phase, []).append(seconds * 1000)
+    for phase, _, _ in PHASES:
+        if phase in phases:
+            values = phases[phase]
+            print(f"   - {phase}: mean {sum(values) / len(values):.1f} ms, max {max(values):.1f} ms")
+    fit = scaling(complete)
+    if fit:
+        print(f"📈 Load time ≈ {fit[1]:.1f} ms + {fit[0]:.1f} ms per 1000 reminders fetched")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
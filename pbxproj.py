@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Reader, writer and canonicalizer for Xcode project.pbxproj files.
+
+The checked-in project was produced by one of two drifting generator
+scripts and then edited by hand in Xcode. This parses the old-style
+(OpenStep) plist with a streaming tokenizer and writes it back in Xcode's
+own layout, after canonicalizing it:
+
+    - objects not reachable from rootObject are removed
+    - duplicate build files for the same file within one build phase are removed
+    - target build settings equal to the project-level value of the same
+      configuration are removed (the target inherits them anyway)
+    - sections are ordered by isa and objects by id, as Xcode does;
+      group children and Sources/Resources phase files are sorted by name
+
+Usage:
+    python3 pbxproj.py [GetSh1tDone.xcodeproj/project.pbxproj] [--dry-run]
+    python3 pbxproj.py path/to/project.pbxproj -o canonical.pbxproj [--compact]
+    python3 pbxproj.py --check    # exit 1 if the file is not canonical
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from collections import deque
+
+HEADER = '// !$*UTF8*$!'
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'GetSh1tDone.xcodeproj', 'project.pbxproj')
+
+_TOKEN_RE = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<block>/\*.*?\*/)
+  | (?P<line>//[^\n]*(?:\n|$))
+  | (?P<quoted>"(?:[^"\\]|\\.)*")
+  | (?P<bare>(?:[^\s{}()=;,"/]|/(?![/*]))+)
+  | (?P<punct>[{}()=;,])
+''', re.S | re.X)
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\', "'": "'"}
+_UNQUOTED_RE = re.compile(r'^[A-Za-z0-9_$./]+$')
+
+# isas Xcode writes on a single line
+_INLINE_ISAS = {'PBXBuildFile', 'PBXFileReference'}
+_PHASE_NAMES = {
+    'PBXSourcesBuildPhase': 'Sources',
+    'PBXResourcesBuildPhase': 'Resources',
+    'PBXFrameworksBuildPhase': 'Frameworks',
+    'PBXHeadersBuildPhase': 'Headers',
+    'PBXShellScriptBuildPhase': 'ShellScript',
+    'PBXCopyFilesBuildPhase': 'CopyFiles',
+}
+_SORTED_PHASES = {'PBXSourcesBuildPhase', 'PBXResourcesBuildPhase'}
+_GROUP_ISAS = {'PBXGroup', 'PBXVariantGroup', 'XCVersionGroup'}
+
+
+class ParseError(ValueError):
+    pass
+
+
+# Reading ---------------------------------------------------------------------
+
+def tokenize(f, chunk_size=1 << 16):
+    """Yield (kind, text) tokens from a file object, reading it in chunks"""
+    buffer = ''
+    pos = 0
+    eof = False
+    while True:
+        if not eof and len(buffer) - pos < chunk_size // 4:
+            data = f.read(chunk_size)
+            eof = not data
+            buffer = buffer[pos:] + data
+            pos = 0
+        if pos >= len(buffer):
+            return
+        match = _TOKEN_RE.match(buffer, pos)
+        if match is None or (match.end() == len(buffer) and not eof):
+            if eof:
+                raise ParseError(f"unexpected input: {buffer[pos:pos + 40]!r}")
+            data = f.read(chunk_size)
+            eof = not data
+            buffer = buffer[pos:] + data
+            pos = 0
+            continue
+        pos = match.end()
+        kind = match.lastgroup
+        if kind in ('space', 'block', 'line'):
+            continue
+        text = match.group()
+        if kind == 'quoted':
+            text = re.sub(r'\\(.)', lambda m: _ESCAPES.get(m.group(1), m.group(1)), text[1:-1])
+            kind = 'string'
+        elif kind == 'bare':
+            kind = 'string'
+        yield kind, text
+
+
+def _parse_value(tokens, token):
+    kind, text = token
+    if kind == 'string':
+        return text
+    if text == '{':
+        result = {}
+        for kind, text in tokens:
+            if text == '}' and kind == 'punct':
+                return result
+            if kind != 'string':
+                raise ParseError(f"expected a key, got {text!r}")
+            key = text
+            if next(tokens, (None, None))[1] != '=':
+                raise ParseError(f"expected '=' after {key!r}")
+            result[key] = _parse_value(tokens, next(tokens))
+            if next(tokens, (None, None))[1] != ';':
+                raise ParseError(f"expected ';' after value of {key!r}")
+        raise ParseError('unterminated dictionary')
+    if text == '(':
+        result = []
+        for token in tokens:
+            if token == ('punct', ')'):
+                return result
+            result.append(_parse_value(tokens, token))
+            separator = next(tokens, (None, None))
+            if separator == ('punct', ')'):
+                return result
+            if separator != ('punct', ','):
+                raise ParseError("expected ',' in array")
+        raise ParseError('unterminated array')
+    raise ParseError(f"unexpected {text!r}")
+
+
+def load(f):
+    """Parse a project.pbxproj file object into nested dicts / lists / strings"""
+    tokens = tokenize(f)
+    first = next(tokens, None)
+    if first is None:
+        raise ParseError('empty file')
+    return _parse_value(tokens, first)
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return load(f)
+
+
+# Writing ---------------------------------------------------------------------
+
+def quote(text):
+    if _UNQUOTED_RE.match(text) and not text.startswith('//'):
+        return text
+    escaped = (text.replace('\\', '\\\\').replace('"', '\\"')
+               .replace('\n', '\\n').replace('\t', '\\t'))
+    return f'"{escaped}"'
+
+
+def _key_order(key):
+    return (key != 'isa', key)
+
+
+class _Writer:
+    def __init__(self, out, comments, compact):
+        self.out = out
+        self.comments = comments if not compact else {}
+        self.compact = compact
+
+    def ref(self, text):
+        comment = self.comments.get(text)
+        return f"{quote(text)} /* {comment} */" if comment else quote(text)
+
+    def inline(self, value):
+        if isinstance(value, dict):
+            return '{' + ''.join(f"{quote(k)} = {self.inline(value[k])}; "
+                                 for k in sorted(value, key=_key_order)) + '}'
+        if isinstance(value, list):
+            return '(' + ''.join(f"{self.inline(v)}, " for v in value) + ')'
+        return self.ref(value)
+
+    def value(self, value, depth):
+        if self.compact:
+            return self.inline(value)
+        pad = '\t' * depth
+        if isinstance(value, dict):
+            if value.get('isa') in _INLINE_ISAS:
+                return self.inline(value)
+            lines = ['{']
+            for key in sorted(value, key=_key_order):
+                lines.append(f"{pad}\t{quote(key)} = {self.value(value[key], depth + 1)};")
+            lines.append(pad + '}')
+            return '\n'.join(lines)
+        if isinstance(value, list):
+            lines = ['(']
+            for item in value:
+                lines.append(f"{pad}\t{self.value(item, depth + 1)},")
+            lines.append(pad + ')')
+            return '\n'.join(lines)
+        return self.ref(value)
+
+    def document(self, project):
+        w = self.out.write
+        w(HEADER + '\n{\n')
+        for key in sorted(project):
+            if key == 'objects':
+                self.objects(project['objects'])
+            else:
+                w(f"\t{quote(key)} = {self.value(project[key], 1)};\n")
+        w('}\n')
+
+    def objects(self, objects):
+        w = self.out.write
+        w('\tobjects = {\n')
+        sections = {}
+        for object_id, body in objects.items():
+            sections.setdefault(body.get('isa', ''), []).append(object_id)
+        for isa in sorted(sections):
+            w(f"\n/* Begin {isa} section */\n")
+            for object_id in sorted(sections[isa]):
+                w(f"\t\t{self.ref(object_id)} = {self.value(objects[object_id], 2)};\n")
+            w(f"/* End {isa} section */\n")
+        w('\t};\n')
+
+
+def object_comments(project, project_name='GetSh1tDone'):
+    """The /* ... */ annotation Xcode writes after each object id"""
+    objects = project.get('objects', {})
+    comments = {}
+    phase_of = {}
+    for object_id, body in objects.items():
+        isa = body.get('isa')
+        if isa in _PHASE_NAMES:
+            for build_file in body.get('files', []):
+                phase_of[build_file] = body.get('name', _PHASE_NAMES[isa])
+    owners = {}
+    for object_id, body in objects.items():
+        config_list = body.get('buildConfigurationList')
+        if config_list:
+            name = project_name if body.get('isa') == 'PBXProject' else body.get('name', '')
+            owners[config_list] = f'{body.get("isa")} "{name}"'
+
+    def display_name(object_id):
+        body = objects.get(object_id, {})
+        return body.get('name') or body.get('path')
+
+    for object_id, body in objects.items():
+        isa = body.get('isa')
+        if isa == 'PBXBuildFile':
+            target = body.get('fileRef') or body.get('productRef')
+            name = display_name(target) or objects.get(target, {}).get('productName')
+            if name:
+                comments[object_id] = f"{name} in {phase_of.get(object_id, 'Sources')}"
+        elif isa in _PHASE_NAMES:
+            comments[object_id] = body.get('name', _PHASE_NAMES[isa])
+        elif isa == 'PBXProject':
+            comments[object_id] = 'Project object'
+        elif isa == 'XCConfigurationList':
+            comments[object_id] = f"Build configuration list for {owners.get(object_id, 'PBXProject')}"
+        elif isa in ('PBXContainerItemProxy', 'PBXTargetDependency'):
+            comments[object_id] = isa
+        else:
+            name = display_name(object_id)
+            if name:
+                comments[object_id] = name
+    return comments
+
+
+def dump(project, out, project_name='GetSh1tDone', compact=False):
+    """Write a parsed project in Xcode's layout (or without comments/indentation)"""
+    _Writer(out, object_comments(project, project_name), compact).document(project)
+
+
+# Canonicalizing --------------------------------------------------------------
+
+def _references(value, objects, found):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in objects:
+                found.append(key)
+            _references(item, objects, found)
+    elif isinstance(value, list):
+        for item in value:
+            _references(item, objects, found)
+    elif value in objects:
+        found.append(value)
+
+
+def reachable(project):
+    """Ids of every object reachable from rootObject"""
+    objects = project.get('objects', {})
+    seen = set()
+    queue = deque([project.get('rootObject')])
+    while queue:
+        object_id = queue.popleft()
+        if object_id in seen or object_id not in objects:
+            continue
+        seen.add(object_id)
+        found = []
+        _references(objects[object_id], objects, found)
+        queue.extend(found)
+    return seen
+
+
+def _inherits(value):
+    """Whether a build setting value refers to $(inherited)"""
+    if isinstance(value, list):
+        return any(_inherits(item) for item in value)
+    return isinstance(value, str) and '$(inherited)' in value
+
+
+def canonicalize(project):
+    """Canonicalize a parsed project in place; returns counts of what changed"""
+    objects = project.get('objects', {})
+    stats = {'duplicate_build_files': 0, 'unreachable_objects': 0, 'redundant_settings': 0}
+
+    def sort_key(object_id):
+        body = objects.get(object_id, {})
+        return ((body.get('name') or body.get('path') or '').lower(), object_id)
+
+    for body in objects.values():
+        isa = body.get('isa')
+        if isa in _PHASE_NAMES:
+            seen_refs = set()
+            kept = []
+            for build_file in body.get('files', []):
+                ref = objects.get(build_file, {}).get('fileRef')
+                if ref is not None and ref in seen_refs:
+                    stats['duplicate_build_files'] += 1
+                    continue
+                seen_refs.add(ref)
+                kept.append(build_file)
+            if isa in _SORTED_PHASES:
+                kept.sort(key=lambda bf: sort_key(objects.get(bf, {}).get('fileRef', bf)))
+            body['files'] = kept
+
+    keep = reachable(project)
+    for object_id in list(objects):
+        if object_id not in keep:
+            del objects[object_id]
+            stats['unreachable_objects'] += 1
+
+    root = objects.get(project.get('rootObject'), {})
+    main_group = root.get('mainGroup')
+    products = root.get('productRefGroup')
+    for object_id, body in objects.items():
+        if body.get('isa') in _GROUP_ISAS and 'children' in body:
+            children = sorted(body['children'], key=sort_key)
+            if object_id == main_group and products in children:
+                children.remove(products)
+                children.append(products)
+            body['children'] = children
+
+    project_configs = {}
+    project_list = objects.get(root.get('buildConfigurationList'), {})
+    for config_id in project_list.get('buildConfigurations', []):
+        config = objects.get(config_id, {})
+        if 'baseConfigurationReference' not in config:
+            project_configs[config.get('name')] = config.get('buildSettings', {})
+    for target_id in root.get('targets', []):
+        target_list = objects.get(objects.get(target_id, {}).get('buildConfigurationList'), {})
+        for config_id in target_list.get('buildConfigurations', []):
+            config = objects.get(config_id, {})
+            inherited = project_configs.get(config.get('name'))
+            if inherited is None or 'baseConfigurationReference' in config:
+                continue
+            settings = config.get('buildSettings', {})
+            for key in list(settings):
+                # $(inherited) depends on the level it is written at, so it is never redundant
+                if _inherits(settings[key]):
+                    continue
+                if key in inherited and inherited[key] == settings[key]:
+                    del settings[key]
+                    stats['redundant_settings'] += 1
+    return stats
+
+
+# Querying --------------------------------------------------------------------
+
+def reference_paths(project):
+    """({file reference id: path}, {group path: group id}), paths relative to the project dir"""
+    objects = project['objects']
+    paths = {}
+    groups = {}
+
+    def walk(group_id, base):
+        groups.setdefault(base, group_id)
+        for child in objects.get(group_id, {}).get('children', []):
+            body = objects.get(child, {})
+            tree = body.get('sourceTree')
+            if tree == '<group>':
+                path = os.path.normpath(os.path.join(base, body['path'])) if body.get('path') else base
+            elif tree == 'SOURCE_ROOT':
+                path = body.get('path', '')
+            else:
+                continue
+            if 'children' in body:
+                walk(child, path)
+            else:
+                paths[child] = path
+
+    walk(objects[project['rootObject']]['mainGroup'], '')
+    return paths, groups
+
+
+def phase_name(phase):
+    """'Sources', 'Resources', ... for a build phase body"""
+    return _PHASE_NAMES.get(phase.get('isa'), phase.get('name') or phase.get('isa'))
+
+
+def phase_files(project, phase, paths=None):
+    """Paths (or, for SDK and built products, source-tree-qualified names) a build phase consumes"""
+    objects = project['objects']
+    paths = reference_paths(project)[0] if paths is None else paths
+    files = []
+    for build_file in phase.get('files', []):
+        ref = objects.get(build_file, {}).get('fileRef')
+        if ref in paths:
+            files.append(paths[ref])
+        elif ref in objects:
+            body = objects[ref]
+            files.append(f"{body.get('sourceTree', '')}/{body.get('path', body.get('name', ref))}")
+    return files
+
+
+def build_settings(project, target):
+    """{configuration name: target settings over the project-level ones} for a target body"""
+    objects = project['objects']
+
+    def configurations(list_id):
+        return {objects[c].get('name'): objects[c].get('buildSettings', {})
+                for c in objects.get(list_id, {}).get('buildConfigurations', []) if c in objects}
+
+    inherited = configurations(objects[project['rootObject']].get('buildConfigurationList'))
+    return {name: {**inherited.get(name, {}), **settings}
+            for name, settings in configurations(target.get('buildConfigurationList')).items()}
+
+
+def project_name_for(path, project):
+    """The .xcodeproj name; outside a bundle, the first target's name"""
+    directory = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    if directory.endswith('.xcodeproj'):
+        return directory[:-len('.xcodeproj')]
+    objects = project.get('objects', {})
+    targets = objects.get(project.get('rootObject'), {}).get('targets', [])
+    return objects.get(targets[0], {}).get('name', 'Project') if targets else 'Project'
+
+
+def write_atomic(path, project, project_name, compact=False):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.project.pbxproj.')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as out:
+            dump(project, out, project_name, compact)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('path', nargs='?', default=DEFAULT_PATH, help='project.pbxproj to canonicalize')
+    parser.add_argument('-o', '--output', help='write here instead of rewriting the input')
+    parser.add_argument('--compact', action='store_true',
+                        help='omit comments and indentation (smallest file; Xcode restores them on save)')
+    parser.add_argument('--dry-run', action='store_true', help='report what would change, write nothing')
+    parser.add_argument('--check', action='store_true', help='exit 1 if the file is not canonical')
+    args = parser.parse_args()
+
+    project = read(args.path)
+    stats = canonicalize(project)
+    name = project_name_for(args.path, project)
+
+    if args.check or args.dry_run:
+        import io
+        buffer = io.StringIO()
+        dump(project, buffer, name, args.compact)
+        with open(args.path, encoding='utf-8') as f:
+            original = f.read()
+        canonical = buffer.getvalue() == original
+        print(f"{'✅' if canonical else '⚠️ '} {args.path}: "
+              f"{len(original)} -> {len(buffer.getvalue())} bytes; " +
+              ', '.join(f"{v} {k.replace('_', ' ')}" for k, v in stats.items()))
+        return 0 if canonical or not args.check else 1
+
+    before = os.path.getsize(args.path)
+    output = args.output or args.path
+    write_atomic(output, project, name, args.compact)
+    print(f"✅ Wrote {output} ({before} -> {os.path.getsize(output)} bytes)")
+    for key, value in stats.items():
+        print(f"   - {key.replace('_', ' ')}: {value}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
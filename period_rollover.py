@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Batch time-period tag rollover.
+
+setTimePeriodTag and removeTimePeriodTag rewrite one reminder per call,
+each with its own save(commit: true) and a full loadReminders. At a day,
+week, month or quarter boundary whole groups of tasks change period at
+once. This finds every unfinished task whose period tag has ended in one
+pass over a snapshot and emits only the reminders whose notes change,
+carrying the notes the app would end up with (setTimePeriodTag or
+removeTimePeriodTag, then the normalizeTaskTagsAndNotes of the next
+load), so the whole set can be saved with commit: false and committed
+once.
+
+What happens to a task whose period ended depends on the policy:
+
+    release   move to the next longer period still running (default):
+              #today -> #thisweek -> #thismonth -> #thisquarter -> none
+    escalate  move to #today
+    clear     drop the tag
+
+Usage:
+    python3 period_rollover.py snapshot.jsonl --boundary week [--policy release] [--json]
+    python3 period_rollover.py export.ics --boundary day --to rolled.jsonl
+    python3 period_rollover.py --benchmark 100000
+"""
+import argparse
+import json
+import sys
+import time
+from collections import Counter, namedtuple
+from dataclasses import replace
+
+from reminders_model import (
+    TIME_PERIOD_TAGS, load_tasks, normalize_notes, read_snapshot, remove_time_period_tag,
+    set_time_period_tag, start_of_day, synthetic_corpus, to_task, write_snapshot,
+)
+
+# Period tags that end at each boundary; a new week, month or quarter is also a new day
+ENDS = {
+    'day': {'#today'},
+    'week': {'#today', '#thisweek'},
+    'month': {'#today', '#thismonth'},
+    'quarter': {'#today', '#thismonth', '#thisquarter'},
+}
+POLICIES = ('release', 'escalate', 'clear')
+
+# One reminder's period change: `before` lists its period tags, `after` is
+# the single tag it keeps (None when it ends up untagged) and `notes` the
+# notes to save.
+Transition = namedtuple('Transition', 'id title quadrant before after notes')
+
+
+def next_period(tag, boundary, policy):
+    """Where a task tagged `tag` goes at `boundary` (the tag itself if it has not ended)"""
+    ended = ENDS[boundary]
+    if tag not in ended:
+        return tag
+    if policy == 'escalate':
+        return '#today'
+    if policy == 'clear':
+        return None
+    for longer in TIME_PERIOD_TAGS[TIME_PERIOD_TAGS.index(tag) + 1:]:
+        if longer not in ended:
+            return longer
+    return None
+
+
+def transition(task, boundary, policy='release'):
+    """The Transition for one loaded TaskItem, or None if its period tags still stand"""
+    present = {t.lower() for t in task.tags}
+    before = [t for t in TIME_PERIOD_TAGS if t in present]
+    if not ENDS[boundary].intersection(before):
+        return None
+    targets = {next_period(tag, boundary, policy) for tag in before} - {None}
+    if targets == set(before):
+        return None
+    # setTimePeriodTag keeps a single period tag; the shortest commitment wins
+    after = min(targets, key=TIME_PERIOD_TAGS.index) if targets else None
+    if after is not None:
+        notes = set_time_period_tag(task.notes, task.quadrant, after)
+    else:
+        notes = task.notes
+        for tag in before:
+            notes = remove_time_period_tag(notes, task.quadrant, tag)
+    notes, _ = normalize_notes(notes, task.quadrant)
+    return Transition(task.id, task.title, task.quadrant, before, after, notes)
+
+
+def rollover(reminders, boundary, policy='release', now=None):
+    """Yield a Transition for every unfinished task whose period tag ended at `boundary`
+
+    Completed tasks are left alone: they drop out of the task list once
+    the day they were completed is over.
+    """
+    today_start = start_of_day(time.time() if now is None else now)
+    for reminder in reminders:
+        if reminder.is_completed:
+            continue
+        task = to_task(reminder, today_start)
+        if task is None:
+            continue
+        change = transition(task, boundary, policy)
+        if change is not None and change.notes != reminder.notes:
+            yield change
+
+
+def apply(reminders, transitions, now=None):
+    """Copy of the snapshot with the transitions' notes saved (lastModifiedDate bumped)"""
+    now = time.time() if now is None else now
+    notes = {t.id: t.notes for t in transitions}
+    result = []
+    for reminder in reminders:
+        if reminder.id in notes:
+            reminder = replace(reminder, notes=notes[reminder.id], last_modified=now)
+        result.append(reminder)
+    return result
+
+
+def benchmark(count):
+    """Batch rollover against the per-task path on a synthetic snapshot
+
+    The per-task path is estimated as one full loadReminders pass per
+    transition, which is what every setTimePeriodTag call triggers.
+    """
+    reminders = synthetic_corpus(count)
+    start = time.perf_counter()
+    load_tasks(reminders)
+    reload_s = time.perf_counter() - start
+    rows = []
+    for boundary in ENDS:
+        start = time.perf_counter()
+        changes = list(rollover(reminders, boundary))
+        batch_s = time.perf_counter() - start
+        rows.append({'boundary': boundary, 'transitions': len(changes), 'batch_s': batch_s,
+                     'per_task_s': reload_s * len(changes)})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('snapshot', nargs='?', help='.json / .jsonl snapshot or .ics export')
+    parser.add_argument('--boundary', choices=list(ENDS), help='the period that just started')
+    parser.add_argument('--policy', choices=POLICIES, default='release',
+                        help='what happens to a task whose period ended (default: release)')
+    parser.add_argument('--json', action='store_true', help='print one JSON record per changed reminder')
+    parser.add_argument('--to', help='write the rolled-over snapshot (.jsonl) here')
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help='time batch rollover against per-task saves on N synthetic reminders')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(f"📊 Rollover of {args.benchmark} reminders (release policy)")
+        print(f"{'boundary':>9} {'moves':>7} {'batch ms':>9} {'per-task s (est.)':>18}")
+        for row in benchmark(args.benchmark):
+            print(f"{row['boundary']:>9} {row['transitions']:>7} {row['batch_s'] * 1000:>9.1f} "
+                  f"{row['per_task_s']:>18.1f}")
+        return 0
+    if not args.snapshot or not args.boundary:
+        parser.error('a snapshot and --boundary are required (or use --benchmark)')
+
+    reminders = read_snapshot(args.snapshot)
+    changes = list(rollover(reminders, args.boundary, args.policy))
+    if args.json:
+        for change in changes:
+            print(json.dumps(change._asdict(), ensure_ascii=False))
+    else:
+        print(f"🔁 {len(changes)} of {len(reminders)} reminders change at the new {args.boundary}")
+        moves = Counter((' '.join(c.before), c.after or '(none)') for c in changes)
+        for (before, after), count in moves.most_common():
+            print(f"   - {before} → {after}: {count}")
+    if args.to:
+        write_snapshot(args.to, apply(reminders, changes))
+        print(f"✅ Wrote {args.to}", file=sys.stderr if args.json else sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Date-range index for Prepare-list queries.
+
+fetchPrepareReminders and prepareSessionForToday/Week/Month/Quarter each
+refetch the whole Prepare list and linearly re-check the "Prepare-"
+prefix, the today suffix and the weekStart/monthStart/quarterStart
+creationDate windows. This indexes an exported Prepare list once (sorted
+by creationDate) and answers every window with bisect, so all four
+session queries come out of one pass over the data.
+
+Usage:
+    python3 prepare_index.py prepare.jsonl [--week-day 2] [--now 2025-01-20T09:00]
+    python3 prepare_index.py --synthetic-years 5 [--quarter-start 4]
+"""
+import argparse
+import bisect
+import re
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from reminders_model import Reminder, parse_date, read_snapshot
+
+PREFIX = 'Prepare-'
+PERIODS = ['day', 'week', 'month', 'quarter']
+# PreparePeriod.reminderListName
+LIST_NAMES = {'day': 'today', 'week': 'this week', 'month': 'this month', 'quarter': 'this quarter'}
+
+# prepareQuestionFromTitle suffixes: week, today, month, quarter
+_SUFFIX_PATTERNS = [
+    re.compile(r'-w/c-\d{1,2} [A-Za-z]{3} \d{2}$'),
+    re.compile(r'-\d{1,2} [A-Za-z]{3} \d{2}$'),
+    re.compile(r'-[A-Za-z]{3} \d{4}$'),
+    re.compile(r'-Q[1-4]$'),
+]
+
+PrepareEntry = namedtuple('PrepareEntry', 'created id title question answer is_completed')
+# Result of one prepareSessionFor* query: entries to prefill (oldest first)
+# and the ids of earlier, still incomplete entries the app would complete.
+Session = namedtuple('Session', 'start end entries to_complete')
+
+_MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def question_from_title(title, prefix=PREFIX):
+    """prepareQuestionFromTitle: strip the prefix and the period suffix"""
+    rest = title[len(prefix):] if title.startswith(prefix) else title
+    for pattern in _SUFFIX_PATTERNS:
+        match = pattern.search(rest)
+        if match:
+            return rest[:match.start()].strip()
+    return rest.strip()
+
+
+def day_suffix(dt):
+    """The "d MMM yy" title suffix addPrepareReminders writes (en_US month names)"""
+    return f"{dt.day} {_MONTHS[dt.month - 1]} {dt.year % 100:02d}"
+
+
+def add_months(dt, months):
+    index = dt.year * 12 + dt.month - 1 + months
+    return dt.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def period_boundaries(now=None, week_day=2, quarter_start_month=1):
+    """Local [start, end) datetimes for the current day, prep week, month and quarter
+
+    week_day uses Calendar.weekday numbering (1 = Sunday ... 7 = Saturday);
+    the week entry is None when week_day is out of range, matching
+    startOfCurrentWeek. Quarters before the start month belong to the
+    previous year (the app's startOfCurrentQuarter always uses the current
+    year, which lands in the future for e.g. startMonth 11 in January).
+    """
+    now = datetime.now() if now is None else now
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    bounds = {'day': (today, today + timedelta(days=1))}
+    if 1 <= week_day <= 7:
+        weekday = (now.weekday() + 1) % 7 + 1
+        start = today - timedelta(days=(weekday - week_day) % 7)
+        bounds['week'] = (start, start + timedelta(days=7))
+    else:
+        bounds['week'] = None
+    month = today.replace(day=1)
+    bounds['month'] = (month, add_months(month, 1))
+    since_start = (now.month - quarter_start_month) % 12
+    quarter = add_months(month, -(since_start % 3))
+    bounds['quarter'] = (quarter, add_months(quarter, 3))
+    return bounds
+
+
+class PrepareIndex:
+    """Prepare- reminders of one list, sorted by creation date"""
+
+    def __init__(self, reminders, list_name=None):
+        wanted = list_name.lower() if list_name else None
+        entries = []
+        for r in reminders:
+            if not r.title.startswith(PREFIX):
+                continue
+            if wanted is not None and r.calendar.lower() != wanted:
+                continue
+            # Missing creationDate sorts as .distantPast, like the app
+            created = r.creation_date if r.creation_date is not None else float('-inf')
+            entries.append(PrepareEntry(created, r.id, r.title, question_from_title(r.title),
+                                        r.notes.strip(), r.is_completed))
+        entries.sort(key=lambda e: e.created)
+        self.entries = entries
+        self.created = [e.created for e in entries]
+        self.incomplete = [i for i, e in enumerate(entries) if not e.is_completed]
+        self.incomplete_created = [entries[i].created for i in self.incomplete]
+        self.by_suffix = {}
+        for i, e in enumerate(entries):
+            match = _SUFFIX_PATTERNS[1].search(e.title)
+            if match:
+                self.by_suffix.setdefault(match.group()[1:], []).append(i)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def range(self, start, end=None):
+        """Indexes of entries created in [start, end) (epoch seconds)"""
+        lo = bisect.bisect_left(self.created, start)
+        hi = len(self.created) if end is None else bisect.bisect_left(self.created, end)
+        return range(lo, hi)
+
+    def session(self, start, end=None):
+        """One prepareSessionFor* call for the window [start, end)"""
+        entries = [self.entries[i] for i in self.range(start, end)]
+        stale = bisect.bisect_left(self.incomplete_created, start)
+        to_complete = [self.entries[i].id for i in self.incomplete[:stale]]
+        return Session(start, end, entries, to_complete)
+
+    def fetch(self, incomplete_only=False, today=None, week_start=None,
+              month_start=None, quarter_start=None):
+        """fetchPrepareReminders; window starts are local datetimes"""
+        start, end = float('-inf'), None
+        windows = [(week_start, timedelta(days=7)), (month_start, 1), (quarter_start, 3)]
+        for window_start, length in windows:
+            if window_start is None:
+                continue
+            if isinstance(length, int):
+                window_end = add_months(window_start, length)
+            else:
+                window_end = window_start + length
+            start = max(start, window_start.timestamp())
+            end = window_end.timestamp() if end is None else min(end, window_end.timestamp())
+        if end is not None and end <= start:
+            return []
+        candidates = self.range(start, end)
+        if today is not None:
+            suffix = self.by_suffix.get(day_suffix(today), [])
+            lo, hi = candidates.start, candidates.stop
+            candidates = [i for i in suffix if lo <= i < hi]
+        result = []
+        for i in candidates:
+            e = self.entries[i]
+            if incomplete_only and e.is_completed:
+                continue
+            result.append((e.question, e.answer))
+        return result
+
+
+def build_indexes(reminders):
+    """One PrepareIndex per list (lowercased name), from a single pass"""
+    by_list = {}
+    for r in reminders:
+        if r.title.startswith(PREFIX):
+            by_list.setdefault(r.calendar.lower(), []).append(r)
+    return {name: PrepareIndex(items) for name, items in by_list.items()}
+
+
+def prepare_sessions(indexes, now=None, week_day=2, quarter_start_month=1, list_names=LIST_NAMES):
+    """All four prepareSessionFor* results for one point in time"""
+    bounds = period_boundaries(now, week_day, quarter_start_month)
+    empty = PrepareIndex([])
+    result = {}
+    for period in PERIODS:
+        window = bounds[period]
+        if window is None:
+            result[period] = None
+            continue
+        index = indexes.get(list_names[period].lower(), empty)
+        start = window[0].timestamp()
+        # prepareSessionForToday has no upper bound
+        end = None if period == 'day' else window[1].timestamp()
+        result[period] = index.session(start, end)
+    return result
+
+
+def synthetic_history(years=5, per_day=3, now=None):
+    """Daily/weekly/monthly/quarterly Prepare reminders for the last `years` years"""
+    now = datetime.now() if now is None else now
+    first = now - timedelta(days=365 * years)
+    reminders = []
+    day = first.replace(hour=7, minute=30, second=0, microsecond=0)
+    count = 0
+    while day <= now:
+        lists = [('today', f"-{day_suffix(day)}", per_day)]
+        if day.weekday() == 0:
+            lists.append(('this week', f"-w/c-{day_suffix(day)}", 3))
+        if day.day == 1:
+            lists.append(('this month', f"-{_MONTHS[day.month - 1]} {day.year}", 3))
+            if day.month % 3 == 1:
+                lists.append(('this quarter', f"-Q{(day.month - 1) // 3 + 1}", 4))
+        for list_name, suffix, questions in lists:
+            for q in range(questions):
+                count += 1
+                reminders.append(Reminder(
+                    id=f"P{count:08d}",
+                    title=f"{PREFIX}Question {q + 1}{suffix}",
+                    notes=f"Answer {q + 1}",
+                    calendar=list_name,
+                    last_modified=day.timestamp(),
+                    creation_date=day.timestamp() + q,
+                    is_completed=day.date() < now.date() and q % 5 != 0,
+                ))
+        day += timedelta(days=1)
+    return reminders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('snapshot', nargs='?', help='exported Prepare lists (.json / .jsonl)')
+    parser.add_argument('--week-day', type=int, default=2, help='prep week start, 1 = Sunday ... 7 = Saturday')
+    parser.add_argument('--quarter-start', type=int, default=1, help='first month of Q1 (1-12)')
+    parser.add_argument('--now', help='evaluate at this ISO 8601 local time instead of now')
+    parser.add_argument('--synthetic-years', type=int, help='index a synthetic history instead of a snapshot')
+    args = parser.parse_args()
+
+    if not 1 <= args.quarter_start <= 12:
+        parser.error('--quarter-start must be between 1 and 12')
+    now = datetime.fromtimestamp(parse_date(args.now)) if args.now else datetime.now()
+    if args.synthetic_years:
+        reminders = synthetic_history(args.synthetic_years, now=now)
+    elif args.snapshot:
+        reminders = read_snapshot(args.snapshot)
+    else:
+        parser.error('a snapshot or --synthetic-years is required')
+
+    start = time.perf_counter()
+    indexes = build_indexes(reminders)
+    built = time.perf_counter()
+    sessions = prepare_sessions(indexes, now, args.week_day, args.quarter_start)
+    answered = time.perf_counter()
+
+    total = sum(len(index) for index in indexes.values())
+    print(f"📋 Indexed {total} Prepare reminders in {len(indexes)} lists "
+          f"in {(built - start) * 1000:.1f} ms")
+    for period in PERIODS:
+        session = sessions[period]
+        if session is None:
+            print(f"   - {LIST_NAMES[period]}: (no prep week day configured)")
+            continue
+        print(f"   - {LIST_NAMES[period]}: {len(session.entries)} to prefill, "
+              f"{len(session.to_complete)} earlier to complete")
+    print(f"⏱️  Four session queries in {(answered - built) * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
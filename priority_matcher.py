@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Inverted-index priority matcher for bulk quadrant suggestions.
+
+PrioritiesView keeps a top-5 priorities list, but matching tasks against
+it only happens in the user's head. This tokenizes task titles and notes
+into an inverted index with TF-IDF weights, scores every task against the
+priorities by walking only the postings of priority terms, and proposes
+an Eisenhower quadrant for the whole backlog in one batch:
+
+    important = cosine similarity to some priority >= --threshold
+    urgent    = #today / #thisweek tag, or due within --due-days (or overdue)
+
+Untagged reminders, which loadReminders drops, are included.
+
+Usage:
+    python3 priority_matcher.py reminders.jsonl priorities.json [--untagged-only]
+    python3 priority_matcher.py --synthetic 100000
+
+Priorities are the PrioritiesView JSON ([{"text": ...}, ...]), a JSON list
+of strings, or a text file with one priority per line.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+from collections import namedtuple
+
+from reminders_model import (
+    classify, extract_tags, read_snapshot, strip_hashtags, synthetic_corpus, tokenize,
+)
+
+URGENT_TAGS = {'#today', '#thisweek'}
+
+Suggestion = namedtuple('Suggestion', 'id title current suggested priority score urgent')
+
+
+class PriorityMatcher:
+    """TF-IDF inverted index over a batch of reminders"""
+
+    def __init__(self, reminders):
+        self.reminders = reminders
+        self.postings = {}
+        for doc, reminder in enumerate(reminders):
+            counts = {}
+            for token in tokenize(f"{reminder.title} {strip_hashtags(reminder.notes)}"):
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                self.postings.setdefault(token, []).append((doc, tf))
+        total = len(reminders)
+        self.idf = {term: math.log((1 + total) / (1 + len(p))) + 1.0
+                    for term, p in self.postings.items()}
+        self.norms = [0.0] * total
+        for term, postings in self.postings.items():
+            idf = self.idf[term]
+            for doc, tf in postings:
+                self.norms[doc] += (tf * idf) ** 2
+        self.norms = [math.sqrt(n) for n in self.norms]
+
+    def score(self, priorities):
+        """Best (priority index, cosine) per reminder; unmatched reminders are absent"""
+        best = {}
+        for index, text in enumerate(priorities):
+            counts = {}
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + 1
+            weights = {t: tf * self.idf.get(t, 0.0) for t, tf in counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values()))
+            if not norm:
+                continue
+            scores = {}
+            for term, weight in weights.items():
+                idf = self.idf.get(term)
+                if idf is None:
+                    continue
+                for doc, tf in self.postings[term]:
+                    scores[doc] = scores.get(doc, 0.0) + tf * idf * weight
+            for doc, dot in scores.items():
+                cosine = dot / (norm * self.norms[doc])
+                if doc not in best or cosine > best[doc][1]:
+                    best[doc] = (index, cosine)
+        return best
+
+
+def urgency(reminder, now, due_days):
+    """Why a reminder counts as urgent, or None"""
+    for tag in extract_tags(reminder.notes):
+        if tag.lower() in URGENT_TAGS:
+            return tag.lower()
+    if reminder.due_date is not None and reminder.due_date <= now + due_days * 86400:
+        return 'overdue' if reminder.due_date < now else 'due soon'
+    return None
+
+
+def suggest(reminders, priorities, now=None, threshold=0.15, due_days=7):
+    """Suggestion per incomplete reminder, in input order"""
+    now = time.time() if now is None else now
+    open_reminders = [r for r in reminders if not r.is_completed]
+    matches = PriorityMatcher(open_reminders).score(priorities)
+    suggestions = []
+    for doc, reminder in enumerate(open_reminders):
+        priority, score = matches.get(doc, (None, 0.0))
+        important = score >= threshold
+        urgent = urgency(reminder, now, due_days)
+        if important:
+            quadrant = 'Do Now' if urgent else 'Schedule'
+        else:
+            quadrant = 'Delegate' if urgent else 'Bin / Challenge'
+        suggestions.append(Suggestion(
+            reminder.id, reminder.title, classify(reminder), quadrant,
+            priorities[priority] if important else None, round(score, 4), urgent))
+    return suggestions
+
+
+def read_priorities(path):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith('['):
+        return [p['text'] if isinstance(p, dict) else str(p) for p in json.loads(text)]
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+SAMPLE_PRIORITIES = [
+    'Get the quarterly report and budget signed off',
+    'Ship the product roadmap',
+    'Sort out personal finance and tax return',
+    'Health: dentist and exercise',
+    'Plan the team offsite',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('snapshot', nargs='?', help='reminders (.json / .jsonl)')
+    parser.add_argument('priorities', nargs='?', help='priorities file')
+    parser.add_argument('--threshold', type=float, default=0.15, help='minimum cosine for "important"')
+    parser.add_argument('--due-days', type=float, default=7, help='due within this many days is urgent')
+    parser.add_argument('--untagged-only', action='store_true',
+                        help='only suggest for reminders without a quadrant tag')
+    parser.add_argument('--synthetic', type=int, help='match a synthetic corpus of this size')
+    parser.add_argument('--json', action='store_true', help='print suggestions as JSON Lines')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        reminders = synthetic_corpus(args.synthetic)
+        priorities = SAMPLE_PRIORITIES
+    elif args.snapshot and args.priorities:
+        reminders = read_snapshot(args.snapshot)
+        priorities = read_priorities(args.priorities)
+    else:
+        parser.error('a snapshot and priorities file are required (or use --synthetic)')
+
+    start = time.perf_counter()
+    suggestions = suggest(reminders, priorities, threshold=args.threshold, due_days=args.due_days)
+    elapsed = time.perf_counter() - start
+    if args.untagged_only:
+        suggestions = [s for s in suggestions if s.current is None]
+
+    if args.json:
+        for s in suggestions:
+            print(json.dumps(s._asdict(), ensure_ascii=False))
+        return 0
+    counts = {}
+    changed = 0
+    for s in suggestions:
+        counts[s.suggested] = counts.get(s.suggested, 0) + 1
+        changed += s.current is not None and s.current != s.suggested
+    print(f"🎯 {len(suggestions)} suggestions in {elapsed * 1000:.0f} ms")
+    for quadrant, count in sorted(counts.items()):
+        print(f"   - {quadrant}: {count}")
+    untagged = sum(1 for s in suggestions if s.current is None)
+    print(f"🏷️  {untagged} currently untagged, {changed} tagged differently")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
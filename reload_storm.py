@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Change-notification storm simulator for reload strategies.
+
+setupEventStoreNotifications spawns a new `Task { await loadReminders() }`
+for every .EKEventStoreChanged, with no coalescing. This replays recorded
+or synthetic notification bursts against cost models of:
+
+    full         one full reload per notification (current behaviour)
+    debounced    one full reload once notifications go quiet for --debounce-ms
+    coalesced    single-flight: at most one reload running and one queued
+    incremental  one incremental diff refresh per notification
+
+and reports total work, p50/p99 staleness (notification -> first reload
+that observed it finishes) and the number of redundant reloads (reloads
+that observed no new notification).
+
+Usage:
+    python3 reload_storm.py [notifications.txt] [--reminders 5000]
+    python3 reload_storm.py --bursts 20 --burst-size 8 --calibrate
+
+A recording is one notification per line ("<seconds> [changes]") or a JSON
+list of seconds / {"t": seconds, "changes": n} objects.
+"""
+import argparse
+import heapq
+import json
+import math
+import random
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+
+STRATEGIES = ['full', 'debounced', 'coalesced', 'incremental']
+
+
+@dataclass
+class CostModel:
+    """Milliseconds spent by one reload of a list with `reminders` items"""
+    reminders: int = 5000
+    full_fixed_ms: float = 15.0
+    full_per_item_ms: float = 0.008
+    inc_fixed_ms: float = 2.0
+    inc_per_item_ms: float = 0.0005
+    inc_per_change_ms: float = 0.01
+
+    def full(self, changes):
+        return self.full_fixed_ms + self.full_per_item_ms * self.reminders
+
+    def incremental(self, changes):
+        return (self.inc_fixed_ms + self.inc_per_item_ms * self.reminders
+                + self.inc_per_change_ms * changes)
+
+    @classmethod
+    def calibrate(cls, reminders, sample=20000):
+        """Measure per-item costs with the Python model from reminders_diff"""
+        from reminders_diff import IncrementalLoader, diff_snapshots
+        from reminders_model import churn, load_tasks, synthetic_corpus
+
+        now = time.time()
+        base = synthetic_corpus(sample, now=now - 60)
+        changed = churn(base, 0.05, now=now)
+        start = time.perf_counter()
+        load_tasks(changed, now)
+        full_per_item = (time.perf_counter() - start) * 1000 / sample
+
+        loader = IncrementalLoader()
+        loader.full_reload(base, now)
+        start = time.perf_counter()
+        diff_snapshots(loader.stamps, changed)
+        per_item = (time.perf_counter() - start) * 1000 / sample
+        start = time.perf_counter()
+        changes = loader.refresh(changed, now)
+        per_change = max((time.perf_counter() - start) * 1000
+                         - per_item * sample, 0.0) / max(changes.reclassified, 1)
+        return cls(reminders=reminders, full_per_item_ms=full_per_item,
+                   inc_per_item_ms=per_item, inc_per_change_ms=per_change)
+
+
+class Simulator:
+    """Discrete-event replay of one strategy on the main actor's serial executor"""
+
+    def __init__(self, strategy, costs, debounce_ms=300.0):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy '{strategy}'")
+        self.strategy = strategy
+        self.costs = costs
+        self.debounce = debounce_ms / 1000.0
+        self.events = []
+        self.seq = 0
+        self.queue = deque()
+        self.busy = False
+        self.dirty = False
+        self.timer_token = 0
+        self.notifications = []
+        self.observed = 0          # notifications already seen by a started reload
+        self.unapplied_changes = 0
+        self.staleness = []
+        self.reloads = 0
+        self.redundant = 0
+        self.work = 0.0
+        self.runs = []             # (start, end, notification indexes observed) per reload
+
+    def _push(self, t, kind, payload=None):
+        self.seq += 1
+        heapq.heappush(self.events, (t, self.seq, kind, payload))
+
+    def run(self, notifications):
+        self.notifications = sorted(notifications)
+        self.staleness = [None] * len(self.notifications)
+        for index, (t, changes) in enumerate(self.notifications):
+            self._push(t, 'notify', index)
+        while self.events:
+            t, _, kind, payload = heapq.heappop(self.events)
+            if kind == 'notify':
+                self.unapplied_changes += self.notifications[payload][1]
+                self._on_notify(t)
+            elif kind == 'timer':
+                if payload == self.timer_token:
+                    self._request(t)
+            elif kind == 'done':
+                self._on_done(t, payload)
+        return self.report()
+
+    def _on_notify(self, t):
+        if self.strategy == 'debounced':
+            self.timer_token += 1
+            self._push(t + self.debounce, 'timer', self.timer_token)
+        elif self.strategy == 'coalesced' and self.busy:
+            self.dirty = True
+        else:
+            self._request(t)
+
+    def _request(self, t):
+        self.queue.append(t)
+        if not self.busy:
+            self._start(t)
+
+    def _start(self, t):
+        self.queue.popleft()
+        self.busy = True
+        covered = []
+        while self.observed < len(self.notifications) and self.notifications[self.observed][0] <= t:
+            covered.append(self.observed)
+            self.observed += 1
+        if not covered:
+            self.redundant += 1
+        if self.strategy == 'incremental':
+            cost = self.costs.incremental(self.unapplied_changes)
+        else:
+            cost = self.costs.full(self.unapplied_changes)
+        self.unapplied_changes = 0
+        self.reloads += 1
+        self.work += cost
+        self.runs.append((t, t + cost / 1000.0, covered))
+        self._push(t + cost / 1000.0, 'done', covered)
+
+    def _on_done(self, t, covered):
+        for index in covered:
+            self.staleness[index] = t - self.notifications[index][0]
+        self.busy = False
+        if self.strategy == 'coalesced' and self.dirty:
+            self.dirty = False
+            self.queue.append(t)
+        if self.queue:
+            self._start(t)
+
+    def report(self):
+        settled = sorted(s for s in self.staleness if s is not None)
+        return {
+            'strategy': self.strategy,
+            'notifications': len(self.notifications),
+            'reloads': self.reloads,
+            'redundant_reloads': self.redundant,
+            'work_ms': self.work,
+            'p50_staleness_ms': percentile(settled, 50) * 1000,
+            'p99_staleness_ms': percentile(settled, 99) * 1000,
+            'max_staleness_ms': (settled[-1] if settled else 0.0) * 1000,
+            'never_observed': len(self.staleness) - len(settled),
+        }
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(values)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def synthetic_storm(bursts=20, burst_size=8, gap_ms=40.0, duration_s=600.0, seed=0):
+    """Sync-style bursts: geometric burst sizes, exponential gaps inside a burst"""
+    rng = random.Random(seed)
+    notifications = []
+    for _ in range(bursts):
+        t = rng.uniform(0, duration_s)
+        size = 1
+        while rng.random() > 1.0 / burst_size:
+            size += 1
+        for _ in range(size):
+            notifications.append((t, rng.randint(1, 3)))
+            t += rng.expovariate(1000.0 / gap_ms)
+    return sorted(notifications)
+
+
+def read_notifications(path):
+    """Load a recording (see module docstring)"""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith('['):
+        notifications = []
+        for item in json.loads(text):
+            if isinstance(item, dict):
+                notifications.append((float(item['t']), int(item.get('changes', 1))))
+            else:
+                notifications.append((float(item), 1))
+        return sorted(notifications)
+    notifications = []
+    for line in text.splitlines():
+        fields = line.split('#', 1)[0].split()
+        if fields:
+            changes = int(fields[1]) if len(fields) > 1 else 1
+            notifications.append((float(fields[0]), changes))
+    return sorted(notifications)
+
+
+def simulate(notifications, costs, strategies=STRATEGIES, debounce_ms=300.0):
+    return [Simulator(s, costs, debounce_ms).run(notifications) for s in strategies]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('recording', nargs='?', help='recorded notification times')
+    parser.add_argument('--reminders', type=int, default=5000, help='reminders per reload')
+    parser.add_argument('--debounce-ms', type=float, default=300.0)
+    parser.add_argument('--bursts', type=int, default=20, help='synthetic bursts')
+    parser.add_argument('--burst-size', type=float, default=8.0, help='mean notifications per burst')
+    parser.add_argument('--gap-ms', type=float, default=40.0, help='mean gap inside a burst')
+    parser.add_argument('--duration', type=float, default=600.0, help='synthetic window (seconds)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--calibrate', action='store_true',
+                        help='measure reload costs with the Python model instead of the defaults')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    if args.recording:
+        notifications = read_notifications(args.recording)
+    else:
+        notifications = synthetic_storm(args.bursts, args.burst_size, args.gap_ms,
+                                        args.duration, args.seed)
+    if args.calibrate:
+        costs = CostModel.calibrate(args.reminders)
+    else:
+        costs = CostModel(reminders=args.reminders)
+    results = simulate(notifications, costs, debounce_ms=args.debounce_ms)
+
+    if args.json:
+        json.dump({'costs': costs.__dict__, 'results': results}, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"🌩️  {len(notifications)} notifications, {costs.reminders} reminders, "
+          f"full reload {costs.full(0):.1f} ms")
+    print(f"{'strategy':<12} {'reloads':>8} {'redundant':>10} {'work ms':>10} "
+          f"{'p50 ms':>8} {'p99 ms':>8}")
+    for row in results:
+        print(f"{row['strategy']:<12} {row['reloads']:>8} {row['redundant_reloads']:>10} "
+              f"{row['work_ms']:>10.1f} {row['p50_staleness_ms']:>8.1f} "
+              f"{row['p99_staleness_ms']:>8.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
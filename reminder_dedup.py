@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate reminder detection with MinHash / LSH.
+
+Backlogs collect the same task captured several times ("email Sam re
+budget", "Email sam about the budget #today"), which inflates every
+loadReminders pass and challenge queue. This normalizes title + notes
+(hashtags removed with the TaskItem.extractTags fix-ups, stop words and
+plural/-ing/-ed suffixes dropped), shingles them into character 3-grams,
+computes MinHash signatures and uses LSH banding to find candidate pairs
+in roughly linear time. Each cluster is built around the reminder to
+keep: a candidate joins it only when its exact Jaccard similarity to that
+reminder reaches the threshold, so clusters never chain through
+intermediate reminders.
+
+Usage:
+    python3 reminder_dedup.py reminders.jsonl [--threshold 0.6] [--json]
+    python3 reminder_dedup.py --synthetic 100000
+"""
+import argparse
+import json
+import sys
+import time
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("reminder_dedup.py needs NumPy: pip3 install numpy")
+
+from reminders_model import read_snapshot, remove_tags, synthetic_corpus, tokenize
+
+SHINGLE = 3
+PERMUTATIONS = 64
+BANDS = 16
+_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+
+
+def normalize(reminder):
+    """Comparable text for a reminder: tags stripped, stop words and suffixes dropped"""
+    return ' '.join(tokenize(f"{remove_tags(reminder.title)} {remove_tags(reminder.notes)}"))
+
+
+def shingles(text):
+    if len(text) <= SHINGLE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1)}
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def minhash_signatures(shingle_sets, permutations=PERMUTATIONS, seed=1):
+    """(len(shingle_sets), permutations) uint64 MinHash matrix
+
+    Every shingle is hashed once with crc32; the permutations are
+    (a * h + b) mod p evaluated for all shingles of a chunk at once.
+    """
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, 1 << 31, size=permutations).astype(np.uint64)
+    b = rng.randint(0, 1 << 31, size=permutations).astype(np.uint64)
+    signatures = np.full((len(shingle_sets), permutations), np.iinfo(np.uint64).max, dtype=np.uint64)
+    chunk = 4096
+    for start in range(0, len(shingle_sets), chunk):
+        sets = shingle_sets[start:start + chunk]
+        lengths = np.fromiter((len(s) for s in sets), dtype=np.int64, count=len(sets))
+        hashes = np.fromiter((zlib.crc32(sh.encode('utf-8')) for s in sets for sh in s),
+                             dtype=np.uint64, count=int(lengths.sum()))
+        if not len(hashes):
+            continue
+        values = (hashes[:, None] % _PRIME * a + b) % _PRIME
+        nonempty = lengths > 0
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))[nonempty]
+        rows = np.flatnonzero(nonempty) + start
+        signatures[rows] = np.minimum.reduceat(values, offsets, axis=0)
+    return signatures
+
+
+def find_duplicates(reminders, threshold=0.6, bands=BANDS, permutations=PERMUTATIONS):
+    """Clusters of near-duplicate reminders, largest first
+
+    Each cluster is a dict with the reminder to keep (incomplete first,
+    then most recently modified) and the others with their Jaccard
+    similarity to it.
+    """
+    # Identical normalized texts collapse before hashing; reminders with no
+    # text left once tags are removed have nothing to compare
+    keys = [normalize(r) for r in reminders]
+    groups = {}
+    for index, key in enumerate(keys):
+        if key:
+            groups.setdefault(key, []).append(index)
+    sets = {text: shingles(text) for text in groups}
+    texts = [text for text in groups if sets[text]]
+    sets = [sets[text] for text in texts]
+    signatures = minhash_signatures(sets, permutations)
+
+    rows = permutations // bands
+    buckets = []    # per band: {band signature: [doc, ...]}
+    doc_keys = []   # per band: band signature of each doc
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        keys_in_band = [block[doc].tobytes() for doc in range(len(texts))]
+        band_buckets = {}
+        for doc, key in enumerate(keys_in_band):
+            band_buckets.setdefault(key, []).append(doc)
+        buckets.append(band_buckets)
+        doc_keys.append(keys_in_band)
+
+    def preference(i):
+        return reminders[i].is_completed, -reminders[i].last_modified
+
+    # Docs lead clusters in the order their best reminder would be kept;
+    # a lead claims every unclaimed candidate similar enough to itself
+    best = [min(groups[text], key=preference) for text in texts]
+    claimed = [False] * len(texts)
+    clusters = []
+    for doc in sorted(range(len(texts)), key=lambda d: preference(best[d])):
+        if claimed[doc]:
+            continue
+        claimed[doc] = True
+        similar = []
+        for band in range(bands):
+            bucket = buckets[band][doc_keys[band][doc]]
+            for other in bucket:
+                if claimed[other]:
+                    continue
+                score = jaccard(sets[doc], sets[other])
+                if score >= threshold:
+                    claimed[other] = True
+                    similar.append((other, score))
+            # Claimed docs never lead or join again
+            bucket[:] = [other for other in bucket if not claimed[other]]
+        keep = best[doc]
+        members = [(i, 1.0) for i in groups[texts[doc]] if i != keep]
+        members.extend((i, score) for other, score in similar for i in groups[texts[other]])
+        if not members:
+            continue
+        merge = [{
+            'id': reminders[i].id,
+            'title': reminders[i].title,
+            'similarity': round(score, 3),
+        } for i, score in members]
+        merge.sort(key=lambda m: -m['similarity'])
+        clusters.append({
+            'keep': {'id': reminders[keep].id, 'title': reminders[keep].title},
+            'merge': merge,
+        })
+    clusters.sort(key=lambda c: -len(c['merge']))
+    return clusters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('snapshot', nargs='?', help='reminders (.json / .jsonl)')
+    parser.add_argument('--threshold', type=float, default=0.6, help='minimum Jaccard similarity')
+    parser.add_argument('--include-completed', action='store_true')
+    parser.add_argument('--synthetic', type=int, help='run on a synthetic corpus of this size')
+    parser.add_argument('--json', action='store_true', help='print clusters as JSON Lines')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        reminders = synthetic_corpus(args.synthetic)
+    elif args.snapshot:
+        reminders = read_snapshot(args.snapshot)
+    else:
+        parser.error('a snapshot is required (or use --synthetic)')
+    if not args.include_completed:
+        reminders = [r for r in reminders if not r.is_completed]
+
+    start = time.perf_counter()
+    clusters = find_duplicates(reminders, args.threshold)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        for cluster in clusters:
+            print(json.dumps(cluster, ensure_ascii=False))
+        return 0
+    redundant = sum(len(c['merge']) for c in clusters)
+    print(f"🔍 {len(clusters)} duplicate clusters in {len(reminders)} reminders "
+          f"({elapsed * 1000:.0f} ms); {redundant} could be merged")
+    for cluster in clusters[:10]:
+        print(f"   - keep '{cluster['keep']['title']}' ({cluster['keep']['id']})")
+        for m in cluster['merge'][:3]:
+            print(f"       {m['similarity']:.2f} '{m['title']}' ({m['id']})")
+        if len(cluster['merge']) > 3:
+            print(f"       … {len(cluster['merge']) - 3} more")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
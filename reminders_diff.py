@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Snapshot diff engine for incremental task-list refresh.
+
+loadReminders refetches, reclassifies and renormalizes every reminder on
+each .EKEventStoreChanged and then replaces `tasks` wholesale. This diffs
+two reminder snapshots keyed by calendarItemIdentifier + lastModifiedDate
+in O(n) and reclassifies only the reminders that changed.
+
+Usage:
+    python3 reminders_diff.py old.jsonl new.jsonl [--json]
+    python3 reminders_diff.py --benchmark [--count 100000]
+"""
+import argparse
+import json
+import sys
+import time
+from collections import namedtuple
+
+from reminders_model import (
+    churn, load_tasks, read_snapshot, start_of_day, synthetic_corpus, to_task,
+)
+
+# Reminder-level differences between two snapshots (lists of ids)
+SnapshotDiff = namedtuple('SnapshotDiff', 'inserted updated deleted')
+
+# Task-level effect of a refresh. `moved` holds (id, old_quadrant, new_quadrant);
+# `reclassified` counts the reminders that went through to_task.
+Changeset = namedtuple('Changeset', 'inserted updated deleted moved reclassified')
+
+
+def diff_snapshots(old_stamps, reminders):
+    """Compare {id: lastModified} against a new snapshot in one pass
+
+    Returns the SnapshotDiff and the {id: lastModified} of the new snapshot.
+    """
+    new_stamps = {}
+    inserted = []
+    updated = []
+    for reminder in reminders:
+        new_stamps[reminder.id] = reminder.last_modified
+        previous = old_stamps.get(reminder.id)
+        if previous is None:
+            inserted.append(reminder.id)
+        elif previous != reminder.last_modified:
+            updated.append(reminder.id)
+    deleted = [rid for rid in old_stamps if rid not in new_stamps]
+    return SnapshotDiff(inserted, updated, deleted), new_stamps
+
+
+class IncrementalLoader:
+    """Keeps the loaded task map between refreshes
+
+    The loadReminders filter keeps reminders completed *today*, so a
+    refresh on a new day falls back to a full reload.
+    """
+
+    def __init__(self):
+        self.stamps = {}
+        self.tasks = {}
+        self.day = None
+
+    def full_reload(self, reminders, now=None):
+        now = time.time() if now is None else now
+        old_tasks = self.tasks
+        self.day = start_of_day(now)
+        self.stamps = {}
+        self.tasks = {}
+        for reminder in reminders:
+            self.stamps[reminder.id] = reminder.last_modified
+            task = to_task(reminder, self.day)
+            if task is not None:
+                self.tasks[reminder.id] = task
+        return _task_changes(old_tasks, self.tasks, self.tasks.keys() | old_tasks.keys(),
+                             len(self.stamps))
+
+    def refresh(self, reminders, now=None):
+        """Apply a new snapshot, reclassifying only inserted and updated reminders"""
+        now = time.time() if now is None else now
+        if self.day is None or start_of_day(now) != self.day:
+            return self.full_reload(reminders, now)
+        if not isinstance(reminders, (list, tuple)):
+            reminders = list(reminders)
+        diff, self.stamps = diff_snapshots(self.stamps, reminders)
+        changed = set(diff.inserted)
+        changed.update(diff.updated)
+        old_tasks = {}
+        for rid in diff.deleted:
+            task = self.tasks.pop(rid, None)
+            if task is not None:
+                old_tasks[rid] = task
+        for reminder in reminders:
+            if reminder.id not in changed:
+                continue
+            previous = self.tasks.pop(reminder.id, None)
+            if previous is not None:
+                old_tasks[reminder.id] = previous
+            task = to_task(reminder, self.day)
+            if task is not None:
+                self.tasks[reminder.id] = task
+        touched = changed.union(diff.deleted)
+        new_tasks = {rid: self.tasks[rid] for rid in touched if rid in self.tasks}
+        return _task_changes(old_tasks, new_tasks, touched, len(changed))
+
+    def task_list(self):
+        return list(self.tasks.values())
+
+
+def _task_changes(old_tasks, new_tasks, ids, reclassified):
+    inserted, updated, deleted, moved = [], [], [], []
+    for rid in ids:
+        old = old_tasks.get(rid)
+        new = new_tasks.get(rid)
+        if old is None and new is None:
+            continue
+        if old is None:
+            inserted.append(rid)
+        elif new is None:
+            deleted.append(rid)
+        elif old != new:
+            updated.append(rid)
+            if old.quadrant != new.quadrant:
+                moved.append((rid, old.quadrant, new.quadrant))
+    return Changeset(sorted(inserted), sorted(updated), sorted(deleted), sorted(moved),
+                     reclassified)
+
+
+def _best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(count, churn_levels=(0.01, 0.10, 0.50), repeat=3):
+    """Time a full reload against an incremental refresh on a synthetic corpus"""
+    now = time.time()
+    base = synthetic_corpus(count, now=now - 60)
+    results = []
+    for level in churn_levels:
+        changed = churn(base, level, now=now)
+
+        def incremental():
+            loader = IncrementalLoader()
+            loader.full_reload(base, now)
+            start = time.perf_counter()
+            loader.refresh(changed, now)
+            return time.perf_counter() - start
+
+        full = _best_of(repeat, lambda: load_tasks(changed, now))
+        inc = min(incremental() for _ in range(repeat))
+        loader = IncrementalLoader()
+        loader.full_reload(base, now)
+        changes = loader.refresh(changed, now)
+        results.append({
+            'churn': level,
+            'reminders': len(changed),
+            'full_reload_s': full,
+            'incremental_s': inc,
+            'reclassified': changes.reclassified,
+            'task_inserts': len(changes.inserted),
+            'task_updates': len(changes.updated),
+            'task_deletes': len(changes.deleted),
+            'quadrant_moves': len(changes.moved),
+            'speedup': full / inc if inc else float('inf'),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('old', nargs='?', help='previous snapshot (.json / .jsonl)')
+    parser.add_argument('new', nargs='?', help='current snapshot (.json / .jsonl)')
+    parser.add_argument('--json', action='store_true', help='print the changeset as JSON')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare full reload with incremental refresh on a synthetic corpus')
+    parser.add_argument('--count', type=int, default=100000, help='benchmark corpus size')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(f"📊 Full reload vs incremental refresh ({args.count} reminders)")
+        print(f"{'churn':>6} {'full ms':>9} {'incr ms':>9} {'speedup':>8} {'reclassified':>13} {'moves':>6}")
+        for row in benchmark(args.count):
+            print(f"{row['churn']:>6.0%} {row['full_reload_s'] * 1000:>9.1f} "
+                  f"{row['incremental_s'] * 1000:>9.1f} {row['speedup']:>7.1f}x "
+                  f"{row['reclassified']:>13} {row['quadrant_moves']:>6}")
+        return 0
+
+    if not args.old or not args.new:
+        parser.error('old and new snapshots are required (or use --benchmark)')
+
+    loader = IncrementalLoader()
+    loader.full_reload(read_snapshot(args.old))
+    changes = loader.refresh(read_snapshot(args.new))
+    if args.json:
+        json.dump(changes._asdict(), sys.stdout, indent=2)
+        print()
+    else:
+        print(f"➕ Inserted: {len(changes.inserted)}")
+        print(f"✏️  Updated: {len(changes.updated)}")
+        print(f"➖ Deleted: {len(changes.deleted)}")
+        print(f"🔀 Quadrant moves: {len(changes.moved)}")
+        for rid, old, new in changes.moved:
+            print(f"   - {rid}: {old} → {new}")
+        print(f"🔍 Reclassified {changes.reclassified} of {len(loader.stamps)} reminders")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Shared reminder/task model for the offline GetSh1tDone tools.
+
+Mirrors the rules in TaskQuadrant.swift and RemindersManager.swift
+(extractTags, extractQuadrant, the loadReminders filter,
+normalizeTaskTagsAndNotes and the setTimePeriodTag / removeTimePeriodTag
+note rebuilding) so that exported reminders are classified
+exactly the way the app classifies them.
+
+Snapshots are JSON (a list, or an object with a "reminders" list) or
+JSON Lines, one reminder per record. Keys may use the EventKit names
+(calendarItemIdentifier, lastModifiedDate, ...) or the snake_case field
+names below; dates may be ISO 8601 strings or epoch seconds.
+"""
+import json
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Quadrant raw values, in the app's priority order (DoNow > Delegate > Schedule > Bin)
+QUADRANTS = ['Do Now', 'Delegate', 'Schedule', 'Bin / Challenge']
+QUADRANT_INDEX = {q: i for i, q in enumerate(QUADRANTS)}
+QUADRANT_HASHTAGS = {
+    'Do Now': '#DoNow',
+    'Delegate': '#Delegate',
+    'Schedule': '#Schedule',
+    'Bin / Challenge': '#Bin',
+}
+TIME_PERIOD_TAGS = ['#today', '#thisweek', '#thismonth', '#thisquarter']
+_TIME_PERIOD_LOWER = set(TIME_PERIOD_TAGS)
+# setTimePeriodTag strips each period tag from the user notes in turn, case-insensitively
+_TIME_PERIOD_TEXT = [re.compile(re.escape(tag), re.IGNORECASE) for tag in TIME_PERIOD_TAGS]
+
+_TAG_RE = re.compile(r'#\w+')
+_HASHTAG_STRIP_RE = re.compile(r'#+\s*#?\w+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_EXCLUDED_TAGS = {'#donow', '#delegate', '#schedule', '#bin'}
+
+# Word tokens for the text-matching tools (priority_matcher, reminder_dedup)
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_STOPWORDS = frozenset("""
+a about after all also an and any are as at be been but by can do for from get
+got has have i if in into is it its me my need needs next no not of on or our
+out re so some that the their then there this to up us was we what when which
+will with you your
+""".split())
+
+
+
+def _search_patterns(tag_text, spellings):
+    """Swift searchPatterns for one tag text, lowercased and deduplicated in order"""
+    patterns = []
+    for spelling in spellings:
+        pattern = spelling.format(tag_text).lower()
+        if pattern not in patterns:
+            patterns.append(pattern)
+    return patterns
+
+
+# extractQuadrant, in its priority order: for each tag text the literal
+# searchPatterns first, then the "#+\s*<tag>" regex. Both are kept exactly
+# as the app has them; the regex's \s also crosses newlines.
+_QUADRANT_SPELLINGS = ['#{}', '##{}', '# {}', '# #{}', '## {}', '#  {}', '#  #{}']
+_QUADRANT_CHECKS = [
+    (_search_patterns(tag_text, _QUADRANT_SPELLINGS + ['#' + tag_text.capitalize(), '#' + tag_text.upper()]),
+     re.compile(r'#+\s*' + tag_text, re.IGNORECASE), quadrant)
+    for tag_text, quadrant in [
+        ('donow', 'Do Now'),
+        ('delegate', 'Delegate'),
+        ('schedule', 'Schedule'),
+        ('bin', 'Bin / Challenge'),
+        ('challenge', 'Bin / Challenge'),
+    ]
+]
+# loadReminders fallbacks when extractQuadrant finds nothing: challengePatterns,
+# then the searchPatterns of each time-period tag text
+_CHALLENGE_PATTERNS = _search_patterns('challenge', ['#{}', '##{}', '# {}', '# #{}', '## {}'])
+_TIME_PERIOD_PATTERNS = [pattern for tag_text in ('today', 'thisweek', 'thismonth', 'thisquarter')
+                         for pattern in _search_patterns(tag_text, _QUADRANT_SPELLINGS)]
+
+_FIELD_ALIASES = {
+    'calendarItemIdentifier': 'id',
+    'calendarTitle': 'calendar',
+    'list': 'calendar',
+    'lastModifiedDate': 'last_modified',
+    'lastModified': 'last_modified',
+    'creationDate': 'creation_date',
+    'completionDate': 'completion_date',
+    'isCompleted': 'is_completed',
+    'dueDate': 'due_date',
+}
+_DATE_FIELDS = ('last_modified', 'creation_date', 'completion_date', 'due_date')
+
+
+@dataclass
+class Reminder:
+    """An exported EKReminder (only the fields the app reads)"""
+    id: str
+    title: str = ''
+    notes: str = ''
+    calendar: str = ''
+    last_modified: float = 0.0
+    creation_date: float = None
+    completion_date: float = None
+    is_completed: bool = False
+    due_date: float = None
+
+    @classmethod
+    def from_dict(cls, record):
+        values = {}
+        for key, value in record.items():
+            key = _FIELD_ALIASES.get(key, key)
+            if key in _DATE_FIELDS:
+                value = parse_date(value)
+            values[key] = value
+        values['title'] = values.get('title') or ''
+        values['notes'] = values.get('notes') or ''
+        values['calendar'] = values.get('calendar') or ''
+        values['last_modified'] = values.get('last_modified') or 0.0
+        values['is_completed'] = bool(values.get('is_completed'))
+        known = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in values.items() if k in known})
+
+    def to_dict(self):
+        return {
+            'calendarItemIdentifier': self.id,
+            'title': self.title,
+            'notes': self.notes,
+            'calendar': self.calendar,
+            'lastModifiedDate': self.last_modified,
+            'creationDate': self.creation_date,
+            'completionDate': self.completion_date,
+            'isCompleted': self.is_completed,
+            'dueDate': self.due_date,
+        }
+
+
+@dataclass
+class TaskItem:
+    """Python counterpart of TaskItem in TaskQuadrant.swift"""
+    id: str
+    title: str
+    notes: str
+    quadrant: str
+    last_modified: float
+    is_completed: bool
+    tags: list = field(default_factory=list)
+
+
+def parse_date(value):
+    """Convert an ISO 8601 string or epoch number to epoch seconds (None stays None)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = value.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    return datetime.fromisoformat(text).timestamp()
+
+
+def start_of_day(ts):
+    """Local midnight for an epoch timestamp (Calendar.current.startOfDay)"""
+    dt = datetime.fromtimestamp(ts)
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+
+def extract_tags(notes):
+    """TaskItem.extractTags: non-quadrant hashtags, case-insensitively deduplicated"""
+    normalized = notes.replace('##', '#').replace('# #', '#')
+    seen = set()
+    tags = []
+    for tag in _TAG_RE.findall(normalized):
+        lower = tag.lower()
+        if lower in _EXCLUDED_TAGS or lower in seen:
+            continue
+        seen.add(lower)
+        tags.append(tag)
+    return tags
+
+
+def remove_tags(text):
+    """Text with every hashtag removed, after the ##/# # fix-ups extractTags applies"""
+    return _TAG_RE.sub('', text.replace('##', '#').replace('# #', '#'))
+
+
+def strip_hashtags(notes):
+    """User content of a note with every hashtag removed and whitespace collapsed"""
+    return _WHITESPACE_RE.sub(' ', _HASHTAG_STRIP_RE.sub('', notes)).strip()
+
+
+def stem(word):
+    """Crude suffix stripping so "budgets" / "budgeting" meet "budget" """
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text):
+    """Lowercased, stemmed words of a text without stop words"""
+    return [stem(w) for w in _WORD_RE.findall(text.lower())
+            if w not in _STOPWORDS and len(w) > 1]
+
+
+def extract_quadrant(title, notes, calendar=''):
+    """RemindersManager.extractQuadrant; returns a quadrant raw value or None"""
+    lowered = f"{notes} {title} {calendar}".lower()
+    for patterns, regex, quadrant in _QUADRANT_CHECKS:
+        if any(pattern in lowered for pattern in patterns) or regex.search(lowered):
+            return quadrant
+    return None
+
+
+def classify(reminder):
+    """Quadrant loadReminders assigns to a reminder, or None if it is skipped"""
+    quadrant = extract_quadrant(reminder.title, reminder.notes, reminder.calendar)
+    if quadrant is None:
+        lowered = f"{reminder.notes} {reminder.title} {reminder.calendar}".lower()
+        if any(pattern in lowered for pattern in _CHALLENGE_PATTERNS):
+            quadrant = 'Bin / Challenge'
+        elif any(pattern in lowered for pattern in _TIME_PERIOD_PATTERNS):
+            quadrant = 'Schedule'
+    return quadrant
+
+
+def is_visible(reminder, today_start):
+    """loadReminders filter: incomplete, or completed on the day starting at today_start"""
+    if not reminder.is_completed:
+        return True
+    if reminder.completion_date is None:
+        return False
+    return today_start <= start_of_day(reminder.completion_date) < today_start + 86400
+
+
+def normalize_notes(notes, quadrant, tags=None):
+    """normalizeTaskTagsAndNotes: user notes, then the quadrant hashtag, then tags on one line"""
+    final_tags = extract_tags(notes)
+    seen = {t.lower() for t in final_tags}
+    for tag in tags or ():
+        if tag.lower() not in seen:
+            seen.add(tag.lower())
+            final_tags.append(tag)
+    return _rebuild_notes(strip_hashtags(notes), quadrant, final_tags), final_tags
+
+
+def set_time_period_tag(notes, quadrant, tag):
+    """setTimePeriodTag: notes with `tag` as the only time-period tag"""
+    tags = [t for t in extract_tags(notes) if t.lower() not in _TIME_PERIOD_LOWER]
+    if tag.lower() not in {t.lower() for t in tags}:
+        tags.append(tag)
+    user_notes = notes.replace(QUADRANT_HASHTAGS[quadrant], '').strip()
+    for pattern in _TIME_PERIOD_TEXT:
+        user_notes = pattern.sub('', user_notes)
+    return _rebuild_notes(user_notes.strip(), quadrant, tags)
+
+
+def remove_time_period_tag(notes, quadrant, tag):
+    """removeTimePeriodTag: notes without `tag` (matched case-insensitively)"""
+    tags = [t for t in extract_tags(notes) if t.lower() != tag.lower()]
+    user_notes = notes.replace(QUADRANT_HASHTAGS[quadrant], '').strip()
+    user_notes = re.sub(re.escape(tag), '', user_notes, flags=re.IGNORECASE)
+    return _rebuild_notes(user_notes.strip(), quadrant, tags)
+
+
+def _rebuild_notes(user_notes, quadrant, tags):
+    rebuilt = user_notes
+    if rebuilt:
+        rebuilt += '\n\n'
+    rebuilt += QUADRANT_HASHTAGS[quadrant]
+    if tags:
+        rebuilt += '\n' + ' '.join(tags)
+    return rebuilt
+
+
+def to_task(reminder, today_start):
+    """Build the normalized TaskItem loadReminders would show, or None"""
+    if not is_visible(reminder, today_start):
+        return None
+    quadrant = classify(reminder)
+    if quadrant is None:
+        return None
+    notes, tags = normalize_notes(reminder.notes, quadrant)
+    return TaskItem(
+        id=reminder.id,
+        title=reminder.title,
+        notes=notes,
+        quadrant=quadrant,
+        last_modified=reminder.last_modified,
+        is_completed=reminder.is_completed,
+        tags=tags,
+    )
+
+
+def load_tasks(reminders, now=None):
+    """Full loadReminders pass over a snapshot; returns the task list"""
+    today_start = start_of_day(time.time() if now is None else now)
+    tasks = []
+    for reminder in reminders:
+        task = to_task(reminder, today_start)
+        if task is not None:
+            tasks.append(task)
+    return tasks
+
+
+def iter_snapshot(path):
+    """Yield Reminder objects from a JSON, JSON Lines or iCalendar (.ics) snapshot file"""
+    if path.endswith('.ics'):
+        from vtodo import read_vtodos
+        yield from read_vtodos(path)
+        return
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                if line.strip():
+                    yield Reminder.from_dict(json.loads(line))
+            return
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('reminders', [])
+    for record in data:
+        yield Reminder.from_dict(record)
+
+
+def read_snapshot(path):
+    return list(iter_snapshot(path))
+
+
+def write_snapshot(path, reminders):
+    """Write reminders as JSON Lines (use a .jsonl name so iter_snapshot reads it back)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for reminder in reminders:
+            f.write(json.dumps(reminder.to_dict(), ensure_ascii=False))
+            f.write('\n')
+
+
+# Synthetic corpus -----------------------------------------------------------
+
+_VERBS = ['Email', 'Call', 'Review', 'Draft', 'Book', 'Fix', 'Plan', 'Write',
+          'Update', 'Prepare', 'Pay', 'Order', 'Check', 'Send', 'Sort out']
+_OBJECTS = ['budget', 'slides', 'invoice', 'dentist appointment', 'team offsite',
+            'quarterly report', 'car service', 'flights', 'contract', 'roadmap',
+            'expenses', 'newsletter', 'garden', 'tax return', 'interview notes']
+_PEOPLE = ['Sam', 'Alex', 'Priya', 'Jordan', 'Chris', 'Mum', 'the landlord', 'HR']
+_EXTRA_TAGS = ['#work', '#home', '#errand', '#sam', '#alex', '#finance', '#health']
+_CALENDARS = ['Reminders', 'Backlog', 'Work', 'Home']
+
+
+def synthetic_title(rng):
+    roll = rng.random()
+    if roll < 0.05:
+        return rng.choice(['stuff', 'Things', 'misc', 'Do thing'])
+    if roll < 0.5:
+        return f"{rng.choice(_VERBS)} {rng.choice(_PEOPLE)} re {rng.choice(_OBJECTS)}"
+    return f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)}"
+
+
+def synthetic_notes(rng, quadrant=None):
+    parts = []
+    if rng.random() < 0.4:
+        parts.append(rng.choice(['Follow up next week', 'See thread from Monday',
+                                 'Needs sign-off', 'Ask about options']))
+    if quadrant is not None:
+        parts.append(QUADRANT_HASHTAGS[quadrant])
+    if rng.random() < 0.3:
+        parts.append(rng.choice(['#today', '#thisweek', '#thismonth', '#thisquarter']))
+    if rng.random() < 0.3:
+        parts.append(rng.choice(_EXTRA_TAGS))
+    return '\n\n'.join(parts)
+
+
+def synthetic_reminder(rng, reminder_id, now):
+    """One plausible reminder; about 15% carry no quadrant tag"""
+    quadrant = rng.choice(QUADRANTS) if rng.random() < 0.85 else None
+    created = now - rng.uniform(0, 120 * 86400)
+    modified = rng.uniform(created, now)
+    completed = rng.random() < 0.2
+    return Reminder(
+        id=reminder_id,
+        title=synthetic_title(rng),
+        notes=synthetic_notes(rng, quadrant),
+        calendar=rng.choice(_CALENDARS),
+        last_modified=modified,
+        creation_date=created,
+        completion_date=rng.uniform(modified, now) if completed else None,
+        is_completed=completed,
+        due_date=now + rng.uniform(-5, 30) * 86400 if rng.random() < 0.25 else None,
+    )
+
+
+def iter_synthetic_corpus(count, seed=0, now=None):
+    """Lazily yield the reminders of synthetic_corpus"""
+    rng = random.Random(seed)
+    now = time.time() if now is None else now
+    for i in range(count):
+        yield synthetic_reminder(rng, f"R{i:08d}", now)
+
+
+def synthetic_corpus(count, seed=0, now=None):
+    """Deterministic synthetic snapshot of `count` reminders"""
+    return list(iter_synthetic_corpus(count, seed, now))
+
+
+def churn(reminders, fraction, seed=1, now=None):
+    """Copy of a snapshot with `fraction` of it inserted, deleted or edited
+
+    Edits are split between title edits, note edits that keep the
+    quadrant, and quadrant moves; every edit bumps lastModifiedDate.
+    """
+    rng = random.Random(seed)
+    now = time.time() if now is None else now
+    changes = int(len(reminders) * fraction)
+    result = list(reminders)
+    picked = rng.sample(range(len(result)), min(changes, len(result)))
+    deleted = set()
+    for position, i in enumerate(picked):
+        kind = position % 5
+        old = result[i]
+        if kind == 0:
+            deleted.add(i)
+            continue
+        if kind == 1:
+            new = Reminder(**{**old.__dict__, 'title': old.title + ' (updated)'})
+        elif kind == 2:
+            new = Reminder(**{**old.__dict__, 'notes': old.notes + '\n\n#errand'})
+        else:
+            quadrant = rng.choice(QUADRANTS)
+            new = Reminder(**{**old.__dict__, 'notes': synthetic_notes(rng, quadrant)})
+        new.last_modified = now
+        result[i] = new
+    result = [r for i, r in enumerate(result) if i not in deleted]
+    for _ in range(len(deleted)):
+        result.append(synthetic_reminder(rng, f"N{rng.getrandbits(48):012X}", now))
+    return result
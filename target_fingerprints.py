@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Per-target input fingerprints and affected targets for a git diff.
+
+Both targets compile the same sources, so a change anywhere used to mean
+rebuilding iOS and macOS alike. A target's fingerprint hashes exactly
+what that target consumes, read from its build phases and configurations
+in project.pbxproj: its effective build settings per configuration
+(project-level settings overlaid with the target's), its Sources,
+Resources and Frameworks phase files, and the files its settings name
+(INFOPLIST_FILE, CODE_SIGN_ENTITLEMENTS). Swift sources are hashed as
+that target's compiler sees them: `#if os(...)` branches for other
+platforms are dropped, so an edit inside `#if os(macOS)` leaves the iOS
+fingerprint alone. Conditions that cannot be decided per target (DEBUG,
+canImport, ...) keep every branch.
+
+Fingerprints cover the code a target compiles, not whether its files
+parse. Swift still parses inactive `#if` branches, so a syntax error
+inside `#if os(macOS)` breaks the iOS build too while the iOS
+fingerprint stays the same. A CI job that skips targets by fingerprint
+or `--affected` should still parse every changed Swift file (for
+example `swiftc -parse`) for all targets.
+
+`--affected` looks only at the paths a git diff touches. It compares
+each changed file's target view, and the two project files' phases and
+settings, so its cost grows with the size of the diff, not with the
+number of targets.
+
+Usage:
+    python3 target_fingerprints.py                      # {target: fingerprint} as JSON
+    python3 target_fingerprints.py -o fingerprints.json # the same, written to a file
+    python3 target_fingerprints.py --inputs             # and every input hash behind them
+    python3 target_fingerprints.py --affected origin/main [HEAD] [--json]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from io import StringIO
+
+import create_multiplatform_project as generator
+import pbxproj
+
+# SDK / SUPPORTED_PLATFORMS names -> the name os() takes in Swift
+PLATFORM_OS = {
+    'iphoneos': 'iOS', 'iphonesimulator': 'iOS',
+    'macosx': 'macOS',
+    'appletvos': 'tvOS', 'appletvsimulator': 'tvOS',
+    'watchos': 'watchOS', 'watchsimulator': 'watchOS',
+    'xros': 'visionOS', 'xrsimulator': 'visionOS',
+}
+# Build settings whose value is a file the target consumes
+FILE_SETTINGS = ('INFOPLIST_FILE', 'CODE_SIGN_ENTITLEMENTS')
+
+_DIRECTIVE_RE = re.compile(r'^\s*#(if|elseif|else|endif)\b(.*)$')
+_CONDITION_TOKEN_RE = re.compile(r'\s*(&&|\|\||!|\(|\)|[A-Za-z_]\w*\s*\([^()]*\)|[A-Za-z_]\w*)')
+_OS_RE = re.compile(r'os\s*\(\s*(\w+)\s*\)$')
+_PROJECT_REL = os.path.relpath(generator.project_file, generator.project_dir)
+
+
+# Target views of Swift sources -----------------------------------------------
+
+def evaluate(condition, platforms):
+    """True / False for a compilation condition on a target building for `platforms`, None if undecidable"""
+    tokens = _CONDITION_TOKEN_RE.findall(condition.split('//')[0])
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def either(left, right, is_and):
+        if is_and:
+            if left is False or right is False:
+                return False
+            return True if left and right else None
+        if left or right:
+            return True
+        return False if left is False and right is False else None
+
+    def primary():
+        token = take() if peek() is not None else None
+        if token == '!':
+            value = primary()
+            return None if value is None else not value
+        if token == '(':
+            value = disjunction()
+            if peek() == ')':
+                take()
+            return value
+        if token in ('true', 'false'):
+            return token == 'true'
+        match = _OS_RE.match(token or '')
+        if match:
+            if match.group(1) not in platforms:
+                return False
+            return True if len(platforms) == 1 else None
+        return None
+
+    def conjunction():
+        value = primary()
+        while peek() == '&&':
+            take()
+            value = either(value, primary(), True)
+        return value
+
+    def disjunction():
+        value = conjunction()
+        while peek() == '||':
+            take()
+            value = either(value, conjunction(), False)
+        return value
+
+    return disjunction() if tokens else None
+
+
+def target_view(text, platforms):
+    """The lines of a Swift file a target building for `platforms` compiles
+
+    Directives whose outcome is decided for the target are dropped with
+    their inactive branches; undecidable ones are kept whole. The dropped
+    branches are still parsed by the compiler, so syntax errors in them
+    do not show up in the view.
+    """
+    kept = []
+    frames = []     # [decided, taken, active] per open #if
+    for line in text.splitlines():
+        match = _DIRECTIVE_RE.match(line)
+        included = all(frame[2] for frame in frames)
+        if match is None:
+            if included:
+                kept.append(line)
+            continue
+        directive, condition = match.groups()
+        if directive == 'if':
+            value = evaluate(condition, platforms)
+            frames.append([value is not None, value is True, value is not False])
+            decided = value is not None
+        elif not frames:
+            decided = False     # unbalanced: keep it, let the compiler complain
+        elif directive == 'endif':
+            decided = frames.pop()[0]
+            included = all(frame[2] for frame in frames)
+        else:
+            frame = frames[-1]
+            included = all(outer[2] for outer in frames[:-1])
+            if frame[0]:
+                if frame[1]:
+                    frame[2] = False
+                elif directive == 'else':
+                    frame[2] = frame[1] = True
+                else:
+                    value = evaluate(condition, platforms)
+                    if value is None:
+                        frame[0] = False    # undecided from here on: keep the rest
+                    frame[1] = value is True
+                    frame[2] = value is not False
+            decided = frame[0]
+        if included and not decided:
+            kept.append(line)
+    return '\n'.join(kept)
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# Target inputs ---------------------------------------------------------------
+
+def target_platforms(settings):
+    """os() names a target builds for, from SUPPORTED_PLATFORMS / SDKROOT across its configurations"""
+    platforms = set()
+    for values in settings.values():
+        names = values.get('SUPPORTED_PLATFORMS') or values.get('SDKROOT', '')
+        platforms.update(PLATFORM_OS.get(name, name) for name in names.split())
+    return frozenset(platforms)
+
+
+def target_inputs(project):
+    """{target name: what it consumes}, read from its build phases and configurations"""
+    objects = project['objects']
+    paths = pbxproj.reference_paths(project)[0]
+    targets = {}
+    for target_id in objects[project['rootObject']].get('targets', []):
+        target = objects.get(target_id, {})
+        settings = pbxproj.build_settings(project, target)
+        phases = {}
+        for phase_id in target.get('buildPhases', []):
+            phase = objects.get(phase_id, {})
+            name = pbxproj.phase_name(phase)
+            phases.setdefault(name, []).extend(pbxproj.phase_files(project, phase, paths))
+        setting_files = sorted({values[key] for values in settings.values()
+                                for key in FILE_SETTINGS if values.get(key)})
+        targets[target.get('name')] = {
+            'product_type': target.get('productType'),
+            'platforms': sorted(target_platforms(settings)),
+            'settings': settings,
+            'phases': {name: sorted(files) for name, files in phases.items()},
+            'setting_files': setting_files,
+        }
+    return targets
+
+
+def consumed_files(inputs):
+    """Paths a target reads from the tree: phase files, then files named by its settings"""
+    files = [path for name, paths in sorted(inputs['phases'].items()) if name != 'Frameworks'
+             for path in paths]
+    return files + inputs['setting_files']
+
+
+def _tree_files(path):
+    """{file: digest} for a consumed path that may be a folder (asset catalogs are resources)"""
+    full = os.path.join(generator.project_dir, path)
+    if not os.path.isdir(full):
+        content = _read_worktree(path)
+        return {path: None if content is None else hashlib.sha256(content).hexdigest()}
+    found = {}
+    for root, dirs, files in os.walk(full):
+        dirs.sort()
+        for name in sorted(files):
+            found[os.path.relpath(os.path.join(root, name), generator.project_dir)] = \
+                generator.sha256_file(os.path.join(root, name))
+    return found
+
+
+def _read_worktree(path):
+    try:
+        with open(os.path.join(generator.project_dir, path), 'rb') as f:
+            return f.read()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+def file_digest(path, content, platforms):
+    """Digest of a consumed file as one target sees it"""
+    if content is None:
+        return None
+    if path.endswith('.swift'):
+        return _digest(target_view(content.decode('utf-8', 'replace'), platforms))
+    return hashlib.sha256(content).hexdigest()
+
+
+def fingerprint(name, inputs):
+    """(fingerprint, {input: digest}) for one target in the working tree"""
+    platforms = frozenset(inputs['platforms'])
+    digests = {}
+    for path in consumed_files(inputs):
+        if path.endswith('.swift'):
+            digests[path] = file_digest(path, _read_worktree(path), platforms)
+        else:
+            digests.update(_tree_files(path))
+    record = {
+        'name': name,
+        'product_type': inputs['product_type'],
+        'settings': inputs['settings'],
+        'frameworks': inputs['phases'].get('Frameworks', []),
+        'files': digests,
+    }
+    return _digest(json.dumps(record, sort_keys=True)), digests
+
+
+def fingerprints(project=None):
+    """{target name: fingerprint} for the working tree"""
+    project = pbxproj.read(generator.project_file) if project is None else project
+    return {name: fingerprint(name, inputs)[0] for name, inputs in target_inputs(project).items()}
+
+
+# Affected targets ------------------------------------------------------------
+
+def _git(*args):
+    return subprocess.run(['git', '-C', generator.project_dir, *args],
+                          capture_output=True, check=True).stdout
+
+
+def changed_paths(base, head=None):
+    """Paths (relative to the project dir) a diff touches; head None means the working tree"""
+    prefix = _git('rev-parse', '--show-prefix').decode().strip()
+    revisions = [base] + ([head] if head else [])
+    names = _git('diff', '--name-only', '--no-renames', *revisions, '--', '.').decode('utf-8').splitlines()
+    return sorted(name[len(prefix):] for name in names if name.startswith(prefix))
+
+
+def reader_at(revision):
+    """A function reading a file (relative to the project dir) at a revision, None if it is absent"""
+    if revision is None:
+        return _read_worktree
+    prefix = _git('rev-parse', '--show-prefix').decode().strip()
+
+    def read(path):
+        try:
+            return _git('show', f"{revision}:{prefix}{path}")
+        except subprocess.CalledProcessError:
+            return None
+    return read
+
+
+def _project_at(read):
+    content = read(_PROJECT_REL)
+    return None if content is None else pbxproj.load(StringIO(content.decode('utf-8')))
+
+
+def affected_targets(base, head=None):
+    """{target: [reasons]} for targets whose inputs differ between base and head, and the unaffected names"""
+    changed = changed_paths(base, head)
+    read_old, read_new = reader_at(base), reader_at(head)
+    if _PROJECT_REL in changed:
+        old_project, new_project = _project_at(read_old), _project_at(read_new)
+    else:
+        old_project = new_project = _project_at(read_new)
+    old_targets = target_inputs(old_project) if old_project else {}
+    new_targets = target_inputs(new_project) if new_project else {}
+
+    affected = {}
+    for name in sorted(old_targets.keys() | new_targets.keys()):
+        old, new = old_targets.get(name), new_targets.get(name)
+        if old is None or new is None:
+            affected[name] = ['target added' if old is None else 'target removed']
+            continue
+        reasons = []
+        if old['settings'] != new['settings'] or old['product_type'] != new['product_type']:
+            reasons.append('build settings')
+        if old['phases'] != new['phases'] or old['setting_files'] != new['setting_files']:
+            reasons.append('build phases')
+        platforms = frozenset(new['platforms'])
+        consumed = set(consumed_files(old)) | set(consumed_files(new))
+        for path in changed:
+            if path in consumed:
+                if not path.endswith('.swift'):
+                    reasons.append(f"changed: {path}")
+                elif (file_digest(path, read_old(path), frozenset(old['platforms']))
+                      != file_digest(path, read_new(path), platforms)):
+                    reasons.append(f"changed: {path}")
+            elif any(path.startswith(folder + '/') for folder in consumed):
+                reasons.append(f"changed: {path}")
+        if reasons:
+            affected[name] = reasons
+    unaffected = sorted(name for name in new_targets if name not in affected)
+    return affected, unaffected, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--inputs', action='store_true', help='include every input digest per target')
+    parser.add_argument('--affected', nargs='+', metavar=('BASE', 'HEAD'),
+                        help='targets whose inputs differ between BASE and HEAD (default: working tree)')
+    parser.add_argument('--json', action='store_true', help='print --affected as JSON')
+    parser.add_argument('-o', '--output', help='write the fingerprints to this file instead of stdout')
+    args = parser.parse_args()
+
+    if args.affected:
+        if len(args.affected) > 2:
+            parser.error('--affected takes BASE and an optional HEAD')
+        base, head = args.affected[0], (args.affected[1:] or [None])[0]
+        try:
+            affected, unaffected, changed = affected_targets(base, head)
+        except subprocess.CalledProcessError as error:
+            print(f"❌ git failed: {error.stderr.decode('utf-8', 'replace').strip()}")
+            return 2
+        if args.json:
+            print(json.dumps({'affected': affected, 'unaffected': unaffected, 'changed': changed}, indent=2))
+            return 0
+        print(f"🔍 {len(changed)} changed paths between {base} and {head or 'the working tree'}")
+        for name, reasons in affected.items():
+            print(f"🔨 {name}")
+            for reason in reasons:
+                print(f"   - {reason}")
+        for name in unaffected:
+            print(f"⏭️  {name} (unaffected)")
+        return 0
+
+    project = pbxproj.read(generator.project_file)
+    result = {}
+    for name, inputs in target_inputs(project).items():
+        digest, digests = fingerprint(name, inputs)
+        result[name] = {'fingerprint': digest, 'inputs': digests} if args.inputs else digest
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+        print(f"✅ Wrote {len(result)} target fingerprints to {args.output}")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
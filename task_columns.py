@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Columnar, memory-mapped task snapshot store with vectorized analytics.
+
+Questions like "how many Schedule tasks are older than 14 days"
+(getOldTasks), quadrant counts per day or completion rates otherwise need
+the live app and a linear scan of [TaskItem]. This stores exported
+reminders column-wise in a directory:
+
+    meta.json            row count, column dtypes, quadrant/calendar tables
+    quadrant.u8          QUADRANTS index, 255 = skipped by loadReminders
+    calendar.u16         index into meta["calendars"]
+    completed.u8         isCompleted
+    last_modified.i64    epoch seconds; MISSING (int64 min) when absent
+    created.i64, completion.i64, due.i64
+    tag_offsets.i64      CSR row offsets (rows + 1) into tag_ids
+    tag_ids.i32          case-insensitive tag ids
+    ids, titles, tags    string tables: "<name>.off" (uint64 offsets,
+                         entries + 1) plus "<name>.bin" (UTF-8 blob); the
+                         tags table is indexed by tag id
+
+Columns are written in chunks and read back with numpy.memmap, and every
+aggregate walks the columns in fixed-size slices, so memory stays flat
+for millions of rows.
+
+Usage:
+    python3 task_columns.py build reminders.jsonl tasks.cols
+    python3 task_columns.py synth tasks.cols --count 1000000
+    python3 task_columns.py stats tasks.cols [--old-days 14]
+    python3 task_columns.py daily tasks.cols [--days 30]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("task_columns.py needs NumPy: pip3 install numpy")
+
+from reminders_model import (
+    QUADRANTS, QUADRANT_INDEX, classify, extract_tags, iter_snapshot, iter_synthetic_corpus,
+)
+
+FORMAT_VERSION = 1
+MISSING = np.iinfo(np.int64).min
+UNCLASSIFIED = 255
+MAX_CALENDARS = np.iinfo(np.uint16).max + 1  # calendar.u16 indexes
+CHUNK_ROWS = 1 << 16
+SCAN_ROWS = 1 << 20
+
+_COLUMNS = {
+    'quadrant': ('quadrant.u8', np.uint8),
+    'calendar': ('calendar.u16', np.uint16),
+    'completed': ('completed.u8', np.uint8),
+    'last_modified': ('last_modified.i64', np.int64),
+    'created': ('created.i64', np.int64),
+    'completion': ('completion.i64', np.int64),
+    'due': ('due.i64', np.int64),
+}
+_STRING_TABLES = ('ids', 'titles', 'tags')
+
+
+def _stamp(value):
+    return MISSING if value is None else int(value)
+
+
+class _StringTableWriter:
+    def __init__(self, directory, name):
+        self.blob = open(os.path.join(directory, name + '.bin'), 'wb')
+        self.offsets = open(os.path.join(directory, name + '.off'), 'wb')
+        self.position = 0
+        self.pending = [0]
+
+    def append(self, text):
+        data = text.encode('utf-8')
+        self.blob.write(data)
+        self.position += len(data)
+        self.pending.append(self.position)
+        if len(self.pending) >= CHUNK_ROWS:
+            self.flush()
+
+    def flush(self):
+        np.asarray(self.pending, dtype=np.uint64).tofile(self.offsets)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        self.blob.close()
+        self.offsets.close()
+
+
+class ColumnWriter:
+    """Streams reminders into a column directory"""
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.rows = 0
+        self.files = {name: open(os.path.join(directory, fname), 'wb')
+                      for name, (fname, _) in _COLUMNS.items()}
+        self.buffers = {name: [] for name in _COLUMNS}
+        self.tag_offsets_file = open(os.path.join(directory, 'tag_offsets.i64'), 'wb')
+        self.tag_ids_file = open(os.path.join(directory, 'tag_ids.i32'), 'wb')
+        self.tag_offsets = [0]
+        self.tag_ids = []
+        self.tags_total = 0
+        self.tag_lookup = {}
+        self.calendar_lookup = {}
+        self.strings = {name: _StringTableWriter(directory, name) for name in _STRING_TABLES}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, reminder):
+        quadrant = classify(reminder)
+        calendar = self.calendar_lookup.get(reminder.calendar)
+        if calendar is None:
+            calendar = len(self.calendar_lookup)
+            if calendar >= MAX_CALENDARS:
+                raise ValueError(f"{self.directory}: more than {MAX_CALENDARS} calendars "
+                                 f"do not fit the calendar.u16 column")
+            self.calendar_lookup[reminder.calendar] = calendar
+        row = self.buffers
+        row['quadrant'].append(UNCLASSIFIED if quadrant is None else QUADRANT_INDEX[quadrant])
+        row['calendar'].append(calendar)
+        row['completed'].append(1 if reminder.is_completed else 0)
+        row['last_modified'].append(_stamp(reminder.last_modified))
+        row['created'].append(_stamp(reminder.creation_date))
+        row['completion'].append(_stamp(reminder.completion_date))
+        row['due'].append(_stamp(reminder.due_date))
+        for tag in extract_tags(reminder.notes):
+            tag_id = self.tag_lookup.get(tag.lower())
+            if tag_id is None:
+                tag_id = self.tag_lookup[tag.lower()] = len(self.tag_lookup)
+                self.strings['tags'].append(tag)
+            self.tag_ids.append(tag_id)
+            self.tags_total += 1
+        self.tag_offsets.append(self.tags_total)
+        self.strings['ids'].append(reminder.id)
+        self.strings['titles'].append(reminder.title)
+        self.rows += 1
+        if len(row['quadrant']) >= CHUNK_ROWS:
+            self.flush()
+
+    def flush(self):
+        for name, (_, dtype) in _COLUMNS.items():
+            np.asarray(self.buffers[name], dtype=dtype).tofile(self.files[name])
+            self.buffers[name] = []
+        np.asarray(self.tag_offsets, dtype=np.int64).tofile(self.tag_offsets_file)
+        np.asarray(self.tag_ids, dtype=np.int32).tofile(self.tag_ids_file)
+        self.tag_offsets = []
+        self.tag_ids = []
+
+    def close(self):
+        self.flush()
+        for f in self.files.values():
+            f.close()
+        self.tag_offsets_file.close()
+        self.tag_ids_file.close()
+        for table in self.strings.values():
+            table.close()
+        meta = {
+            'version': FORMAT_VERSION,
+            'rows': self.rows,
+            'tags': len(self.tag_lookup),
+            'quadrants': QUADRANTS,
+            'calendars': sorted(self.calendar_lookup, key=self.calendar_lookup.get),
+            'columns': {name: [fname, np.dtype(dtype).str] for name, (fname, dtype) in _COLUMNS.items()},
+        }
+        with open(os.path.join(self.directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+
+def write_columns(directory, reminders):
+    """Write any iterable of Reminder objects; returns the row count"""
+    with ColumnWriter(directory) as writer:
+        for reminder in reminders:
+            writer.append(reminder)
+    return writer.rows
+
+
+class TaskColumns:
+    """Read-only, memory-mapped view of a column directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{directory}: unsupported column format {meta.get('version')}")
+        self.rows = meta['rows']
+        self.calendars = meta['calendars']
+        for name, (fname, dtype) in meta['columns'].items():
+            setattr(self, name, self._map(fname, dtype, self.rows))
+        self.tag_offsets = self._map('tag_offsets.i64', np.int64, self.rows + 1)
+        self.tag_ids = self._map('tag_ids.i32', np.int32, int(self.tag_offsets[-1]))
+        self.tag_count = meta['tags']
+        self._tables = {}
+
+    def _map(self, fname, dtype, count):
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(os.path.join(self.directory, fname), dtype=dtype, mode='r', shape=(count,))
+
+    def _string(self, table, index):
+        if table not in self._tables:
+            count = self.tag_count if table == 'tags' else self.rows
+            offsets = self._map(table + '.off', np.uint64, count + 1)
+            size = int(offsets[-1])
+            self._tables[table] = (offsets, self._map(table + '.bin', np.uint8, size))
+        offsets, blob = self._tables[table]
+        return bytes(blob[int(offsets[index]):int(offsets[index + 1])]).decode('utf-8')
+
+    def id(self, row):
+        return self._string('ids', row)
+
+    def title(self, row):
+        return self._string('titles', row)
+
+    def tag_name(self, tag_id):
+        return self._string('tags', tag_id)
+
+    def tags(self, row):
+        start, end = int(self.tag_offsets[row]), int(self.tag_offsets[row + 1])
+        return [self.tag_name(int(t)) for t in self.tag_ids[start:end]]
+
+    def slices(self, rows=None):
+        rows = self.rows if rows is None else rows
+        for start in range(0, rows, SCAN_ROWS):
+            yield slice(start, min(start + SCAN_ROWS, rows))
+
+    # Aggregates ------------------------------------------------------------
+
+    def quadrant_counts(self, include_completed=True):
+        """Rows per quadrant (plus 'unclassified' for reminders loadReminders skips)"""
+        totals = np.zeros(256, dtype=np.int64)
+        for s in self.slices():
+            quadrant = self.quadrant[s]
+            if not include_completed:
+                quadrant = quadrant[self.completed[s] == 0]
+            totals += np.bincount(quadrant, minlength=256)
+        counts = {q: int(totals[i]) for i, q in enumerate(QUADRANTS)}
+        counts['unclassified'] = int(totals[UNCLASSIFIED])
+        return counts
+
+    def old_task_mask(self, s, cutoff, quadrant=None):
+        mask = (self.last_modified[s] < cutoff) & (self.completed[s] == 0)
+        if quadrant is None:
+            mask &= self.quadrant[s] != UNCLASSIFIED
+        else:
+            mask &= self.quadrant[s] == QUADRANT_INDEX[quadrant]
+        return mask
+
+    def old_tasks(self, days_old=14, now=None, quadrant=None):
+        """getOldTasks: incomplete tasks untouched for days_old days; returns row indices"""
+        cutoff = (time.time() if now is None else now) - days_old * 86400
+        rows = [np.flatnonzero(self.old_task_mask(s, cutoff, quadrant)) + s.start
+                for s in self.slices()]
+        return np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+
+    def count_old_tasks(self, days_old=14, now=None, quadrant=None):
+        cutoff = (time.time() if now is None else now) - days_old * 86400
+        return sum(int(np.count_nonzero(self.old_task_mask(s, cutoff, quadrant)))
+                   for s in self.slices())
+
+    def completion_rates(self):
+        """Completed / total per quadrant"""
+        totals = np.zeros(256, dtype=np.int64)
+        done = np.zeros(256, dtype=np.int64)
+        for s in self.slices():
+            quadrant = self.quadrant[s]
+            totals += np.bincount(quadrant, minlength=256)
+            done += np.bincount(quadrant, weights=self.completed[s], minlength=256).astype(np.int64)
+        rates = {}
+        for i, q in enumerate(QUADRANTS + ['unclassified']):
+            code = UNCLASSIFIED if q == 'unclassified' else i
+            rates[q] = float(done[code]) / totals[code] if totals[code] else 0.0
+        return rates
+
+    def daily_counts(self, column='created', days=30, now=None, tz_offset=None):
+        """Per-day quadrant counts for the last `days` local days of `column`
+
+        Returns (first_day_start, counts) where counts has shape
+        (days, len(QUADRANTS) + 1) and the last column is unclassified.
+        """
+        now = time.time() if now is None else now
+        if tz_offset is None:
+            tz_offset = time.localtime(now).tm_gmtoff
+        today = (int(now) + tz_offset) // 86400
+        first = today - days + 1
+        width = len(QUADRANTS) + 1
+        counts = np.zeros(days * width, dtype=np.int64)
+        values = getattr(self, column)
+        for s in self.slices():
+            stamps = values[s]
+            valid = stamps != MISSING
+            day = (stamps[valid] + tz_offset) // 86400 - first
+            quadrant = self.quadrant[s][valid].astype(np.int64)
+            quadrant[quadrant == UNCLASSIFIED] = width - 1
+            keep = (day >= 0) & (day < days)
+            counts += np.bincount(day[keep] * width + quadrant[keep], minlength=days * width)
+        return first * 86400 - tz_offset, counts.reshape(days, width)
+
+    def tag_frequencies(self, top=10):
+        totals = np.zeros(self.tag_count, dtype=np.int64)
+        for s in self.slices(len(self.tag_ids)):
+            totals += np.bincount(self.tag_ids[s], minlength=self.tag_count)
+        order = np.argsort(-totals, kind='stable')[:top]
+        return [(self.tag_name(int(t)), int(totals[t])) for t in order if totals[t]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='convert a JSON / JSON Lines snapshot')
+    build.add_argument('snapshot')
+    build.add_argument('directory')
+    synth = commands.add_parser('synth', help='write a synthetic corpus')
+    synth.add_argument('directory')
+    synth.add_argument('--count', type=int, default=1000000)
+    synth.add_argument('--seed', type=int, default=0)
+    stats = commands.add_parser('stats', help='quadrant counts, old tasks, completion rates')
+    stats.add_argument('directory')
+    stats.add_argument('--old-days', type=int, default=14)
+    daily = commands.add_parser('daily', help='per-day quadrant counts')
+    daily.add_argument('directory')
+    daily.add_argument('--days', type=int, default=30)
+    daily.add_argument('--column', choices=['created', 'last_modified', 'completion', 'due'],
+                       default='created')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command in ('build', 'synth'):
+        if args.command == 'build':
+            reminders = iter_snapshot(args.snapshot)
+        else:
+            reminders = iter_synthetic_corpus(args.count, seed=args.seed)
+        rows = write_columns(args.directory, reminders)
+        print(f"✅ Wrote {rows} rows to {args.directory} in {time.perf_counter() - start:.1f}s")
+        return 0
+
+    columns = TaskColumns(args.directory)
+    if args.command == 'stats':
+        print(f"📊 {columns.rows} reminders")
+        for quadrant, count in columns.quadrant_counts().items():
+            print(f"   - {quadrant}: {count}")
+        print(f"⏳ Older than {args.old_days} days (incomplete):")
+        for quadrant in QUADRANTS:
+            print(f"   - {quadrant}: {columns.count_old_tasks(args.old_days, quadrant=quadrant)}")
+        print("✅ Completion rate:")
+        for quadrant, rate in columns.completion_rates().items():
+            print(f"   - {quadrant}: {rate:.1%}")
+        print("🏷️  Top tags: " + ', '.join(f"{t} ({n})" for t, n in columns.tag_frequencies()))
+    else:
+        first, counts = columns.daily_counts(args.column, args.days)
+        print(f"{'day':<12}" + ''.join(f"{q.split(' /')[0]:>10}" for q in QUADRANTS) + f"{'untagged':>10}")
+        for offset, row in enumerate(counts):
+            day = time.strftime('%Y-%m-%d', time.localtime(first + offset * 86400 + 43200))
+            print(f"{day:<12}" + ''.join(f"{int(n):>10}" for n in row))
+    print(f"⏱️  {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
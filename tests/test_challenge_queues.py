@@ -0,0 +1,30 @@
+import random
+from dataclasses import replace
+
+from challenge_queues import DAY, ChallengeQueues, _synthetic_tasks, refilter
+
+
+def test_queues_match_refilter_order_after_deltas():
+    now = 1_700_000_000
+    tasks = _synthetic_tasks(2000, now)
+    queues = ChallengeQueues().build(tasks, now)
+    rng = random.Random(3)
+    picked = rng.sample(range(len(tasks)), 250)
+    changed = []
+    for i in picked[:200]:
+        tasks[i] = replace(tasks[i], last_modified=now - rng.randrange(30) * DAY,
+                           title=rng.choice(['stuff', tasks[i].title]))
+        changed.append(tasks[i])
+    deleted = {tasks[i].id for i in picked[200:]}
+    tasks = [t for t in tasks if t.id not in deleted]
+    later = now + 3 * DAY
+    queues.apply(changed, deleted, later)
+    for rule in queues.rules:
+        assert list(queues.queue(rule.name)) == refilter(tasks, rule, later)
+
+
+def test_queue_is_a_cached_view():
+    now = 1_700_000_000
+    queues = ChallengeQueues().build(_synthetic_tasks(100, now), now)
+    for rule in queues.rules:
+        assert queues.queue(rule.name) is queues.queue(rule.name)
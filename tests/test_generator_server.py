@@ -0,0 +1,19 @@
+import pytest
+
+import create_multiplatform_project as generator
+from generator_server import ProjectState
+
+
+@pytest.mark.parametrize('request_', [[], 'check', 1, None])
+def test_non_object_requests_are_rejected(request_):
+    response = ProjectState().handle(request_)
+    assert response['ok'] is False
+    assert 'expected a JSON object' in response['error']
+
+
+def test_check_uses_the_directory_index():
+    state = ProjectState()
+    sources, assets = state.listings()
+    assert sources == generator.source_paths()
+    assert sorted(assets) == sorted(generator.asset_catalog_files())
+    assert state.handle({'op': 'check'}) == {'ok': True, 'drift': []}
@@ -0,0 +1,107 @@
+import pytest
+
+from invalidation_fanout import Analysis, parse_sources
+
+SOURCE = """\
+import SwiftUI
+
+@main
+struct DemoApp: App {
+    @StateObject private var store = Store()
+
+    var body: some Scene {
+        WindowGroup {
+            ContentView()
+                .environmentObject(store)
+        }
+    }
+}
+
+class Store: ObservableObject {
+    @Published var tasks: [String] = []
+    @Published var delegates: [String] = []
+
+    func load() {
+        tasks = ["a", "b"]
+    }
+
+    func addDelegate(_ name: String) {
+        delegates.append(name)
+    }
+
+    func refresh() {
+        load()
+        addDelegate("x")
+    }
+}
+
+struct ContentView: View {
+    @EnvironmentObject var store: Store
+
+    var openTasks: [String] {
+        store.tasks.filter { !$0.isEmpty }
+    }
+
+    var body: some View {
+        VStack {
+            Text("\\(openTasks.count) of \\(store.tasks.count)")
+            ForEach(openTasks, id: \\.self) { task in
+                RowView(title: task)
+            }
+            BadgeView()
+        }
+    }
+}
+
+struct RowView: View {
+    let title: String
+
+    var body: some View {
+        Text(title)
+    }
+}
+
+struct BadgeView: View {
+    @EnvironmentObject var store: Store
+
+    var body: some View {
+        Text("\\(store.delegates.count)")
+    }
+}
+"""
+
+
+@pytest.fixture
+def report(tmp_path):
+    (tmp_path / 'App.swift').write_text(SOURCE)
+    sizes = {'tasks': 100, 'delegates': 5, 'default': 100}
+    return Analysis(parse_sources(str(tmp_path)), sizes).report()['Store']
+
+
+def test_views_ranked_by_work(report):
+    rows = [(r['view'], r['reason'], r['instances'], r['passes'], r['visits_per_publish'])
+            for r in report['views']]
+    assert rows == [
+        ('ContentView', 'observes', 1, {'tasks': 2}, 200),
+        ('RowView', 'recreated', 100, {}, 0),
+        ('BadgeView', 'observes', 1, {}, 0),
+        ('DemoApp', 'observes', 1, {}, 0),
+    ]
+
+
+def test_properties_and_wasted_instances(report):
+    assert report['properties']['tasks']['readers'] == ['ContentView']
+    assert report['properties']['delegates']['readers'] == ['BadgeView']
+    assert report['properties']['tasks']['wasted_instances'] == 102
+    assert report['properties']['tasks']['invalidated_instances'] == 103
+
+
+def test_invalidation_paths_ranked_by_visits(report):
+    top = [(p['writer'], p['view'], p['visits'], p['wasted']) for p in report['paths'][:4]]
+    assert top == [
+        ('refresh', 'ContentView', 400, False),     # calls load() and addDelegate()
+        ('addDelegate', 'ContentView', 200, True),  # ContentView never reads delegates
+        ('load', 'ContentView', 200, False),
+        ('addDelegate', 'BadgeView', 0, False),
+    ]
+    assert report['paths'][0]['writes'] == {'tasks': 1, 'delegates': 1}
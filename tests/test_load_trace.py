@@ -0,0 +1,124 @@
+import pytest
+
+from load_trace import DAY, line_timestamp, parse_log, scaling
+
+# A captured DEBUG session: a complete load, an unauthorized one, a load
+# cut short by the next 🔐 line and a load whose commit failed
+LOG = """\
+10:15:00.000 🔐 Authorization status: 3, Authorized: true
+10:15:00.010 📅 Found 2 reminder calendars
+10:15:00.011    - Reminders (Source: iCloud)
+10:15:00.012    - Work (Source: iCloud)
+10:15:00.110 📥 Fetched 4 reminders from EventKit
+10:15:00.111 📋 Loading 4 reminders...
+10:15:00.120 📋 Found 3 reminders to load:
+10:15:00.121    - Incomplete: 2
+10:15:00.122    - Completed today: 1
+10:15:00.123    - Filtered out: 1 (completed on other days)
+10:15:00.130 ✅ Found DoNow hashtag in reminder: 'Pay rent'
+10:15:00.131    Matched: '#donow'
+10:15:00.132    → Assigned to quadrant: Do Now
+10:15:00.140 ✅ Found Bin hashtag (regex) in reminder: 'Old idea'
+10:15:00.141    → Assigned to quadrant: Bin / Challenge
+10:15:00.150 🎯 Task 'Rethink' has #challenge tag - assigning to Bin / Challenge
+10:15:00.160 🔧 Normalization details:
+10:15:00.161    - Original notes: '#DoNow #today'
+10:15:00.170 🔄 Updated reminder notes for 'Pay rent' to sync tags
+10:15:00.180    📌 Other tags found for 'Pay rent': #today
+10:15:00.200
+10:15:00.200 📊 SUMMARY:
+10:15:00.201 ✅ Loaded 3 tasks
+10:15:00.202    - Do Now: 1
+10:15:00.203    - Delegate: 0
+10:15:00.204    - Schedule: 0
+10:15:00.205    - Bin: 2
+10:15:00.250 ✅ Committed all reminder updates
+10:16:00.000 🔐 Authorization status: 2, Authorized: false
+10:16:00.001 ❌ Not authorized to load reminders. Status: 2
+10:17:00.000 🔐 Authorization status: 3, Authorized: true
+10:17:00.010 📅 Found 2 reminder calendars
+10:17:01.000 🔐 Authorization status: 3, Authorized: true
+10:17:01.010 📅 Found 2 reminder calendars
+10:17:01.100 📥 Fetched 1 reminders from EventKit
+10:17:01.110 📋 Found 1 reminders to load:
+10:17:01.200 📊 SUMMARY:
+10:17:01.201 ✅ Loaded 1 tasks
+10:17:01.202    - Schedule: 1
+10:17:01.300 ⚠️ Failed to commit reminder updates: The operation couldn’t be completed.
+"""
+
+
+@pytest.fixture
+def traces():
+    return list(parse_log(LOG.splitlines(keepends=True)))
+
+
+def test_complete_load(traces):
+    trace = traces[0]
+    assert trace.complete and trace.authorized and trace.committed
+    assert (trace.calendars, trace.fetched, trace.to_load) == (2, 4, 3)
+    assert (trace.incomplete, trace.completed_today, trace.filtered_out) == (2, 1, 1)
+    assert trace.matched_tags == {'DoNow': 1, 'Bin': 1}
+    assert trace.regex_matches == 1
+    assert trace.assigned == {'Do Now': 1, 'Bin / Challenge': 1}
+    assert trace.challenge_fallback == 1
+    assert (trace.normalized, trace.notes_rewritten, trace.with_other_tags) == (1, 1, 1)
+    assert trace.loaded == 3
+    assert [phase for phase, _ in trace.timeline()] == ['calendars', 'fetch', 'filter', 'classify', 'commit']
+    assert trace.duration() == pytest.approx(0.25)
+
+
+def test_summary_maps_bin_to_its_quadrant(traces):
+    assert traces[0].quadrants == {'Do Now': 1, 'Delegate': 0, 'Schedule': 0, 'Bin / Challenge': 2}
+
+
+def test_unauthorized_load(traces):
+    trace = traces[1]
+    assert trace.complete and trace.authorized is False and trace.auth_status == 2
+    assert trace.fetched is None and trace.committed is None
+
+
+def test_load_cut_short_by_the_next_authorization(traces):
+    trace = traces[2]
+    assert not trace.complete
+    assert trace.calendars == 2 and trace.fetched is None
+
+
+def test_failed_commit(traces):
+    trace = traces[3]
+    assert len(traces) == 4
+    assert trace.complete and trace.committed is False
+    assert trace.commit_error == 'The operation couldn’t be completed.'
+    assert trace.quadrants == {'Schedule': 1}
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('2024-05-01 10:15:00.250000+0200 GetSh1tDone: ✅', 1714551300.25),
+    ('[2024-05-01T08:15:00Z] ✅', 1714551300.0),
+    ('10:15:00,5 ✅', 36900.5),
+    ('✅ Committed all reminder updates', None),
+])
+def test_line_timestamp(line, expected):
+    ts, rest = line_timestamp(line)
+    assert ts == (None if expected is None else pytest.approx(expected))
+    assert rest.endswith(('✅', 'updates'))
+
+
+def test_load_across_midnight_keeps_phases_positive():
+    log = [
+        '23:59:59.900 🔐 Authorization status: 3, Authorized: true',
+        '23:59:59.950 📅 Found 1 reminder calendars',
+        '00:00:00.050 📥 Fetched 10 reminders from EventKit',
+        '00:00:00.100 📋 Found 10 reminders to load:',
+        '00:00:00.150 📊 SUMMARY:',
+        '00:00:00.200 ✅ Committed all reminder updates',
+        '00:00:01.000 🔐 Authorization status: 3, Authorized: true',
+        '00:00:01.000 📅 Found 1 reminder calendars',
+        '00:00:01.300 📥 Fetched 20 reminders from EventKit',
+        '00:00:01.400 ✅ Committed all reminder updates',
+    ]
+    first, second = parse_log(log)
+    assert all(seconds >= 0 for _, seconds in first.timeline())
+    assert first.duration() == pytest.approx(0.3)
+    assert first.marks['committed'] > DAY
+    assert scaling([first, second])[0] > 0
@@ -0,0 +1,39 @@
+import io
+import os
+
+import pbxproj
+
+PROJECT = os.path.join(os.path.dirname(__file__), '..', 'GetSh1tDone.xcodeproj', 'project.pbxproj')
+
+
+def _configs(project, owner_id):
+    objects = project['objects']
+    config_list = objects[objects[owner_id]['buildConfigurationList']]
+    return [objects[c] for c in config_list['buildConfigurations']]
+
+
+def test_dump_load_round_trip():
+    with open(PROJECT, encoding='utf-8') as f:
+        text = f.read()
+    out = io.StringIO()
+    pbxproj.dump(pbxproj.load(io.StringIO(text)), out)
+    assert out.getvalue() == text
+
+
+def test_canonicalize_keeps_inherited_settings():
+    project = pbxproj.read(PROJECT)
+    root_id = project['rootObject']
+    target_id = project['objects'][root_id]['targets'][0]
+    for config in _configs(project, root_id):
+        config['buildSettings']['OTHER_SWIFT_FLAGS'] = '$(inherited) -Onone'
+        config['buildSettings']['HEADER_SEARCH_PATHS'] = ['$(inherited)', 'include']
+        config['buildSettings']['SWIFT_STRICT_CONCURRENCY'] = 'complete'
+    for config in _configs(project, target_id):
+        config['buildSettings']['OTHER_SWIFT_FLAGS'] = '$(inherited) -Onone'
+        config['buildSettings']['HEADER_SEARCH_PATHS'] = ['$(inherited)', 'include']
+        config['buildSettings']['SWIFT_STRICT_CONCURRENCY'] = 'complete'
+    pbxproj.canonicalize(project)
+    for config in _configs(project, target_id):
+        assert config['buildSettings']['OTHER_SWIFT_FLAGS'] == '$(inherited) -Onone'
+        assert config['buildSettings']['HEADER_SEARCH_PATHS'] == ['$(inherited)', 'include']
+        assert 'SWIFT_STRICT_CONCURRENCY' not in config['buildSettings']
@@ -0,0 +1,52 @@
+import pytest
+
+from period_rollover import apply, next_period, rollover, transition
+from reminders_model import Reminder, synthetic_corpus, to_task
+
+NOW = 1_700_000_000
+
+
+def _task(notes):
+    return to_task(Reminder(id='a', title='Plan the offsite', notes=notes), 0)
+
+
+@pytest.mark.parametrize('tag, boundary, policy, expected', [
+    ('#today', 'day', 'release', '#thisweek'),
+    ('#thisweek', 'week', 'release', '#thismonth'),
+    ('#today', 'month', 'release', '#thisweek'),
+    ('#thisquarter', 'quarter', 'release', None),
+    ('#thisweek', 'day', 'release', '#thisweek'),
+    ('#thismonth', 'month', 'escalate', '#today'),
+    ('#thisweek', 'week', 'clear', None),
+])
+def test_next_period(tag, boundary, policy, expected):
+    assert next_period(tag, boundary, policy) == expected
+
+
+def test_transition_moves_to_the_next_period():
+    change = transition(_task('#Schedule #thisweek'), 'week')
+    assert change.before == ['#thisweek']
+    assert change.after == '#thismonth'
+    assert '#thismonth' in change.notes and '#thisweek' not in change.notes
+
+
+def test_transition_clears_the_tag():
+    change = transition(_task('#Schedule #today'), 'day', 'clear')
+    assert change.after is None
+    assert '#today' not in change.notes
+
+
+def test_transition_leaves_running_periods_alone():
+    assert transition(_task('#Schedule #thismonth'), 'week') is None
+    assert transition(_task('#Schedule'), 'quarter') is None
+    assert transition(_task('#Schedule #today'), 'day', 'escalate') is None
+
+
+@pytest.mark.parametrize('boundary', ['day', 'week', 'month', 'quarter'])
+def test_rollover_is_idempotent_and_skips_completed(boundary):
+    reminders = synthetic_corpus(2000, now=NOW)
+    changes = list(rollover(reminders, boundary, now=NOW))
+    completed = {r.id for r in reminders if r.is_completed}
+    assert changes and not completed.intersection(c.id for c in changes)
+    rolled = apply(reminders, changes, now=NOW)
+    assert list(rollover(rolled, boundary, now=NOW)) == []
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from prepare_index import (
+    LIST_NAMES, PERIODS, PREFIX, PrepareIndex, build_indexes, day_suffix, period_boundaries,
+    prepare_sessions, question_from_title, synthetic_history,
+)
+
+NOW = datetime(2025, 1, 15, 9, 30)
+
+
+def _days(start, end):
+    return start.date().isoformat(), end.date().isoformat()
+
+
+@pytest.mark.parametrize('now, week_day, expected', [
+    (datetime(2025, 1, 15, 9), 2, ('2025-01-13', '2025-01-20')),   # Wednesday, weeks from Monday
+    (datetime(2025, 1, 13, 0), 2, ('2025-01-13', '2025-01-20')),   # on the prep day itself
+    (datetime(2025, 1, 12, 23), 2, ('2025-01-06', '2025-01-13')),  # Sunday before it
+    (datetime(2025, 1, 15, 9), 1, ('2025-01-12', '2025-01-19')),   # weeks from Sunday
+    (datetime(2025, 1, 1, 9), 7, ('2024-12-28', '2025-01-04')),    # across the year boundary
+])
+def test_week_boundaries(now, week_day, expected):
+    assert _days(*period_boundaries(now, week_day)['week']) == expected
+
+
+def test_week_without_a_prep_day():
+    assert period_boundaries(NOW, 0)['week'] is None
+    assert period_boundaries(NOW, 8)['week'] is None
+
+
+@pytest.mark.parametrize('now, expected', [
+    (datetime(2025, 1, 31, 23, 59), ('2025-01-01', '2025-02-01')),
+    (datetime(2024, 2, 29, 12), ('2024-02-01', '2024-03-01')),
+    (datetime(2024, 12, 31, 12), ('2024-12-01', '2025-01-01')),
+])
+def test_month_boundaries(now, expected):
+    assert _days(*period_boundaries(now)['month']) == expected
+
+
+@pytest.mark.parametrize('now, start_month, expected', [
+    (datetime(2025, 2, 10), 1, ('2025-01-01', '2025-04-01')),
+    (datetime(2024, 11, 5), 1, ('2024-10-01', '2025-01-01')),   # Q4 ends at the year boundary
+    (datetime(2025, 3, 31), 4, ('2025-01-01', '2025-04-01')),   # Q4 of an April year
+    (datetime(2025, 4, 1), 4, ('2025-04-01', '2025-07-01')),
+    # Documented deviation: the app's startOfCurrentQuarter keeps the current
+    # year and would start this quarter in November 2025, in the future
+    (datetime(2025, 1, 15), 11, ('2024-11-01', '2025-02-01')),
+    (datetime(2025, 12, 15), 12, ('2025-12-01', '2026-03-01')),
+])
+def test_quarter_boundaries(now, start_month, expected):
+    assert _days(*period_boundaries(now, quarter_start_month=start_month)['quarter']) == expected
+
+
+def test_question_from_title():
+    assert question_from_title('Prepare-Top 3 outcomes-w/c-13 Jan 25') == 'Top 3 outcomes'
+    assert question_from_title('Prepare-What matters today?-15 Jan 25') == 'What matters today?'
+    assert question_from_title('Prepare-Goals-Jan 2025') == 'Goals'
+    assert question_from_title('Prepare-Outcomes-Q1') == 'Outcomes'
+    assert question_from_title('Prepare-No suffix ') == 'No suffix'
+
+
+# Brute-force versions of the Swift loops --------------------------------------
+
+def _prepare(reminders, list_name):
+    return [r for r in reminders
+            if r.calendar.lower() == list_name and r.title.startswith(PREFIX)]
+
+
+def _created(reminder):
+    return reminder.creation_date if reminder.creation_date is not None else float('-inf')
+
+
+def _swift_session(reminders, list_name, start, end):
+    entries, to_complete = [], []
+    for r in _prepare(reminders, list_name):
+        created = _created(r)
+        if created < start:
+            if not r.is_completed:
+                to_complete.append(r.id)
+            continue
+        if end is not None and created >= end:
+            continue
+        entries.append((created, question_from_title(r.title), r.notes.strip()))
+    entries.sort(key=lambda e: e[0])
+    return [(q, a) for _, q, a in entries], sorted(to_complete)
+
+
+def _swift_fetch(reminders, list_name, incomplete_only, today, windows):
+    result = []
+    for r in _prepare(reminders, list_name):
+        if incomplete_only and r.is_completed:
+            continue
+        if today is not None and not r.title.endswith('-' + day_suffix(today)):
+            continue
+        created = _created(r)
+        if any(not start.timestamp() <= created < end.timestamp() for start, end in windows):
+            continue
+        result.append((question_from_title(r.title), r.notes.strip()))
+    return result
+
+
+@pytest.fixture(scope='module')
+def history():
+    return synthetic_history(years=2, now=NOW)
+
+
+@pytest.mark.parametrize('now', [NOW, datetime(2025, 1, 1, 0, 0), datetime(2024, 12, 31, 23, 0),
+                                 datetime(2024, 4, 1, 7, 30)])
+@pytest.mark.parametrize('week_day, quarter_start', [(2, 1), (1, 4), (7, 11)])
+def test_sessions_match_brute_force(history, now, week_day, quarter_start):
+    sessions = prepare_sessions(build_indexes(history), now, week_day, quarter_start)
+    bounds = period_boundaries(now, week_day, quarter_start)
+    for period in PERIODS:
+        start, end = bounds[period]
+        session = sessions[period]
+        expected = _swift_session(history, LIST_NAMES[period], start.timestamp(),
+                                  None if period == 'day' else end.timestamp())
+        assert [(e.question, e.answer) for e in session.entries] == expected[0]
+        assert sorted(session.to_complete) == expected[1]
+
+
+@pytest.mark.parametrize('incomplete_only', [False, True])
+@pytest.mark.parametrize('list_name, today, period', [
+    ('today', NOW, None),
+    ('today', NOW - timedelta(days=40), None),
+    ('this week', None, 'week'),
+    ('this month', None, 'month'),
+    ('this quarter', None, 'quarter'),
+    ('this quarter', None, None),
+])
+def test_fetch_matches_brute_force(history, incomplete_only, list_name, today, period):
+    index = PrepareIndex(history, list_name)
+    windows = {}
+    if period is not None:
+        windows[f"{period}_start"] = period_boundaries(NOW)[period][0]
+    spans = [period_boundaries(NOW)[period]] if period is not None else []
+    got = index.fetch(incomplete_only, today, **windows)
+    expected = _swift_fetch(history, list_name, incomplete_only, today, spans)
+    assert sorted(got) == sorted(expected)
+    assert period is None or got
+
+
+def test_fetch_with_disjoint_windows_is_empty(history):
+    index = PrepareIndex(history, 'this month')
+    assert index.fetch(month_start=datetime(2024, 6, 1), quarter_start=datetime(2024, 1, 1)) == []
@@ -0,0 +1,60 @@
+import math
+
+from priority_matcher import PriorityMatcher, suggest
+from reminders_model import Reminder, tokenize
+
+NOW = 1_700_000_000
+DAY = 86400
+PRIORITIES = ['Ship the product roadmap', 'Sort out the tax return']
+
+REMINDERS = [
+    Reminder(id='roadmap-today', title='Ship product roadmap', notes='#DoNow #today'),
+    Reminder(id='roadmap-later', title='Draft roadmap slides', notes='#Schedule'),
+    Reminder(id='tax-due', title='File the tax return', due_date=NOW + 2 * DAY),
+    Reminder(id='gym-overdue', title='Book gym induction', notes='#Delegate', due_date=NOW - DAY),
+    Reminder(id='gym-later', title='Buy running shoes'),
+    Reminder(id='done', title='Ship product roadmap', is_completed=True),
+]
+
+
+def test_tokenize_drops_stop_words_and_suffixes():
+    assert tokenize("Email Sam about the budgets, re: planning") == ['email', 'sam', 'budget', 'plann']
+
+
+def test_suggested_quadrants():
+    suggestions = suggest(REMINDERS, PRIORITIES, now=NOW)
+    assert [(s.id, s.suggested, s.urgent) for s in suggestions] == [
+        ('roadmap-today', 'Do Now', '#today'),
+        ('roadmap-later', 'Schedule', None),
+        ('tax-due', 'Do Now', 'due soon'),
+        ('gym-overdue', 'Delegate', 'overdue'),
+        ('gym-later', 'Bin / Challenge', None),
+    ]
+    by_id = {s.id: s for s in suggestions}
+    assert by_id['roadmap-today'].priority == PRIORITIES[0]
+    assert by_id['tax-due'].priority == PRIORITIES[1]
+    assert by_id['roadmap-today'].current == 'Do Now'
+    assert by_id['gym-later'].current is None
+
+
+def test_closer_neighbours_score_higher():
+    suggestions = {s.id: s for s in suggest(REMINDERS, PRIORITIES, now=NOW)}
+    ranked = sorted(suggestions.values(), key=lambda s: -s.score)
+    assert [s.id for s in ranked[:3]] == ['roadmap-today', 'tax-due', 'roadmap-later']
+    assert suggestions['gym-later'].score == 0.0
+
+
+def test_scores_are_cosine_similarities():
+    open_reminders = [r for r in REMINDERS if not r.is_completed]
+    matcher = PriorityMatcher(open_reminders)
+    best = matcher.score(PRIORITIES)
+    doc = 0  # 'Ship product roadmap' against 'Ship the product roadmap': same terms
+    assert best[doc][0] == 0
+    assert math.isclose(best[doc][1], 1.0)
+
+
+def test_no_matches():
+    suggestions = suggest(REMINDERS, ['Learn the cello'], now=NOW)
+    assert all(s.priority is None and s.score == 0.0 for s in suggestions)
+    assert {s.suggested for s in suggestions} == {'Delegate', 'Bin / Challenge'}
+    assert suggest([], PRIORITIES, now=NOW) == []
@@ -0,0 +1,12 @@
+import create_multiplatform_project as generator
+
+
+def test_committed_manifest_matches_the_tree():
+    assert generator.check_manifest() == []
+
+
+def test_manifest_records_only_hashes():
+    manifest = generator.collect_inputs()
+    for section in ('files', 'project'):
+        for record in manifest[section].values():
+            assert set(record) == {'sha256'}
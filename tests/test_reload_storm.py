@@ -0,0 +1,57 @@
+import pytest
+
+from reload_storm import STRATEGIES, CostModel, Simulator, percentile, simulate, synthetic_storm
+
+COSTS = CostModel(reminders=5000)   # full reload 55 ms, incremental about 4.5 ms
+# A four-notification sync burst 10 ms apart, then a lone edit a second later
+BURST = [(0.0, 1), (0.010, 1), (0.020, 1), (0.030, 1), (1.0, 2)]
+
+
+def _runs(strategy):
+    simulator = Simulator(strategy, COSTS, debounce_ms=300)
+    report = simulator.run(BURST)
+    return report, [(round(start, 3), covered) for start, _, covered in simulator.runs]
+
+
+def test_full_reloads_once_per_notification():
+    report, runs = _runs('full')
+    assert runs == [(0.0, [0]), (0.055, [1, 2, 3]), (0.11, []), (0.165, []), (1.0, [4])]
+    assert (report['reloads'], report['redundant_reloads']) == (5, 2)
+    assert report['work_ms'] == pytest.approx(5 * 55)
+
+
+def test_debounced_waits_for_quiet():
+    report, runs = _runs('debounced')
+    assert runs == [(0.33, [0, 1, 2, 3]), (1.3, [4])]
+    assert (report['reloads'], report['redundant_reloads']) == (2, 0)
+    assert report['max_staleness_ms'] == pytest.approx(385)
+
+
+def test_coalesced_queues_at_most_one_reload():
+    report, runs = _runs('coalesced')
+    assert runs == [(0.0, [0]), (0.055, [1, 2, 3]), (1.0, [4])]
+    assert (report['reloads'], report['redundant_reloads']) == (3, 0)
+    assert report['max_staleness_ms'] == pytest.approx(100)
+
+
+def test_incremental_refreshes_per_notification():
+    report, runs = _runs('incremental')
+    assert runs == [(0.0, [0]), (0.01, [1]), (0.02, [2]), (0.03, [3]), (1.0, [4])]
+    assert (report['reloads'], report['redundant_reloads']) == (5, 0)
+    assert report['work_ms'] == pytest.approx(5 * (2.0 + 2.5) + 0.01 * 6)
+
+
+def test_every_notification_is_observed_on_a_seeded_storm():
+    storm = synthetic_storm(bursts=10, burst_size=6, seed=7)
+    assert storm == synthetic_storm(bursts=10, burst_size=6, seed=7)
+    results = {r['strategy']: r for r in simulate(storm, COSTS)}
+    assert list(results) == STRATEGIES
+    assert all(r['never_observed'] == 0 for r in results.values())
+    assert results['coalesced']['reloads'] <= results['full']['reloads']
+    assert results['debounced']['reloads'] <= results['coalesced']['reloads']
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile([], 50) == 0.0
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 99) == 4
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from reminder_dedup import find_duplicates, jaccard, normalize, shingles
+from reminders_model import Reminder, synthetic_corpus
+
+
+def test_jaccard_of_empty_sets_is_zero():
+    assert jaccard(set(), set()) == 0.0
+    assert jaccard({'ab'}, set()) == 0.0
+    assert jaccard({'ab', 'cd'}, {'ab'}) == 0.5
+
+
+def test_reminders_without_text_do_not_cluster():
+    reminders = [Reminder(id=str(i), title=title)
+                 for i, title in enumerate(['Do it', '#today', 'To do'])]
+    assert find_duplicates(reminders) == []
+
+
+def test_near_duplicates_keep_the_open_reminder():
+    reminders = [
+        Reminder(id='a', title='Renew the passport application', is_completed=True, last_modified=2),
+        Reminder(id='b', title='Renew passport application #today', last_modified=1),
+        Reminder(id='c', title='Water the plants'),
+        Reminder(id='d', title='Do it'),
+    ]
+    clusters = find_duplicates(reminders)
+    assert len(clusters) == 1
+    assert clusters[0]['keep']['id'] == 'b'
+    assert [m['id'] for m in clusters[0]['merge']] == ['a']
+
+
+def test_clusters_do_not_chain():
+    # b is close to both a and c, but a and c are not near-duplicates of each other
+    reminders = [
+        Reminder(id='a', title='Plan interview notes', last_modified=3),
+        Reminder(id='b', title='Plan interview notes today', last_modified=2),
+        Reminder(id='c', title='Plan interview notes today for Sam', last_modified=1),
+    ]
+    clusters = find_duplicates(reminders, threshold=0.7)
+    assert [(c['keep']['id'], [m['id'] for m in c['merge']]) for c in clusters] == [('a', ['b'])]
+
+
+@pytest.mark.parametrize('threshold', [0.4, 0.6, 0.8])
+def test_every_merge_candidate_reaches_the_threshold(threshold):
+    reminders = [r for r in synthetic_corpus(3000, now=1_700_000_000) if not r.is_completed]
+    by_id = {r.id: r for r in reminders}
+    clusters = find_duplicates(reminders, threshold)
+    assert clusters
+    for cluster in clusters:
+        keep = shingles(normalize(by_id[cluster['keep']['id']]))
+        for member in cluster['merge']:
+            assert member['similarity'] >= threshold
+            assert jaccard(keep, shingles(normalize(by_id[member['id']]))) >= threshold
@@ -0,0 +1,26 @@
+from reminders_diff import IncrementalLoader, diff_snapshots
+from reminders_model import churn, load_tasks, synthetic_corpus
+
+
+def test_diff_snapshots():
+    base = synthetic_corpus(50, now=1_700_000_000)
+    stamps = {r.id: r.last_modified for r in base}
+    changed = churn(base, 0.2, now=1_700_000_100)
+    diff, new_stamps = diff_snapshots(stamps, changed)
+    new_ids = {r.id for r in changed}
+    assert set(diff.inserted) == new_ids - stamps.keys()
+    assert set(diff.deleted) == stamps.keys() - new_ids
+    assert set(diff.updated) == {r.id for r in changed
+                                 if r.id in stamps and stamps[r.id] != r.last_modified}
+    assert new_stamps == {r.id: r.last_modified for r in changed}
+
+
+def test_incremental_refresh_matches_full_reload():
+    now = 1_700_000_000
+    base = synthetic_corpus(500, now=now - 60)
+    changed = churn(base, 0.3, now=now)
+    loader = IncrementalLoader()
+    loader.full_reload(base, now)
+    loader.refresh(changed, now)
+    expected = {task.id: task for task in load_tasks(changed, now)}
+    assert {task.id: task for task in loader.task_list()} == expected
@@ -0,0 +1,34 @@
+import pytest
+
+from reminders_model import Reminder, classify, extract_quadrant
+
+
+@pytest.mark.parametrize('notes, quadrant', [
+    ('#DoNow', 'Do Now'),
+    ('##delegate', 'Delegate'),
+    ('# #Schedule', 'Schedule'),
+    ('#  bin', 'Bin / Challenge'),
+    ('#challenge', 'Bin / Challenge'),
+    # the app's "#+\s*<tag>" regex fallback also spans newlines and longer runs of spaces
+    ('#\n donow', 'Do Now'),
+    ('#     schedule', 'Schedule'),
+    ('Call Sam', None),
+])
+def test_extract_quadrant(notes, quadrant):
+    assert extract_quadrant('Task', notes) == quadrant
+
+
+def test_extract_quadrant_priority_and_sources():
+    assert extract_quadrant('Task', '#Bin #DoNow') == 'Do Now'
+    assert extract_quadrant('Pay rent #delegate', '') == 'Delegate'
+    assert extract_quadrant('Pay rent', '', calendar='#Schedule') == 'Schedule'
+
+
+@pytest.mark.parametrize('notes, quadrant', [
+    ('#today', 'Schedule'),
+    ('#  #thisweek', 'Schedule'),
+    ('#   today', None),      # not one of loadReminders' time-period searchPatterns
+    ('today', None),
+])
+def test_classify_time_period_fallback(notes, quadrant):
+    assert classify(Reminder(id='r', title='Task', notes=notes)) == quadrant
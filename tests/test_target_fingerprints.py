@@ -0,0 +1,61 @@
+import pytest
+
+from target_fingerprints import evaluate, target_view
+
+IOS = frozenset({'iOS'})
+MACOS = frozenset({'macOS'})
+BOTH = IOS | MACOS
+
+SOURCE = '''import SwiftUI
+#if os(macOS)
+import AppKit
+#elseif os(iOS)
+import UIKit
+#endif
+struct A {
+#if DEBUG
+    let debug = true
+#else
+    let debug = false
+#endif
+#if canImport(EventKit) && os(iOS)
+    let store = 1
+#endif
+}'''
+
+
+@pytest.mark.parametrize('condition, platforms, expected', [
+    ('os(iOS)', IOS, True),
+    ('os(iOS)', MACOS, False),
+    ('!os(iOS)', MACOS, True),
+    ('os(iOS) || os(macOS)', IOS, True),
+    ('os(iOS)', BOTH, None),
+    ('DEBUG', IOS, None),
+    ('DEBUG && os(macOS)', IOS, False),
+    ('DEBUG || os(iOS)', IOS, True),
+    ('(os(iOS) || os(watchOS)) && !os(macOS)', IOS, True),
+    ('os(macOS) // comment', MACOS, True),
+])
+def test_evaluate(condition, platforms, expected):
+    assert evaluate(condition, platforms) is expected
+
+
+def test_target_view_drops_other_platforms():
+    ios = target_view(SOURCE, IOS)
+    assert 'import UIKit' in ios and 'AppKit' not in ios and '#if os(' not in ios
+    assert '#if DEBUG' in ios and 'let debug = false' in ios
+    assert '#if canImport(EventKit) && os(iOS)' in ios and 'let store = 1' in ios
+
+    macos = target_view(SOURCE, MACOS)
+    assert 'import AppKit' in macos and 'UIKit' not in macos
+    assert 'let store' not in macos and 'canImport' not in macos
+
+
+def test_target_view_ignores_edits_in_other_platform_branches():
+    edited = SOURCE.replace('import AppKit', 'import AppKit\nimport Combine')
+    assert target_view(edited, IOS) == target_view(SOURCE, IOS)
+    assert target_view(edited, MACOS) != target_view(SOURCE, MACOS)
+
+
+def test_target_view_keeps_undecidable_files_whole():
+    assert target_view(SOURCE, BOTH) == SOURCE
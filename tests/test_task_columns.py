@@ -0,0 +1,57 @@
+from collections import Counter
+
+import pytest
+
+pytest.importorskip('numpy')
+
+import task_columns
+from reminders_model import QUADRANTS, Reminder, classify, load_tasks, synthetic_corpus
+from task_columns import TaskColumns, write_columns
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture(scope='module')
+def corpus(tmp_path_factory):
+    reminders = synthetic_corpus(3000, now=NOW)
+    directory = tmp_path_factory.mktemp('cols')
+    write_columns(str(directory), reminders)
+    return reminders, TaskColumns(str(directory))
+
+
+def test_quadrant_counts_match_load_tasks(corpus):
+    reminders, columns = corpus
+    open_tasks = [t for t in load_tasks(reminders, NOW) if not t.is_completed]
+    expected = Counter(t.quadrant for t in open_tasks)
+    counts = columns.quadrant_counts(include_completed=False)
+    assert {q: counts[q] for q in QUADRANTS} == {q: expected.get(q, 0) for q in QUADRANTS}
+    unclassified = sum(1 for r in reminders if not r.is_completed and classify(r) is None)
+    assert counts['unclassified'] == unclassified
+    assert sum(columns.quadrant_counts().values()) == len(reminders) == columns.rows
+
+
+@pytest.mark.parametrize('quadrant', [None] + QUADRANTS)
+def test_old_tasks_match_load_tasks(corpus, quadrant):
+    reminders, columns = corpus
+    cutoff = NOW - 14 * 86400
+    expected = [t.id for t in load_tasks(reminders, NOW)
+                if not t.is_completed and t.last_modified < cutoff
+                and (quadrant is None or t.quadrant == quadrant)]
+    rows = columns.old_tasks(14, NOW, quadrant)
+    assert [columns.id(int(row)) for row in rows] == expected
+    assert columns.count_old_tasks(14, NOW, quadrant) == len(expected)
+
+
+def test_rows_round_trip(corpus):
+    reminders, columns = corpus
+    for row in (0, 1, len(reminders) - 1):
+        assert columns.id(row) == reminders[row].id
+        assert columns.title(row) == reminders[row].title
+        assert columns.calendars[columns.calendar[row]] == reminders[row].calendar
+
+
+def test_too_many_calendars(tmp_path, monkeypatch):
+    monkeypatch.setattr(task_columns, 'MAX_CALENDARS', 3)
+    reminders = [Reminder(id=str(i), calendar=f"List {i}") for i in range(4)]
+    with pytest.raises(ValueError, match='calendars'):
+        write_columns(str(tmp_path), reminders)
@@ -0,0 +1,70 @@
+import io
+import math
+from dataclasses import replace
+
+import pytest
+
+from reminders_model import Reminder, synthetic_corpus
+from vtodo import format_datetime, iter_vtodos, write_vtodos
+
+EDGE_CASES = [
+    Reminder(id='edge-1', title='Call Ana, then Bo; bring the\\ notes', notes='line one\nline two #today',
+             calendar='Work', last_modified=1_700_000_000, creation_date=1_699_000_000,
+             due_date=1_700_086_400),
+    Reminder(id='edge-2', title='Ünïcödé ' + 'é' * 80, notes='#Do', calendar='Work',
+             last_modified=1_700_000_001, completion_date=1_700_000_001, is_completed=True),
+    Reminder(id='edge-3', title='BEGIN:VTODO in a title', calendar='', last_modified=1_700_000_002),
+]
+
+
+def _to_seconds(reminder):
+    """iCalendar DATE-TIME values carry whole seconds"""
+    dates = {}
+    for name in ('last_modified', 'creation_date', 'completion_date', 'due_date'):
+        value = getattr(reminder, name)
+        if value is not None:
+            dates[name] = math.floor(value)
+    return replace(reminder, **dates)
+
+
+def _round_trip(items, chunk_size=1 << 20, now=None):
+    out = io.BytesIO()
+    assert write_vtodos(out, items, now=now) == len(items)
+    out.seek(0)
+    return list(iter_vtodos(out, chunk_size))
+
+
+@pytest.mark.parametrize('chunk_size', [64, 1000, 1 << 20])
+def test_round_trip(chunk_size):
+    items = EDGE_CASES + synthetic_corpus(300, now=1_700_000_000)
+    expected = [_to_seconds(r) for r in items]
+    assert _round_trip(items, chunk_size) == expected
+
+
+def _vtodos(items, now):
+    out = io.BytesIO()
+    write_vtodos(out, items, now=now)
+    return out.getvalue().decode('utf-8').split('BEGIN:VTODO')[1:]
+
+
+def test_every_vtodo_has_a_dtstamp():
+    now = 1_700_000_123
+    items = [Reminder(id='no-stamp', title='Undated'), EDGE_CASES[0]]
+    for block in _vtodos(items, now):
+        assert block.count('\r\nDTSTAMP:') == 1
+    assert f"DTSTAMP:{format_datetime(now)}" in _vtodos(items, now)[0]
+    assert 'LAST-MODIFIED' not in _vtodos(items, now)[0]
+
+
+def test_round_trip_without_last_modified():
+    now = 1_700_000_123
+    item = Reminder(id='no-stamp', title='Undated', notes='#Schedule', calendar='Home')
+    assert _round_trip([item], now=now) == [replace(item, last_modified=now)]
+
+
+def test_carriage_returns_stay_inside_the_content_line():
+    item = Reminder(id='cr', title='one\rtwo', notes='a\r\nb\rc', last_modified=1_700_000_000)
+    block = _vtodos([item], 0)[0]
+    assert 'SUMMARY:one\\ntwo\r\n' in block
+    assert 'DESCRIPTION:a\\nb\\nc\r\n' in block
+    assert _round_trip([item]) == [replace(item, title='one\ntwo', notes='a\nb\nc')]